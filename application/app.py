@@ -5,6 +5,8 @@ from typing import Callable, Dict, Optional
 from quart import Quart, Response
 from quart_schema import QuartSchema, ResponseSchemaValidationError, hide
 
+from common.entity.entity_casting import get_entity_class_index
+from common.entity.model_registry import get_model_registry
 from common.exception.exception_handler import (
     register_error_handlers as _register_error_handlers,
 )
@@ -82,6 +84,10 @@ async def startup() -> None:
     initialize_services(config)
     logger.info("All services initialized successfully at startup")
 
+    # Discover entity classes once, before the first calc request needs them
+    get_model_registry()
+    get_entity_class_index()
+
     # Get the gRPC client and start the stream
     grpc_client = get_grpc_client()
 
@@ -50,6 +50,81 @@ PROJECT_DIR = os.getenv("PROJECT_DIR", os.path.expanduser("~/cyoda_projects"))
 CHAT_REPOSITORY = os.getenv("CHAT_REPOSITORY", "cyoda")
 IMPORT_WORKFLOWS = bool(os.getenv("IMPORT_WORKFLOWS", "true"))
 
+# gRPC outbox tuning: a batch size of 1 keeps one-by-one delivery
+GRPC_OUTBOX_BATCH_SIZE = int(os.getenv("GRPC_OUTBOX_BATCH_SIZE", "1"))
+GRPC_OUTBOX_FLUSH_INTERVAL_MS = float(os.getenv("GRPC_OUTBOX_FLUSH_INTERVAL_MS", "0"))
+# Calc requests larger than this build their response in a worker thread
+GRPC_RESPONSE_OFFLOAD_BYTES = int(os.getenv("GRPC_RESPONSE_OFFLOAD_BYTES", "262144"))
+# Entity data in successful calc responses: full, exclude_defaults or changes
+# (changes requires a platform that merges partial payloads)
+CALC_RESPONSE_PAYLOAD_MODE = os.getenv("CALC_RESPONSE_PAYLOAD_MODE", "full")
+# Entities per page read from Cyoda and per chunk written by streaming exports
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "500"))
+# Items per write chunk and updates/transitions in flight for bulk endpoints
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "100"))
+BULK_MAX_CONCURRENCY = int(os.getenv("BULK_MAX_CONCURRENCY", "8"))
+# Share one repository read between identical concurrent entity reads/searches
+ENTITY_READ_COALESCING = os.getenv("ENTITY_READ_COALESCING", "true").lower() != "false"
+# Point-in-time reads older than the safety margin are cached, up to this many
+# entities in total (0 disables the cache)
+TEMPORAL_CACHE_MAX_ENTITIES = int(os.getenv("TEMPORAL_CACHE_MAX_ENTITIES", "10000"))
+TEMPORAL_CACHE_SAFETY_MARGIN_SECONDS = float(
+    os.getenv("TEMPORAL_CACHE_SAFETY_MARGIN_SECONDS", "300")
+)
+# Sorted search results kept for their pagination cursors, so following pages
+# are sliced locally: up to this many entities in total (0 disables), each for
+# this many seconds
+SEARCH_SNAPSHOT_MAX_ENTITIES = int(os.getenv("SEARCH_SNAPSHOT_MAX_ENTITIES", "50000"))
+SEARCH_SNAPSHOT_TTL_SECONDS = float(os.getenv("SEARCH_SNAPSHOT_TTL_SECONDS", "600"))
+# Cache-Control for GET routes with ETags unless the route sets its own policy
+# (no-cache: clients keep a copy but revalidate it with If-None-Match)
+HTTP_CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "no-cache")
+# Default deadline for a processor/criteria run when neither the request nor the
+# processor sets one (0 disables the deadline)
+PROCESSOR_DEFAULT_TIMEOUT_SECONDS = float(
+    os.getenv("PROCESSOR_DEFAULT_TIMEOUT_SECONDS", "60")
+)
+# Processor manifest built with `python -m common.processor.manifest`; when set,
+# processors are imported on first use instead of discovered at startup
+PROCESSOR_MANIFEST = os.getenv("PROCESSOR_MANIFEST", "")
+# Window for grouping concurrent calc requests into one process_batch call for
+# processors that implement it (0 disables micro-batching)
+PROCESSOR_BATCH_WINDOW_MS = float(os.getenv("PROCESSOR_BATCH_WINDOW_MS", "0"))
+PROCESSOR_MAX_BATCH_SIZE = int(os.getenv("PROCESSOR_MAX_BATCH_SIZE", "32"))
+# Per-processor circuit breaker: opens when the failed (or slow) share of the
+# last PROCESSOR_CIRCUIT_WINDOW_SIZE calls reaches the threshold, then fails
+# calls fast for PROCESSOR_CIRCUIT_OPEN_SECONDS (0 thresholds disable it)
+PROCESSOR_CIRCUIT_FAILURE_RATE = float(os.getenv("PROCESSOR_CIRCUIT_FAILURE_RATE", "0"))
+PROCESSOR_CIRCUIT_SLOW_CALL_SECONDS = float(
+    os.getenv("PROCESSOR_CIRCUIT_SLOW_CALL_SECONDS", "0")
+)
+PROCESSOR_CIRCUIT_WINDOW_SIZE = int(os.getenv("PROCESSOR_CIRCUIT_WINDOW_SIZE", "20"))
+PROCESSOR_CIRCUIT_MIN_CALLS = int(os.getenv("PROCESSOR_CIRCUIT_MIN_CALLS", "10"))
+PROCESSOR_CIRCUIT_OPEN_SECONDS = float(
+    os.getenv("PROCESSOR_CIRCUIT_OPEN_SECONDS", "30")
+)
+# Bulkhead: maximum concurrent calls per processor (0 is unlimited)
+PROCESSOR_MAX_CONCURRENCY = int(os.getenv("PROCESSOR_MAX_CONCURRENCY", "0"))
+# Comma-separated declarative criteria rule files/directories (missing ones are
+# skipped); edited files are recompiled at most every RELOAD_SECONDS. The
+# defaults are resolved against the project root, not the working directory
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+PROCESSOR_CRITERIA_PATHS = os.getenv(
+    "PROCESSOR_CRITERIA_PATHS",
+    ",".join(
+        os.path.join(_PROJECT_ROOT, path)
+        for path in (
+            "application/criterion/rules",
+            "example_application/criterion/rules",
+        )
+    ),
+)
+PROCESSOR_CRITERIA_RELOAD_SECONDS = float(
+    os.getenv("PROCESSOR_CRITERIA_RELOAD_SECONDS", "2")
+)
+
 # Constants
 CYODA_ENTITY_TYPE_EDGE_MESSAGE = "EDGE_MESSAGE"
 GENERAL_MEMORY_TAG = "general"
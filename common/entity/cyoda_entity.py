@@ -4,12 +4,78 @@ Provides common fields and methods for entity management.
 """
 
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Iterator, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class _DeferredValidationContext:
+    """State shared by all entities touched inside one deferred validation block."""
+
+    __slots__ = ("timestamp", "pending")
+
+    def __init__(self) -> None:
+        self.timestamp: Optional[str] = None
+        # Entities with deferred assignments, keyed by id() (models are unhashable)
+        self.pending: Dict[int, "CyodaEntity"] = {}
+
+
+_deferred_validation: ContextVar[Optional[_DeferredValidationContext]] = ContextVar(
+    "cyoda_entity_deferred_validation", default=None
+)
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+@contextmanager
+def deferred_validation() -> Iterator[None]:
+    """
+    Defer assignment validation for opted-in entities within the current context.
+
+    Field assignments on entity classes with ``DEFER_VALIDATION`` are stored
+    without validation inside the block, and ``update_timestamp`` reuses a
+    single timestamp. When the block exits normally, every entity that got a
+    deferred assignment and was not validated since is validated once.
+
+    Raises:
+        pydantic.ValidationError: If a deferred entity is invalid on exit
+    """
+    context = _DeferredValidationContext()
+    token = _deferred_validation.set(context)
+    try:
+        yield
+    finally:
+        _deferred_validation.reset(token)
+    for entity in list(context.pending.values()):
+        entity.validate_deferred()
+
+
+def is_validation_deferred() -> bool:
+    """Return True inside a ``deferred_validation()`` block."""
+    return _deferred_validation.get() is not None
+
+
+def _deferring_setattr(self: "CyodaEntity", name: str, value: Any) -> None:
+    """``__setattr__`` of entity classes opting in to deferred validation."""
+    context = _deferred_validation.get()
+    if (
+        context is None
+        or not self.DEFER_VALIDATION
+        or name not in type(self).model_fields
+    ):
+        BaseModel.__setattr__(self, name, value)
+        return
+    # Deferred: store as-is, checked when the block exits
+    self.__dict__[name] = value
+    self.__pydantic_fields_set__.add(name)
+    context.pending[id(self)] = self
+
+
 class CyodaEntity(BaseModel):
     """
     Base class for all Cyoda entities.
@@ -45,6 +111,10 @@ class CyodaEntity(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
+    # Opt-in performance profile: inside deferred_validation() blocks, skip
+    # per-assignment validation for this class and validate once on exit
+    DEFER_VALIDATION: ClassVar[bool] = False
+
     model_config = ConfigDict(
         # Allow extra fields for flexibility
         extra="allow",
@@ -56,9 +126,40 @@ class CyodaEntity(BaseModel):
         populate_by_name=True,
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Only opted-in classes pay for the assignment hook
+        if cls.DEFER_VALIDATION:
+            setattr(cls, "__setattr__", _deferring_setattr)
+
+    def validate_deferred(self) -> None:
+        """
+        Validate the whole entity in place after deferred assignments.
+
+        Raises:
+            pydantic.ValidationError: If the current field values are invalid
+        """
+        context = _deferred_validation.get()
+        if context is not None:
+            context.pending.pop(id(self), None)
+        fields_set = set(self.__pydantic_fields_set__)
+        data = dict(self.__dict__)
+        if self.__pydantic_extra__:
+            data.update(self.__pydantic_extra__)
+        self.__pydantic_validator__.validate_python(data, self_instance=self)
+        object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp to current time"""
-        self.updated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        context = _deferred_validation.get()
+        if context is None:
+            self.updated_at = _utc_now_iso()
+            return
+        # One timestamp per deferred block instead of one per mutation
+        if context.timestamp is None:
+            context.timestamp = _utc_now_iso()
+        self.updated_at = context.timestamp
 
     def set_state(self, new_state: str) -> None:
         """Update entity state and timestamp"""
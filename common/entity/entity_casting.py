@@ -6,11 +6,14 @@ to specific entity types at runtime, enabling type-safe operations without
 requiring upfront registration or configuration.
 """
 
+import functools
 import importlib
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar, cast
+import pkgutil
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, cast
 
 from common.entity.cyoda_entity import CyodaEntity
+from common.entity.model_registry import DEFAULT_ENTITY_PACKAGES
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +89,10 @@ def dynamic_import_entity_class(
     """
     Dynamically import an entity class by name from a list of possible module paths.
 
+    Results are memoized per (entity_name, module_paths), including misses, so
+    repeated lookups skip the imports; call ``clear_entity_class_cache`` after
+    loading new entity modules.
+
     Args:
         entity_name: The name of the entity class to import
         module_paths: List of module paths to search for the entity class
@@ -93,6 +100,13 @@ def dynamic_import_entity_class(
     Returns:
         The entity class if found, None otherwise
     """
+    return _resolve_entity_class(entity_name, tuple(module_paths))
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_entity_class(
+    entity_name: str, module_paths: Tuple[str, ...]
+) -> Optional[Type[CyodaEntity]]:
     for module_path in module_paths:
         try:
             # Try to import the module
@@ -121,6 +135,68 @@ def dynamic_import_entity_class(
     return None
 
 
+def get_entity_class_index(
+    search_modules: Optional[list[str]] = None,
+) -> Dict[str, Type[CyodaEntity]]:
+    """
+    Get the name to class index for entity classes in the given modules.
+
+    Packages are scanned with all their submodules. Each class is indexed by its
+    lowercased class name and ``ENTITY_NAME``. The index is built once per module
+    list; call ``get_entity_class_index()`` at startup to pay the import cost early.
+
+    Args:
+        search_modules: Module paths to scan, defaults to the entity packages
+
+    Returns:
+        Mapping of lowercased entity names to entity classes
+    """
+    return _build_entity_class_index(tuple(search_modules or DEFAULT_ENTITY_PACKAGES))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_entity_class_index(
+    module_paths: Tuple[str, ...],
+) -> Dict[str, Type[CyodaEntity]]:
+    index: Dict[str, Type[CyodaEntity]] = {}
+
+    def add_module(module: Any) -> None:
+        for attr in vars(module).values():
+            if (
+                isinstance(attr, type)
+                and issubclass(attr, CyodaEntity)
+                and attr is not CyodaEntity
+            ):
+                index.setdefault(attr.__name__.lower(), attr)
+                entity_name = getattr(attr, "ENTITY_NAME", None)
+                if entity_name:
+                    index.setdefault(str(entity_name).lower(), attr)
+
+    for module_path in module_paths:
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError as e:
+            logger.debug(f"Could not import {module_path}: {e}")
+            continue
+        add_module(module)
+        for _importer, modname, _ispkg in pkgutil.walk_packages(
+            getattr(module, "__path__", []), module_path + "."
+        ):
+            try:
+                add_module(importlib.import_module(modname))
+            except Exception as e:
+                logger.debug(f"Could not import {modname}: {e}")
+
+    logger.debug(f"Built entity class index with {len(index)} names")
+    return index
+
+
+def clear_entity_class_cache() -> None:
+    """Drop memoized class lookups and indexes (e.g. after loading new modules)."""
+    _resolve_entity_class.cache_clear()
+    _build_entity_class_index.cache_clear()
+
+
 def smart_cast_entity(
     entity: CyodaEntity,
     entity_type_hint: str,
@@ -140,33 +216,15 @@ def smart_cast_entity(
     Returns:
         The cast entity, or the original entity if casting is not possible
     """
-    if search_modules is None:
-        # Default search paths for entity classes
-        search_modules = [
-            "application.entity",
-            "application.entity",
-            "example_application.entity",
-            "example_application.entity",
-        ]
-
-    # Generate possible class names from the hint
-    possible_class_names = [
-        entity_type_hint,
-        entity_type_hint.capitalize(),
-        entity_type_hint.title(),
-        f"{entity_type_hint.capitalize()}Entity",
-        f"{entity_type_hint.title()}Entity",
-    ]
-
-    # Try to find and import the entity class
-    for class_name in possible_class_names:
-        entity_class = dynamic_import_entity_class(class_name, search_modules)
-        if entity_class:
-            try:
-                return cast_entity(entity, entity_class)
-            except Exception as e:
-                logger.debug(f"Failed to cast to {class_name}: {e}")
-                continue
+    # Resolve through the precomputed index instead of importing per call
+    index = get_entity_class_index(search_modules)
+    hint = entity_type_hint.lower()
+    entity_class = index.get(hint) or index.get(f"{hint}entity")
+    if entity_class:
+        try:
+            return cast_entity(entity, entity_class)
+        except Exception as e:
+            logger.debug(f"Failed to cast to {entity_class.__name__}: {e}")
 
     # If no specific type found, return the original entity
     logger.debug(
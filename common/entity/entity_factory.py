@@ -2,14 +2,18 @@
 Dynamic Entity Factory for Cyoda entities.
 
 This module provides a simple, configuration-free approach to entity creation.
-All entities are created as CyodaEntity instances, and specific typing is handled
-at the implementation level through dynamic casting.
+``create_entity`` always builds generic CyodaEntity instances, with specific typing
+handled at the implementation level through dynamic casting. ``create_typed_entity``
+validates directly into the registered entity class for a model key instead.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from pydantic import ValidationError
 
 from common.entity.cyoda_entity import CyodaEntity
+from common.entity.model_registry import EntityModelRegistry, get_model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -40,3 +44,41 @@ def create_entity(entity_type: str, data: Dict[str, Any]) -> CyodaEntity:
     except Exception as e:
         logger.error(f"Failed to create entity of type '{entity_type}': {e}")
         raise ValueError(f"Failed to create entity of type '{entity_type}': {e}") from e
+
+
+def create_typed_entity(
+    model_name: str,
+    data: Dict[str, Any],
+    version: Optional[int] = None,
+    registry: Optional[EntityModelRegistry] = None,
+) -> CyodaEntity:
+    """
+    Create an entity validated directly into its registered class.
+
+    The payload is validated once into the class registered for the model key,
+    so processors receive the concrete type and ``cast_entity`` becomes a no-op.
+    Unknown models, and payloads the typed class rejects, fall back to a
+    generic CyodaEntity as built by ``create_entity``.
+
+    Args:
+        model_name: Model name from the request's ``modelKey.name``
+        data: The data to initialize the entity with
+        version: Model version from ``modelKey.version``
+        registry: Model registry to use, defaults to the global registry
+
+    Returns:
+        An instance of the registered entity class, or a generic CyodaEntity
+
+    Raises:
+        ValueError: If entity creation fails
+    """
+    model_cls = (registry or get_model_registry()).get(model_name, version)
+    if model_cls is not None:
+        try:
+            return model_cls.model_validate(data)
+        except ValidationError as e:
+            logger.warning(
+                f"Payload does not validate as {model_cls.__name__}, "
+                f"using generic CyodaEntity: {e.error_count()} error(s)"
+            )
+    return create_entity(model_name, data)
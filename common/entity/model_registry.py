@@ -0,0 +1,160 @@
+"""
+Entity model registry for typed entity construction.
+
+Maps Cyoda model keys (``modelKey.name`` and ``modelKey.version``) to the
+concrete CyodaEntity subclasses declared in the application entity packages,
+so incoming payloads can be validated once, directly into the right class,
+instead of being built as a generic CyodaEntity and cast later.
+"""
+
+import importlib
+import inspect
+import logging
+import pkgutil
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple, Type
+
+from common.entity.cyoda_entity import CyodaEntity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENTITY_PACKAGES = [
+    "application.entity",
+    "example_application.entity",
+]
+
+
+class EntityModelRegistry:
+    """
+    Registry of entity classes keyed by model name and version.
+
+    Entity classes are discovered from packages by their ``ENTITY_NAME`` and
+    ``ENTITY_VERSION`` class constants. Names are matched case-insensitively.
+    """
+
+    def __init__(self, packages: Optional[List[str]] = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            packages: Package names scanned for entity classes
+        """
+        self.packages: List[str] = packages or []
+        self._models: Dict[Tuple[str, int], Type[CyodaEntity]] = {}
+        # Highest registered version per name, used when no version is given
+        self._latest: Dict[str, Tuple[int, Type[CyodaEntity]]] = {}
+
+        for package_name in self.packages:
+            self._discover_from_package(package_name)
+
+    def _discover_from_package(self, package_name: str) -> None:
+        """
+        Register entity classes from a package and all its submodules.
+
+        Args:
+            package_name: Name of the package to scan
+        """
+        try:
+            package = importlib.import_module(package_name)
+        except ImportError as e:
+            logger.warning(f"Could not import entity package '{package_name}': {e}")
+            return
+
+        self._discover_from_module(package)
+        for _importer, modname, _ispkg in pkgutil.walk_packages(
+            getattr(package, "__path__", []), package_name + "."
+        ):
+            try:
+                self._discover_from_module(importlib.import_module(modname))
+            except Exception as e:
+                logger.warning(f"Failed to import entity module '{modname}': {e}")
+
+    def _discover_from_module(self, module: ModuleType) -> None:
+        """
+        Register entity classes defined in a single module.
+
+        Args:
+            module: The module to scan
+        """
+        for _name, obj in inspect.getmembers(module, inspect.isclass):
+            if getattr(obj, "__module__", None) != module.__name__:
+                continue
+            if (
+                issubclass(obj, CyodaEntity)
+                and obj is not CyodaEntity
+                and "ENTITY_NAME" in vars(obj)
+            ):
+                self.register(obj)
+
+    def register(
+        self, model_cls: Type[CyodaEntity], version: Optional[int] = None
+    ) -> None:
+        """
+        Register an entity class.
+
+        Args:
+            model_cls: Entity class declaring an ``ENTITY_NAME`` constant
+            version: Model version, defaults to the class ``ENTITY_VERSION`` (or 1)
+        """
+        name = getattr(model_cls, "ENTITY_NAME", model_cls.__name__).lower()
+        if version is None:
+            version = int(getattr(model_cls, "ENTITY_VERSION", 1))
+
+        self._models[(name, version)] = model_cls
+        latest = self._latest.get(name)
+        if latest is None or version >= latest[0]:
+            self._latest[name] = (version, model_cls)
+        logger.debug(f"Registered entity model: {name} v{version} ({model_cls})")
+
+    def get(
+        self, name: str, version: Optional[int] = None
+    ) -> Optional[Type[CyodaEntity]]:
+        """
+        Look up the entity class for a model key.
+
+        Args:
+            name: Model name (case-insensitive)
+            version: Model version; the latest registered version is used when
+                None or when the exact version is not registered
+
+        Returns:
+            The entity class, or None if the model is unknown
+        """
+        key = name.lower()
+        if version is not None:
+            model_cls = self._models.get((key, version))
+            if model_cls is not None:
+                return model_cls
+        latest = self._latest.get(key)
+        return latest[1] if latest else None
+
+    def list_models(self) -> List[Tuple[str, int]]:
+        """List registered (name, version) model keys."""
+        return sorted(self._models)
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# Global model registry instance
+_model_registry: Optional[EntityModelRegistry] = None
+
+
+def get_model_registry(packages: Optional[List[str]] = None) -> EntityModelRegistry:
+    """
+    Get the global entity model registry, discovering models on first use.
+
+    Args:
+        packages: Entity packages to scan. If None and no global instance
+                exists, uses the default application packages.
+
+    Returns:
+        The global model registry instance
+    """
+    global _model_registry
+
+    if _model_registry is None:
+        _model_registry = EntityModelRegistry(packages or DEFAULT_ENTITY_PACKAGES)
+        logger.info(f"Discovered {len(_model_registry)} entity models")
+
+    return _model_registry
@@ -15,6 +15,8 @@ from common.exception.grpc_exceptions import (
     GrpcClientError,
     HandlerError,
     ProcessingError,
+    ProcessingTimeoutError,
+    ProcessingUnavailableError,
     ValidationError,
     handle_error,
     is_not_found,
@@ -28,6 +30,8 @@ __all__ = [
     # gRPC exceptions
     "GrpcClientError",
     "ProcessingError",
+    "ProcessingTimeoutError",
+    "ProcessingUnavailableError",
     "HandlerError",
     "ConnectionError",
     "AuthenticationError",
@@ -30,6 +30,17 @@ class ErrorCategory(Enum):
     SYSTEM = "system"
 
 
+# Suggested delay before a failed calculation is retried, by error category
+RETRY_DELAY_MS_BY_CATEGORY: Dict[ErrorCategory, int] = {
+    ErrorCategory.NETWORK: 5000,
+    ErrorCategory.AUTHENTICATION: 10000,
+    ErrorCategory.VALIDATION: 1000,
+    ErrorCategory.PROCESSING: 1000,
+    ErrorCategory.CONFIGURATION: 10000,
+    ErrorCategory.SYSTEM: 2000,
+}
+
+
 class GrpcClientError(Exception):
     """Base exception for all gRPC client related errors."""
 
@@ -64,6 +75,24 @@ class GrpcClientError(Exception):
             "original_error": str(self.original_error) if self.original_error else None,
         }
 
+    @property
+    def retry_delay_ms(self) -> Optional[int]:
+        """Suggested retry delay in milliseconds, None if the error is not retryable."""
+        if not self.recoverable:
+            return None
+        return RETRY_DELAY_MS_BY_CATEGORY.get(self.category)
+
+    def to_response_error(self) -> Dict[str, Any]:
+        """Convert error to the ``error`` object of a calc failure response."""
+        error: Dict[str, Any] = {
+            "code": self.error_code,
+            "message": self.message,
+            "retryable": self.recoverable,
+        }
+        if self.retry_delay_ms is not None:
+            error["retryDelayMs"] = self.retry_delay_ms
+        return error
+
 
 class ProcessingError(GrpcClientError):
     """Error during entity processing."""
@@ -88,6 +117,72 @@ class ProcessingError(GrpcClientError):
         self.entity_id = entity_id
 
 
+class ProcessingTimeoutError(GrpcClientError):
+    """Entity processing did not finish before its deadline."""
+
+    def __init__(
+        self,
+        processor_name: str,
+        entity_id: str,
+        timeout: float,
+        original_error: Optional[Exception] = None,
+    ):
+        super().__init__(
+            message=f"Processing timed out for '{processor_name}' on entity '{entity_id}' after {timeout:g}s",
+            error_code="PROCESSING_TIMEOUT",
+            category=ErrorCategory.PROCESSING,
+            severity=ErrorSeverity.MEDIUM,
+            context={
+                "processor_name": processor_name,
+                "entity_id": entity_id,
+                "timeout": timeout,
+            },
+            original_error=original_error,
+            recoverable=True,
+        )
+        self.processor_name = processor_name
+        self.entity_id = entity_id
+        self.timeout = timeout
+
+
+class ProcessingUnavailableError(GrpcClientError):
+    """Entity processing was rejected by a circuit breaker or bulkhead."""
+
+    def __init__(
+        self,
+        processor_name: str,
+        entity_id: str,
+        reason: str,
+        retry_after: Optional[float] = None,
+        original_error: Optional[Exception] = None,
+    ):
+        super().__init__(
+            message=f"Processor '{processor_name}' is unavailable ({reason}) for entity '{entity_id}'",
+            error_code="PROCESSOR_UNAVAILABLE",
+            category=ErrorCategory.PROCESSING,
+            severity=ErrorSeverity.MEDIUM,
+            context={
+                "processor_name": processor_name,
+                "entity_id": entity_id,
+                "reason": reason,
+                "retry_after": retry_after,
+            },
+            original_error=original_error,
+            recoverable=True,
+        )
+        self.processor_name = processor_name
+        self.entity_id = entity_id
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_delay_ms(self) -> Optional[int]:
+        """Retry once the circuit starts probing again, if that time is known."""
+        if self.retry_after is not None:
+            return max(1, int(self.retry_after * 1000))
+        return super().retry_delay_ms
+
+
 class HandlerError(GrpcClientError):
     """Error in event handler processing."""
 
@@ -6,6 +6,11 @@ This contains all the complex logic moved out of GrpcClient.
 import types
 from typing import Any
 
+from common.config.config import (
+    CALC_RESPONSE_PAYLOAD_MODE,
+    GRPC_OUTBOX_BATCH_SIZE,
+    GRPC_OUTBOX_FLUSH_INTERVAL_MS,
+)
 from common.grpc_client.constants import (
     CALC_REQ_EVENT_TYPE,
     CALC_RESP_EVENT_TYPE,
@@ -36,6 +41,7 @@ from common.grpc_client.responses.builders import (
     JoinResponseBuilder,
     ResponseBuilderRegistry,
 )
+from common.grpc_client.responses.payload import CalcPayloadMode
 from common.grpc_client.router import EventRouter
 
 
@@ -62,7 +68,10 @@ class GrpcStreamingFacadeFactory:
         router.register(EVENT_ACK_TYPE, AckHandler())
         router.register(GREET_EVENT_TYPE, GreetHandler())
         router.register(ERROR_EVENT_TYPE, ErrorHandler())
-        router.register(CALC_REQ_EVENT_TYPE, CalcRequestHandler())
+        router.register(
+            CALC_REQ_EVENT_TYPE,
+            CalcRequestHandler(CalcPayloadMode(CALC_RESPONSE_PAYLOAD_MODE)),
+        )
         router.register(CRITERIA_CALC_REQ_EVENT_TYPE, CriteriaCalcRequestHandler())
 
         # Create and configure ResponseBuilderRegistry
@@ -73,7 +82,10 @@ class GrpcStreamingFacadeFactory:
         builders.register(CRITERIA_CALC_RESP_EVENT_TYPE, CriteriaCalcResponseBuilder())
 
         # Create Outbox
-        outbox = Outbox()
+        outbox = Outbox(
+            batch_size=GRPC_OUTBOX_BATCH_SIZE,
+            flush_interval=GRPC_OUTBOX_FLUSH_INTERVAL_MS / 1000,
+        )
 
         # Create middleware chain using configuration
         middleware_config = create_default_middleware_config()
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from common.grpc_client.responses.spec import ResponseSpec
 from common.proto.cloudevents_pb2 import CloudEvent
@@ -14,3 +14,18 @@ class Handler:
         self, request: CloudEvent, services: Optional[Any] = None
     ) -> Optional[ResponseSpec]:
         raise NotImplementedError
+
+
+def request_timeout(data: Dict[str, Any]) -> Optional[float]:
+    """
+    Extract the processing deadline carried by a calc request, in seconds.
+
+    The deadline is read from ``responseTimeoutMs`` on the request itself or in
+    its configured ``parameters``; None means the processor default applies.
+    """
+    parameters = data.get("parameters")
+    for source in (data, parameters if isinstance(parameters, dict) else {}):
+        value = source.get("responseTimeoutMs")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value) / 1000
+    return None
@@ -1,22 +1,53 @@
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-from common.entity.entity_factory import create_entity
+from common.entity.entity_factory import create_typed_entity
 from common.exception.grpc_exceptions import (
+    GrpcClientError,
     HandlerError,
     ProcessingError,
+    ProcessingTimeoutError,
+    ProcessingUnavailableError,
     ValidationError,
 )
 from common.grpc_client.constants import CALC_REQ_EVENT_TYPE, CALC_RESP_EVENT_TYPE
-from common.grpc_client.handlers.base import Handler
+from common.grpc_client.handlers.base import Handler, request_timeout
+from common.grpc_client.responses.payload import (
+    CalcPayloadMode,
+    shape_entity_payload,
+)
 from common.grpc_client.responses.spec import ResponseSpec
+from common.processor.errors import ProcessorTimeoutError, ProcessorUnavailableError
 from common.proto.cloudevents_pb2 import CloudEvent
 
 logger = logging.getLogger(__name__)
 
 
 class CalcRequestHandler(Handler):
+    def __init__(self, payload_mode: CalcPayloadMode = CalcPayloadMode.FULL) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            payload_mode: How much entity data successful responses carry
+        """
+        self.payload_mode = payload_mode
+
+    @staticmethod
+    def _failure_response(data: Dict[str, Any], error: GrpcClientError) -> ResponseSpec:
+        """Answer with the unmodified payload so Cyoda can retry the request."""
+        return ResponseSpec(
+            response_type=CALC_RESP_EVENT_TYPE,
+            data={
+                "requestId": data.get("requestId"),
+                "entityId": data.get("entityId"),
+                "payload": data.get("payload"),
+            },
+            success=False,
+            error=error.to_response_error(),
+        )
+
     async def handle(
         self, request: CloudEvent, services: Any = None
     ) -> Optional[ResponseSpec]:
@@ -24,12 +55,14 @@ class CalcRequestHandler(Handler):
         processor_name = data.get("processorName")
 
         # Get entity type from model key
-        model_key = data["payload"]["meta"]["modelKey"]["name"]
-        entity_type = model_key.lower()  # Convert to lowercase for our entity factory
+        model_key = data["payload"]["meta"]["modelKey"]
+        entity_type = model_key["name"].lower()  # Registry lookup is case-insensitive
 
-        # Create entity using our factory system
+        # Validate the payload directly into the registered entity class
         try:
-            entity = create_entity(entity_type, data["payload"]["data"])
+            entity = create_typed_entity(
+                entity_type, data["payload"]["data"], version=model_key.get("version")
+            )
         except ValueError:
             logger.error(f"Unknown entity type: {entity_type}")
             # Fallback: create a generic CyodaEntity
@@ -44,6 +77,8 @@ class CalcRequestHandler(Handler):
                 original_error=e,
             )
 
+        original_data = data["payload"]["data"]
+
         # Set technical_id from gRPC request
         entity.technical_id = data["entityId"]
 
@@ -66,16 +101,49 @@ class CalcRequestHandler(Handler):
                     message="processor_manager not available in services",
                 )
 
+            timeout = request_timeout(data)
+            deadline_kwargs = {"timeout": timeout} if timeout is not None else {}
             entity = await processor_manager.process_entity(
-                processor_name=processor_name, entity=entity
+                processor_name=processor_name, entity=entity, **deadline_kwargs
             )
 
             # Convert entity back to dict for response
-            data["payload"]["data"] = entity.to_dict()
+            data["payload"]["data"] = shape_entity_payload(
+                entity, original_data, self.payload_mode
+            )
             logger.info(
                 f"[PROCESSING] Success {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}"
             )
 
+        except ProcessorTimeoutError as e:
+            logger.warning(
+                f"[PROCESSING] Timeout {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}, Deadline: {e.timeout}s"
+            )
+            return self._failure_response(
+                data,
+                ProcessingTimeoutError(
+                    processor_name=processor_name,
+                    entity_id=data["entityId"],
+                    timeout=e.timeout,
+                    original_error=e,
+                ),
+            )
+
+        except ProcessorUnavailableError as e:
+            logger.warning(
+                f"[PROCESSING] Rejected {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}, Reason: {e.reason}"
+            )
+            return self._failure_response(
+                data,
+                ProcessingUnavailableError(
+                    processor_name=processor_name,
+                    entity_id=data["entityId"],
+                    reason=e.reason,
+                    retry_after=e.retry_after,
+                    original_error=e,
+                ),
+            )
+
         except Exception as e:
             logger.error(
                 f"[PROCESSING] Error {CALC_REQ_EVENT_TYPE} - Processor: {processor_name}, EntityId: {data['entityId']}"
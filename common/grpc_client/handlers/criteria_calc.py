@@ -1,20 +1,40 @@
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-from common.entity.entity_factory import create_entity
+from common.entity.entity_factory import create_typed_entity
+from common.exception.grpc_exceptions import (
+    GrpcClientError,
+    ProcessingTimeoutError,
+    ProcessingUnavailableError,
+)
 from common.grpc_client.constants import (
     CRITERIA_CALC_REQ_EVENT_TYPE,
     CRITERIA_CALC_RESP_EVENT_TYPE,
 )
-from common.grpc_client.handlers.base import Handler
+from common.grpc_client.handlers.base import Handler, request_timeout
 from common.grpc_client.responses.spec import ResponseSpec
+from common.processor.errors import CriteriaTimeoutError, CriteriaUnavailableError
 from common.proto.cloudevents_pb2 import CloudEvent
 
 logger = logging.getLogger(__name__)
 
 
 class CriteriaCalcRequestHandler(Handler):
+    @staticmethod
+    def _failure_response(data: Dict[str, Any], error: GrpcClientError) -> ResponseSpec:
+        """Answer with a non-match marked as failed so Cyoda can retry the request."""
+        return ResponseSpec(
+            response_type=CRITERIA_CALC_RESP_EVENT_TYPE,
+            data={
+                "requestId": data.get("requestId"),
+                "entityId": data.get("entityId"),
+                "matches": False,
+            },
+            success=False,
+            error=error.to_response_error(),
+        )
+
     async def handle(
         self, request: CloudEvent, services: Any = None
     ) -> Optional[ResponseSpec]:
@@ -22,12 +42,14 @@ class CriteriaCalcRequestHandler(Handler):
         criteria_name = data.get("criteriaName")
 
         # Get entity type from model key
-        model_key = data["payload"]["meta"]["modelKey"]["name"]
-        entity_type = model_key.lower()  # Convert to lowercase for our entity factory
+        model_key = data["payload"]["meta"]["modelKey"]
+        entity_type = model_key["name"].lower()  # Registry lookup is case-insensitive
 
-        # Create entity using our factory system
+        # Validate the payload directly into the registered entity class
         try:
-            entity = create_entity(entity_type, data["payload"]["data"])
+            entity = create_typed_entity(
+                entity_type, data["payload"]["data"], version=model_key.get("version")
+            )
         except ValueError:
             logger.error(f"Unknown entity type: {entity_type}")
             # Fallback: create a generic CyodaEntity
@@ -53,8 +75,10 @@ class CriteriaCalcRequestHandler(Handler):
             if not processor_manager:
                 raise ValueError("processor_manager not available in services")
 
+            timeout = request_timeout(data)
+            deadline_kwargs = {"timeout": timeout} if timeout is not None else {}
             matches = await processor_manager.check_criteria(
-                criteria_name=criteria_name, entity=entity
+                criteria_name=criteria_name, entity=entity, **deadline_kwargs
             )
 
             # Convert entity back to dict for response (criteria checking might modify entity)
@@ -63,6 +87,35 @@ class CriteriaCalcRequestHandler(Handler):
                 f"[PROCESSING] Success {CRITERIA_CALC_REQ_EVENT_TYPE} - Criteria: {criteria_name}, EntityId: {data['entityId']}"
             )
 
+        except CriteriaTimeoutError as e:
+            logger.warning(
+                f"[PROCESSING] Timeout {CRITERIA_CALC_REQ_EVENT_TYPE} - Criteria: {criteria_name}, EntityId: {data['entityId']}, Deadline: {e.timeout}s"
+            )
+            return self._failure_response(
+                data,
+                ProcessingTimeoutError(
+                    processor_name=criteria_name,
+                    entity_id=data["entityId"],
+                    timeout=e.timeout,
+                    original_error=e,
+                ),
+            )
+
+        except CriteriaUnavailableError as e:
+            logger.warning(
+                f"[PROCESSING] Rejected {CRITERIA_CALC_REQ_EVENT_TYPE} - Criteria: {criteria_name}, EntityId: {data['entityId']}, Reason: {e.reason}"
+            )
+            return self._failure_response(
+                data,
+                ProcessingUnavailableError(
+                    processor_name=criteria_name,
+                    entity_id=data["entityId"],
+                    reason=e.reason,
+                    retry_after=e.retry_after,
+                    original_error=e,
+                ),
+            )
+
         except Exception as e:
             logger.error(
                 f"[PROCESSING] Error {CRITERIA_CALC_REQ_EVENT_TYPE} - Criteria: {criteria_name}, EntityId: {data['entityId']}"
@@ -0,0 +1,152 @@
+"""
+Idempotency cache for calculation requests.
+
+Cyoda may redeliver the same calc request (same ``requestId``) after a stream
+reconnect. This cache replays the previously built response instead of running
+the processor again, and coalesces duplicates that arrive while the first
+request is still being processed.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from common.proto.cloudevents_pb2 import CloudEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class IdempotencyCache:
+    """Bounded, TTL-based cache of built responses keyed by request id."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a completed response is replayed for
+            max_entries: Maximum number of completed responses kept (LRU eviction)
+            clock: Monotonic clock, injectable for tests
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._completed: "OrderedDict[str, Tuple[float, Optional[CloudEvent]]]" = (
+            OrderedDict()
+        )
+        self._in_flight: Dict[str, "asyncio.Future[Optional[CloudEvent]]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[CloudEvent]]:
+        """Return (found, response) for a completed, non-expired entry."""
+        entry = self._completed.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, response = entry
+        if expires_at <= self._clock():
+            del self._completed[key]
+            return False, None
+
+        self._completed.move_to_end(key)
+        return True, response
+
+    def _store(self, key: str, response: Optional[CloudEvent]) -> None:
+        self._completed[key] = (self._clock() + self.ttl_seconds, response)
+        self._completed.move_to_end(key)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Optional[CloudEvent]]],
+        cacheable: Optional[Callable[[Optional[CloudEvent]], bool]] = None,
+    ) -> Optional[CloudEvent]:
+        """
+        Return the cached response for ``key`` or compute it exactly once.
+
+        Concurrent callers with the same key wait for the first computation.
+        Failures are not cached: waiters receive the same exception and a
+        later redelivery is processed again.
+
+        Args:
+            key: Idempotency key (typically derived from the request id)
+            compute: Coroutine factory producing the response
+            cacheable: Predicate deciding whether a computed response is kept
+                for replay (e.g. retryable failure responses are not)
+
+        Returns:
+            The (possibly replayed) response
+        """
+        found, response = self._lookup(key)
+        if found:
+            self.hits += 1
+            logger.info(f"Replaying cached response for duplicate request {key}")
+            return response
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            logger.info(f"Coalescing duplicate in-flight request {key}")
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: "asyncio.Future[Optional[CloudEvent]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            response = await compute()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark as retrieved so lone failures don't log "never retrieved"
+                future.exception()
+            raise
+        else:
+            if cacheable is None or cacheable(response):
+                self._store(key, response)
+            future.set_result(response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a completed entry so the next delivery is processed again."""
+        self._completed.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all completed entries."""
+        self._completed.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "size": len(self._completed),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+        }
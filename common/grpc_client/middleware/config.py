@@ -10,6 +10,13 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from common.config.config import GRPC_RESPONSE_OFFLOAD_BYTES
+from common.grpc_client.idempotency import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    IdempotencyCache,
+)
+
 from .base import MiddlewareLink
 from .dispatch import DispatchMiddleware
 from .error import ErrorMiddleware
@@ -126,7 +133,11 @@ class MiddlewareRegistry:
         self, config: Dict[str, Any], **kwargs: Any
     ) -> ErrorMiddleware:
         """Create error middleware with configuration."""
-        return ErrorMiddleware()
+        if not config.get("failure_responses_enabled", True):
+            return ErrorMiddleware()
+        return ErrorMiddleware(
+            builders=kwargs.get("builders"), outbox=kwargs.get("outbox")
+        )
 
     def _create_dispatch_middleware(
         self, config: Dict[str, Any], **kwargs: Any
@@ -149,12 +160,24 @@ class MiddlewareRegistry:
         if not all([router, builders, outbox]):
             raise ValueError("DispatchMiddleware requires router, builders, and outbox")
 
+        # Replay responses for redelivered calc requests unless disabled
+        idempotency_cache: Optional[IdempotencyCache] = None
+        if config.get("idempotency_enabled", True):
+            idempotency_cache = IdempotencyCache(
+                ttl_seconds=config.get("idempotency_ttl_seconds", DEFAULT_TTL_SECONDS),
+                max_entries=config.get("idempotency_max_entries", DEFAULT_MAX_ENTRIES),
+            )
+
         # Cast to proper types after validation
         return DispatchMiddleware(
             router=router,  # type: ignore[arg-type]
             builders=builders,  # type: ignore[arg-type]
             outbox=outbox,  # type: ignore[arg-type]
             services=services,
+            idempotency_cache=idempotency_cache,
+            offload_threshold_bytes=config.get(
+                "offload_threshold_bytes", GRPC_RESPONSE_OFFLOAD_BYTES
+            ),
         )
 
 
@@ -1,17 +1,27 @@
+import asyncio
 import json
 import logging
-from typing import Any
+from typing import Any, Dict, Optional, Set
 
-from common.grpc_client.constants import EVENT_ACK_TYPE
+from common.grpc_client.constants import (
+    CALC_REQ_EVENT_TYPE,
+    CRITERIA_CALC_REQ_EVENT_TYPE,
+    EVENT_ACK_TYPE,
+)
+from common.grpc_client.idempotency import IdempotencyCache
 from common.grpc_client.middleware.base import MiddlewareLink
 from common.grpc_client.outbox import Outbox
 from common.grpc_client.responses.builders import ResponseBuilderRegistry
+from common.grpc_client.responses.payload import PayloadSizeStats
 from common.grpc_client.responses.spec import ResponseSpec
 from common.grpc_client.router import EventRouter
 from common.proto.cloudevents_pb2 import CloudEvent
 
 logger = logging.getLogger(__name__)
 
+# Event types whose responses are replayed for duplicate request ids
+IDEMPOTENT_EVENT_TYPES = (CALC_REQ_EVENT_TYPE, CRITERIA_CALC_REQ_EVENT_TYPE)
+
 
 class DispatchMiddleware(MiddlewareLink):
     def __init__(
@@ -20,12 +30,61 @@ class DispatchMiddleware(MiddlewareLink):
         builders: ResponseBuilderRegistry,
         outbox: Outbox,
         services: Any = None,
+        idempotency_cache: Optional[IdempotencyCache] = None,
+        offload_threshold_bytes: Optional[int] = None,
     ) -> None:
         super().__init__()
         self._router = router
         self._builders = builders
         self._outbox = outbox
         self._services = services
+        self._idempotency_cache = idempotency_cache
+        # Requests at least this large serialize their response off the event loop
+        self._offload_threshold_bytes = offload_threshold_bytes
+        self._failed_response_ids: Set[str] = set()
+        self._payload_stats = PayloadSizeStats()
+
+    def get_payload_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get request/response sizes per response type."""
+        return self._payload_stats.get_stats()
+
+    @staticmethod
+    def _idempotency_key(event: CloudEvent) -> Optional[str]:
+        """Derive the idempotency key for calc requests, None for other events."""
+        if event.type not in IDEMPOTENT_EVENT_TYPES:
+            return None
+        try:
+            data = json.loads(event.text_data) if event.text_data else {}
+        except (json.JSONDecodeError, TypeError):
+            return None
+        request_id = data.get("requestId") if isinstance(data, dict) else None
+        if not request_id:
+            return None
+        return f"{event.type}:{request_id}"
+
+    async def _build_response(
+        self, handler: Any, event: CloudEvent
+    ) -> Optional[CloudEvent]:
+        spec: ResponseSpec | None = await handler(event, services=self._services)
+        if spec is None:
+            return None
+        if not spec.success:
+            # Failure responses are sent but never replayed for redeliveries
+            self._failed_response_ids.add(event.id)
+
+        builder = self._builders.get(spec.response_type)
+        if (
+            self._offload_threshold_bytes is not None
+            and len(event.text_data) >= self._offload_threshold_bytes
+        ):
+            # Large entity payloads: keep json.dumps from blocking the loop
+            response = await asyncio.to_thread(builder.build, spec)
+        else:
+            response = builder.build(spec)
+        self._payload_stats.record(
+            response.type, len(event.text_data), len(response.text_data)
+        )
+        return response
 
     async def handle(self, event: CloudEvent) -> None:
         handler = self._router.route(event)
@@ -36,13 +95,25 @@ class DispatchMiddleware(MiddlewareLink):
             )
             return None
 
-        spec: ResponseSpec | None = await handler(event, services=self._services)
-        if spec is None:
+        key = (
+            self._idempotency_key(event)
+            if self._idempotency_cache is not None
+            else None
+        )
+        try:
+            if key is None or self._idempotency_cache is None:
+                response = await self._build_response(handler, event)
+            else:
+                response = await self._idempotency_cache.get_or_compute(
+                    key,
+                    lambda: self._build_response(handler, event),
+                    cacheable=lambda _: event.id not in self._failed_response_ids,
+                )
+        finally:
+            self._failed_response_ids.discard(event.id)
+        if response is None:
             return None
 
-        builder = self._builders.get(spec.response_type)
-        response = builder.build(spec)
-
         # Special parity log for KeepAlive ACK
         if response.type == EVENT_ACK_TYPE:
             try:
@@ -1,19 +1,49 @@
+import json
 import logging
 from typing import Any, Dict, Optional
 
 from common.exception.grpc_exceptions import ErrorHandler, GrpcClientError, HandlerError
+from common.grpc_client.constants import (
+    CALC_REQ_EVENT_TYPE,
+    CALC_RESP_EVENT_TYPE,
+    CRITERIA_CALC_REQ_EVENT_TYPE,
+    CRITERIA_CALC_RESP_EVENT_TYPE,
+)
 from common.grpc_client.middleware.base import MiddlewareLink
+from common.grpc_client.outbox import Outbox
+from common.grpc_client.responses.builders import ResponseBuilderRegistry
+from common.grpc_client.responses.spec import ResponseSpec
 from common.proto.cloudevents_pb2 import CloudEvent
 
 logger = logging.getLogger(__name__)
 
+# Request types that are answered with a failure response when handling fails
+FAILURE_RESPONSE_TYPES: Dict[str, str] = {
+    CALC_REQ_EVENT_TYPE: CALC_RESP_EVENT_TYPE,
+    CRITERIA_CALC_REQ_EVENT_TYPE: CRITERIA_CALC_RESP_EVENT_TYPE,
+}
+
 
 class ErrorMiddleware(MiddlewareLink):
     """Enhanced error middleware with comprehensive error handling."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        builders: Optional[ResponseBuilderRegistry] = None,
+        outbox: Optional[Outbox] = None,
+    ) -> None:
+        """
+        Initialize the error middleware.
+
+        Args:
+            builders: Response builders used for failure responses
+            outbox: Outbox failure responses are sent to. Without builders and
+                an outbox, errors are only logged.
+        """
         super().__init__()
         self.error_handler = ErrorHandler(logger)
+        self._builders = builders
+        self._outbox = outbox
 
     async def handle(self, event: CloudEvent) -> Any:
         try:
@@ -21,7 +51,7 @@ class ErrorMiddleware(MiddlewareLink):
         except GrpcClientError as e:
             # Already a proper gRPC error, just handle it
             self.error_handler.handle_error(e)
-            return self._create_error_response(e, event)
+            return await self._send_error_response(e, event)
         except Exception as e:
             # Convert to proper error and handle
             grpc_error = HandlerError(
@@ -32,21 +62,73 @@ class ErrorMiddleware(MiddlewareLink):
                 original_error=e,
             )
             self.error_handler.handle_error(grpc_error)
-            return self._create_error_response(grpc_error, event)
+            return await self._send_error_response(grpc_error, event)
+
+    async def _send_error_response(
+        self, error: GrpcClientError, event: CloudEvent
+    ) -> None:
+        """Send the failure response for ``event``, if one applies."""
+        response = self._create_error_response(error, event)
+        if response is None or self._outbox is None:
+            return None
+
+        logger.info(
+            f"[OUT] Sending failure response - RequestType: {event.type}, "
+            f"Code: {error.error_code}, Retryable: {error.recoverable}"
+        )
+        await self._outbox.send(response)
+        return None
 
     def _create_error_response(
         self, error: GrpcClientError, event: CloudEvent
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[CloudEvent]:
         """
         Create error response based on error type and recoverability.
 
+        Calc requests are answered immediately with ``success=false`` and the
+        error code, retryable flag and suggested retry delay derived from the
+        error, instead of leaving Cyoda to wait for its own timeout.
+
         Args:
             error: The error that occurred
             event: The original event
 
         Returns:
-            Error response dict or None if no response should be sent
+            Failure response event or None if no response should be sent
         """
-        # For now, preserve current behavior: do not emit error responses
-        # This can be enhanced later to send error responses for certain error types
-        return None
+        response_type = FAILURE_RESPONSE_TYPES.get(event.type)
+        if response_type is None or self._builders is None:
+            return None
+
+        try:
+            data = json.loads(event.text_data) if event.text_data else {}
+        except (json.JSONDecodeError, TypeError):
+            data = {}
+        if not isinstance(data, dict) or not data.get("requestId"):
+            logger.warning(
+                f"Cannot answer failed {event.type} (ID: {event.id}): no requestId"
+            )
+            return None
+
+        response_data: Dict[str, Any] = {
+            "requestId": data.get("requestId"),
+            "entityId": data.get("entityId"),
+        }
+        if response_type == CALC_RESP_EVENT_TYPE:
+            # Failed processing leaves the entity unchanged
+            response_data["payload"] = data.get("payload")
+        else:
+            response_data["matches"] = False
+
+        spec = ResponseSpec(
+            response_type=response_type,
+            data=response_data,
+            source_event_id=event.id,
+            success=False,
+            error=error.to_response_error(),
+        )
+        try:
+            return self._builders.get(response_type).build(spec)
+        except Exception as e:
+            logger.error(f"Failed to build failure response for {event.type}: {e}")
+            return None
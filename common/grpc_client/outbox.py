@@ -1,7 +1,9 @@
 import asyncio
 import json
 import logging
-from typing import AsyncGenerator, Optional
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple
 
 from common.grpc_client.constants import (
     CALC_RESP_EVENT_TYPE,
@@ -17,15 +19,128 @@ logger = logging.getLogger(__name__)
 
 
 class Outbox:
-    def __init__(self) -> None:
+    def __init__(self, batch_size: int = 1, flush_interval: float = 0.0) -> None:
+        """
+        Initialize the outbox.
+
+        Args:
+            batch_size: Maximum number of ready responses emitted as one burst.
+                1 keeps the original one-by-one delivery.
+            flush_interval: Seconds to wait for more responses before flushing
+                a partial burst (0 flushes whatever is ready immediately)
+        """
         self._queue: asyncio.Queue[Optional[CloudEvent]] = asyncio.Queue()
+        # Enqueue timestamps, kept in queue order to measure send latency
+        self._enqueued_at: Deque[float] = deque()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self._sent = 0
+        self._bursts = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def batching_enabled(self) -> bool:
+        return self.batch_size > 1
 
     async def send(self, response: CloudEvent) -> None:
+        self._enqueued_at.append(time.monotonic())
         await self._queue.put(response)
 
     async def close(self) -> None:
+        self._enqueued_at.append(time.monotonic())
         await self._queue.put(None)  # sentinel used by event_generator
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get send statistics (latency is enqueue-to-yield, in milliseconds)."""
+        return {
+            "sent": self._sent,
+            "bursts": self._bursts,
+            "pending": self._queue.qsize(),
+            "avg_latency_ms": (
+                self._total_latency / self._sent * 1000 if self._sent else 0.0
+            ),
+            "max_latency_ms": self._max_latency * 1000,
+        }
+
+    def _record_sent(self) -> None:
+        enqueued_at = self._enqueued_at.popleft() if self._enqueued_at else None
+        self._sent += 1
+        if enqueued_at is not None:
+            latency = time.monotonic() - enqueued_at
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+    async def _next_burst(self) -> Tuple[List[CloudEvent], bool]:
+        """
+        Collect the next burst of ready events.
+
+        Returns:
+            Tuple of (events, closed) where closed means the sentinel was reached
+        """
+        burst: List[CloudEvent] = []
+        item = await self._queue.get()
+        deadline: Optional[float] = None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if item is None:
+                if self._enqueued_at:
+                    self._enqueued_at.popleft()
+                return burst, True
+
+            burst.append(item)
+            if len(burst) >= self.batch_size:
+                return burst, False
+
+            try:
+                item = self._queue.get_nowait()
+                continue
+            except asyncio.QueueEmpty:
+                if self.flush_interval <= 0:
+                    return burst, False
+
+            if deadline is None:
+                deadline = loop.time() + self.flush_interval
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return burst, False
+            try:
+                item = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                return burst, False
+
+    def _log_event(self, event: CloudEvent) -> None:
+        """Log an outgoing event with type-specific details."""
+        try:
+            data = json.loads(event.text_data) if event.text_data else {}
+            logger.info(
+                f"[OUT] Sending event - Type: {event.type}, ID: {event.id}, Source: {event.source}"
+            )
+            if event.type == EVENT_ACK_TYPE:
+                source_event_id = data.get("sourceEventId", "Unknown")
+                success = data.get("success", "Unknown")
+                logger.debug(
+                    f"[OUT] EventAck - SourceEventId: {source_event_id}, Success: {success}"
+                )
+            elif event.type in (
+                CALC_RESP_EVENT_TYPE,
+                CRITERIA_CALC_RESP_EVENT_TYPE,
+            ):
+                entity_id = data.get("entityId", "Unknown")
+                request_id = data.get("requestId", "Unknown")
+                success = data.get("success", "Unknown")
+                logger.info(
+                    f"[OUT] CalcResponse - EntityId: {entity_id}, RequestId: {request_id}, Success: {success}"
+                )
+            else:
+                logger.info(f"[OUT] Event - Data: {data}")
+        except Exception as e:
+            logger.warning(f"Failed to parse outgoing event data: {e}")
+            logger.info(
+                f"[OUT] Raw event - Type: {event.type}, ID: {event.id}, TextData: {event.text_data}"
+            )
+
     async def event_generator(self) -> AsyncGenerator[CloudEvent, None]:
         """Generate outbound events: join first, then responses from queue."""
         # Send join event first
@@ -52,40 +167,24 @@ class Outbox:
 
         # Then yield responses from queue
         while True:
-            event = await self._queue.get()
-            if event is None:
-                break
+            burst, closed = await self._next_burst()
 
-            # Log outgoing event
-            try:
-                data = json.loads(event.text_data) if event.text_data else {}
-                logger.info(
-                    f"[OUT] Sending event - Type: {event.type}, ID: {event.id}, Source: {event.source}"
-                )
-                if event.type == EVENT_ACK_TYPE:
-                    source_event_id = data.get("sourceEventId", "Unknown")
-                    success = data.get("success", "Unknown")
-                    logger.debug(
-                        f"[OUT] EventAck - SourceEventId: {source_event_id}, Success: {success}"
-                    )
-                elif event.type in (
-                    CALC_RESP_EVENT_TYPE,
-                    CRITERIA_CALC_RESP_EVENT_TYPE,
-                ):
-                    entity_id = data.get("entityId", "Unknown")
-                    request_id = data.get("requestId", "Unknown")
-                    success = data.get("success", "Unknown")
-                    logger.info(
-                        f"[OUT] CalcResponse - EntityId: {entity_id}, RequestId: {request_id}, Success: {success}"
-                    )
-                else:
-                    logger.info(f"[OUT] Event - Data: {data}")
-            except Exception as e:
-                logger.warning(f"Failed to parse outgoing event data: {e}")
-                logger.info(
-                    f"[OUT] Raw event - Type: {event.type}, ID: {event.id}, TextData: {event.text_data}"
+            if self.batching_enabled and burst:
+                # Per-event payload parsing is skipped in burst mode unless debugging
+                logger.info(f"[OUT] Sending burst of {len(burst)} events")
+
+            for event in burst:
+                if not self.batching_enabled or logger.isEnabledFor(logging.DEBUG):
+                    self._log_event(event)
+
+                yield event
+                self._record_sent()
+                logger.debug(
+                    f"[OUT] Event completed - ID: {event.id}, Type: {event.type}"
                 )
+                self._queue.task_done()
 
-            yield event
-            logger.debug(f"[OUT] Event completed - ID: {event.id}, Type: {event.type}")
-            self._queue.task_done()
+            if burst:
+                self._bursts += 1
+            if closed:
+                break
@@ -1,6 +1,6 @@
 import json
 import uuid
-from typing import Dict
+from typing import Any, Dict
 
 from common.grpc_client.constants import (
     CALC_RESP_EVENT_TYPE,
@@ -16,6 +16,14 @@ from common.grpc_client.responses.spec import ResponseSpec
 from common.proto.cloudevents_pb2 import CloudEvent
 
 
+def _status_fields(spec: ResponseSpec) -> Dict[str, Any]:
+    """Success flag plus error details for calc responses."""
+    fields: Dict[str, Any] = {"success": spec.success}
+    if spec.error:
+        fields["error"] = spec.error
+    return fields
+
+
 class ResponseBuilder:
     def build(self, spec: ResponseSpec) -> CloudEvent:
         raise NotImplementedError
@@ -89,7 +97,7 @@ class CalcResponseBuilder(ResponseBuilder):
                     "entityId": data.get("entityId"),
                     "owner": OWNER,
                     "payload": data.get("payload"),
-                    "success": True,
+                    **_status_fields(spec),
                 }
             ),
         )
@@ -111,7 +119,7 @@ class CriteriaCalcResponseBuilder(ResponseBuilder):
                     "entityId": data.get("entityId"),
                     "owner": OWNER,
                     "matches": data.get("matches"),
-                    "success": True,
+                    **_status_fields(spec),
                 }
             ),
         )
@@ -0,0 +1,128 @@
+"""
+Calc response payload shaping and size accounting.
+
+By default a calc response carries the whole entity. Processors often touch a
+single field, so for large entities most of the response repeats what Cyoda
+sent in the request. The payload modes below trim the entity data before it is
+serialized; the size statistics show what each response type actually costs.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Type
+
+from common.entity.cyoda_entity import CyodaEntity
+
+
+class CalcPayloadMode(str, Enum):
+    """
+    How much entity data a calc response carries.
+
+    FULL sends every field. EXCLUDE_DEFAULTS leaves out fields still at their
+    declared default; they are restored when the entity is validated again.
+    CHANGES sends only fields whose value differs from the request payload and
+    must only be used when the platform merges partial payloads into the stored
+    entity instead of replacing it. Both trimmed modes use field aliases, like
+    the request payload, and leave out fields the request did not carry and
+    nothing assigned, such as a freshly generated ``entity_id``.
+    """
+
+    FULL = "full"
+    EXCLUDE_DEFAULTS = "exclude_defaults"
+    CHANGES = "changes"
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _dump_keys(model_cls: Type[CyodaEntity]) -> Dict[str, str]:
+    """Map the by-alias dump key of each field to the field name."""
+    return {info.alias or name: name for name, info in model_cls.model_fields.items()}
+
+
+def shape_entity_payload(
+    entity: CyodaEntity, original: Mapping[str, Any], mode: CalcPayloadMode
+) -> Dict[str, Any]:
+    """
+    Build the entity data for a calc response.
+
+    Args:
+        entity: Entity returned by the processor
+        original: Entity data received in the calc request
+        mode: Payload mode
+
+    Returns:
+        Entity data to send back
+    """
+    if mode is CalcPayloadMode.FULL:
+        return entity.to_dict()
+
+    data = entity.model_dump(
+        by_alias=True, exclude_defaults=mode is CalcPayloadMode.EXCLUDE_DEFAULTS
+    )
+    names = _dump_keys(type(entity))
+    fields_set = entity.model_fields_set
+    shaped: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = names.get(key)
+        sent = original.get(key, _MISSING)
+        if sent is _MISSING and name is not None:
+            sent = original.get(name, _MISSING)
+            if (
+                sent is _MISSING
+                and name not in fields_set
+                # Containers filled in place (metadata) are real changes
+                and not (isinstance(value, (dict, list)) and value)
+            ):
+                # Defaults and generated values (entity_id, created_at) the
+                # platform never sent must not be written back to it
+                continue
+        if mode is CalcPayloadMode.CHANGES and sent == value:
+            continue
+        shaped[key] = value
+    return shaped
+
+
+class PayloadSizeStats:
+    """Request and response sizes per response type."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self, response_type: str, request_bytes: int, response_bytes: int
+    ) -> None:
+        """
+        Record one response.
+
+        Args:
+            response_type: CloudEvent type of the response
+            request_bytes: Size of the request event data
+            response_bytes: Size of the response event data
+        """
+        stats = self._stats.setdefault(
+            response_type,
+            {"responses": 0, "request_bytes": 0, "response_bytes": 0, "max_bytes": 0},
+        )
+        stats["responses"] += 1
+        stats["request_bytes"] += request_bytes
+        stats["response_bytes"] += response_bytes
+        stats["max_bytes"] = max(stats["max_bytes"], response_bytes)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per response type totals, averages and the response/request ratio."""
+        return {
+            response_type: {
+                "responses": stats["responses"],
+                "response_bytes": stats["response_bytes"],
+                "avg_response_bytes": stats["response_bytes"] / stats["responses"],
+                "max_response_bytes": stats["max_bytes"],
+                "response_to_request_ratio": (
+                    stats["response_bytes"] / stats["request_bytes"]
+                    if stats["request_bytes"]
+                    else 0.0
+                ),
+            }
+            for response_type, stats in self._stats.items()
+        }
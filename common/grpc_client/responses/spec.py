@@ -8,3 +8,5 @@ class ResponseSpec:
     data: Dict[str, Any]
     source_event_id: Optional[str] = None
     success: bool = True
+    # Error details for failed responses: {"code", "message", "retryable"}
+    error: Optional[Dict[str, Any]] = None
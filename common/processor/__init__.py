@@ -4,18 +4,32 @@ Processor system for dynamic entity processing and criteria checking.
 This module provides the foundation for the processor system including:
 - Base classes for processors and criteria checkers
 - Processor manager for automatic discovery and execution
+- Pipelines running several processors and criteria as one processor
 - Error handling for processing operations
 """
 
 from .base import CyodaCriteriaChecker, CyodaProcessor
-from .errors import CriteriaError, ProcessorError
+from .errors import (
+    CriteriaError,
+    CriteriaTimeoutError,
+    CriteriaUnavailableError,
+    ProcessorError,
+    ProcessorTimeoutError,
+    ProcessorUnavailableError,
+)
 from .manager import ProcessorManager, get_processor_manager
+from .pipeline import ProcessorPipeline
 
 __all__ = [
     "CyodaProcessor",
     "CyodaCriteriaChecker",
     "ProcessorError",
     "CriteriaError",
+    "ProcessorTimeoutError",
+    "CriteriaTimeoutError",
+    "ProcessorUnavailableError",
+    "CriteriaUnavailableError",
     "ProcessorManager",
     "get_processor_manager",
+    "ProcessorPipeline",
 ]
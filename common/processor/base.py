@@ -4,7 +4,7 @@ Base classes for processors and criteria checkers.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from common.entity.cyoda_entity import CyodaEntity
 
@@ -17,16 +17,26 @@ __all__ = ["CyodaProcessor", "CyodaCriteriaChecker", "CyodaEntity"]
 class CyodaProcessor(ABC):
     """Base class for all entity processors."""
 
-    def __init__(self, name: str, description: str = ""):
+    # Opt-in performance profile: run process() inside deferred_validation(),
+    # so entities with DEFER_VALIDATION are validated once when it returns
+    defer_validation: bool = False
+    # Bulkhead size for this processor, overriding the manager default
+    max_concurrency: Optional[int] = None
+
+    def __init__(
+        self, name: str, description: str = "", timeout: Optional[float] = None
+    ):
         """
         Initialize the processor.
 
         Args:
             name: Unique name for the processor
             description: Human-readable description of what the processor does
+            timeout: Processing deadline in seconds (None uses the manager default)
         """
         self.name = name
         self.description = description
+        self.timeout = timeout
         self.logger = logging.getLogger(
             f"{self.__class__.__module__}.{self.__class__.__name__}"
         )
@@ -48,6 +58,32 @@ class CyodaProcessor(ABC):
         """
         pass
 
+    async def process_batch(
+        self, entities: List[CyodaEntity], **kwargs: Any
+    ) -> List[CyodaEntity]:
+        """
+        Process several entities that arrived together.
+
+        Override to amortize I/O (e.g. one batched save instead of one save per
+        entity). The default processes the entities one by one.
+
+        Args:
+            entities: The entities to process
+            **kwargs: Additional processing parameters
+
+        Returns:
+            The processed entities, in the same order
+
+        Raises:
+            ProcessorError: If processing fails
+        """
+        return [await self.process(entity, **kwargs) for entity in entities]
+
+    @property
+    def supports_batch(self) -> bool:
+        """True when the processor overrides process_batch."""
+        return type(self).process_batch is not CyodaProcessor.process_batch
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get information about this processor.
@@ -60,6 +96,8 @@ class CyodaProcessor(ABC):
             "description": self.description,
             "class": self.__class__.__name__,
             "module": self.__class__.__module__,
+            "timeout": self.timeout,
+            "batch": self.supports_batch,
         }
 
     def __str__(self) -> str:
@@ -72,16 +110,23 @@ class CyodaProcessor(ABC):
 class CyodaCriteriaChecker(ABC):
     """Base class for all criteria checkers."""
 
-    def __init__(self, name: str, description: str = ""):
+    # Bulkhead size for this criteria checker, overriding the manager default
+    max_concurrency: Optional[int] = None
+
+    def __init__(
+        self, name: str, description: str = "", timeout: Optional[float] = None
+    ):
         """
         Initialize the criteria checker.
 
         Args:
             name: Unique name for the criteria checker
             description: Human-readable description of what the criteria checks
+            timeout: Check deadline in seconds (None uses the manager default)
         """
         self.name = name
         self.description = description
+        self.timeout = timeout
         self.logger = logging.getLogger(
             f"{self.__class__.__module__}.{self.__class__.__name__}"
         )
@@ -103,6 +148,32 @@ class CyodaCriteriaChecker(ABC):
         """
         pass
 
+    async def check_batch(
+        self, entities: List[CyodaEntity], **kwargs: Any
+    ) -> List[bool]:
+        """
+        Check several entities that arrived together.
+
+        Override to amortize I/O across entities. The default checks the
+        entities one by one.
+
+        Args:
+            entities: The entities to check
+            **kwargs: Additional criteria parameters
+
+        Returns:
+            One result per entity, in the same order
+
+        Raises:
+            CriteriaError: If criteria checking fails
+        """
+        return [await self.check(entity, **kwargs) for entity in entities]
+
+    @property
+    def supports_batch(self) -> bool:
+        """True when the criteria checker overrides check_batch."""
+        return type(self).check_batch is not CyodaCriteriaChecker.check_batch
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get information about this criteria checker.
@@ -115,6 +186,8 @@ class CyodaCriteriaChecker(ABC):
             "description": self.description,
             "class": self.__class__.__name__,
             "module": self.__class__.__module__,
+            "timeout": self.timeout,
+            "batch": self.supports_batch,
         }
 
     def __str__(self) -> str:
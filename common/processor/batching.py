@@ -0,0 +1,165 @@
+"""
+Micro-batching of concurrent processor and criteria calls.
+
+Calc requests are dispatched as independent tasks, so requests for the same
+processor that arrive together each pay their own I/O round-trips. The
+MicroBatcher collects items submitted under the same key within a short
+window (or until a size limit is reached) and runs them as one batch, handing
+each submitter back its own result. Items whose submitter already gave up are
+left out of the batch, and a batch is cut off at the earliest deadline of its
+items, so no side effects run after a caller has reported a timeout.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BatchRunner = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+@dataclass
+class _PendingBatch:
+    """Items collected for one key while its window is open."""
+
+    run: BatchRunner
+    items: List[Any] = field(default_factory=list)
+    futures: List["asyncio.Future[Any]"] = field(default_factory=list)
+    # Absolute loop time by which each item's submitter stops waiting
+    deadlines: List[Optional[float]] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """Groups concurrent submissions per key into batches."""
+
+    def __init__(self, window: float, max_batch_size: int = 32) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            window: Seconds to wait for more items after the first one arrives
+            max_batch_size: Batch size that triggers an immediate flush
+        """
+        self.window = max(0.0, window)
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._running: "set[asyncio.Task[None]]" = set()
+        self._batches = 0
+        self._items = 0
+        self._max_size = 0
+        self._dropped = 0
+
+    async def submit(
+        self,
+        key: str,
+        item: Any,
+        run: BatchRunner,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Add an item to the open batch for a key and wait for its result.
+
+        Args:
+            key: Batch key, usually the processor or criteria name
+            item: Item to process
+            run: Coroutine function processing a list of items and returning
+                one result per item, in order. The runner of the first item
+                in a batch is used for the whole batch.
+            timeout: Seconds this submitter waits for its result. The batch is
+                cancelled once the earliest deadline among its items passes.
+
+        Returns:
+            The result for this item
+
+        Raises:
+            Exception: Whatever the runner raised, for every item of the batch
+            asyncio.TimeoutError: If the batch was cut off at a deadline
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(run=run)
+            self._pending[key] = batch
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        batch.deadlines.append(None if timeout is None else loop.time() + timeout)
+        if len(batch.items) >= self.max_batch_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: str) -> None:
+        """Close the batch for a key and start running it."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        self._batches += 1
+        self._items += len(batch.items)
+        self._max_size = max(self._max_size, len(batch.items))
+
+        task = asyncio.create_task(self._run(key, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, key: str, batch: _PendingBatch) -> None:
+        # Submitters that timed out or were cancelled while the window was open
+        # must not have their items processed after they reported failure
+        live = [
+            (item, future, deadline)
+            for item, future, deadline in zip(
+                batch.items, batch.futures, batch.deadlines
+            )
+            if not future.done()
+        ]
+        self._dropped += len(batch.items) - len(live)
+        if not live:
+            return
+        items = [item for item, _, _ in live]
+        futures = [future for _, future, _ in live]
+        deadlines = [deadline for _, _, deadline in live if deadline is not None]
+
+        try:
+            if deadlines:
+                remaining = min(deadlines) - asyncio.get_running_loop().time()
+                results = await asyncio.wait_for(batch.run(items), remaining)
+            else:
+                results = await batch.run(items)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch for '{key}' returned {len(results)} results "
+                    f"for {len(items)} items"
+                )
+        except Exception as e:
+            logger.warning(f"Batch of {len(items)} for '{key}' failed: {e!r}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+                    # Submitters that already gave up must not trigger
+                    # "exception was never retrieved" warnings
+                    future.exception()
+            return
+
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch_size": self.max_batch_size,
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": self._items / self._batches if self._batches else 0.0,
+            "largest_batch": self._max_size,
+            "dropped_items": self._dropped,
+            "open_batches": len(self._pending),
+        }
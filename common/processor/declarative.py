@@ -0,0 +1,443 @@
+"""
+Declarative criteria: JSON rule sets compiled into predicates.
+
+A rule file declares one or more criteria whose conditions use the same
+operators as entity search (``SearchOperator`` values such as ``"eq"`` or
+``"icontains"``, or their Cyoda names such as ``"IEQUALS"``):
+
+    {
+      "name": "ExampleEntityRulesCriterion",
+      "description": "Entity is active and in a known category",
+      "rule": {
+        "operator": "and",
+        "conditions": [
+          {"field": "name", "operator": "not_null"},
+          {"field": "category", "operator": "in", "value": ["BOOKS", "HOME"]},
+          {"operator": "or", "conditions": [
+            {"field": "isActive", "operator": "eq", "value": true},
+            {"field": "category", "operator": "ne", "value": "ELECTRONICS"}
+          ]}
+        ]
+      }
+    }
+
+A file may also hold ``{"criteria": [...]}`` with several such definitions.
+Each rule is compiled once into a Python predicate; regular expressions and
+operand conversions happen at compile time, not per request. Field paths are
+dotted (``processedData.status``) or JSONPath-like (``$.processedData.status``)
+and accept both field names and aliases.
+
+DeclarativeCriteriaStore watches rule files and recompiles changed ones, which
+is how ProcessorManager picks up edits without a restart.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.service.entity_service import CYODA_OPERATOR_MAPPING, SearchOperator
+
+from .base import CyodaCriteriaChecker
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[Any], bool]
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _alias_map(model_cls: type) -> Dict[str, str]:
+    """Map field aliases of a model class to field names."""
+    fields = getattr(model_cls, "model_fields", {})
+    return {info.alias: name for name, info in fields.items() if info.alias}
+
+
+def _get(obj: Any, key: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(key, _MISSING)
+    if isinstance(obj, BaseModel):
+        value = getattr(obj, key, _MISSING)
+        if value is _MISSING:
+            name = _alias_map(type(obj)).get(key)
+            if name is not None:
+                value = getattr(obj, name, _MISSING)
+        return value
+    return getattr(obj, key, _MISSING)
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """
+    Compile a field path into a getter.
+
+    Args:
+        path: Dotted path, optionally prefixed with ``$.``
+
+    Returns:
+        Function returning the value at the path, or None when it is missing
+    """
+    if path.startswith("$."):
+        path = path[2:]
+    if not path:
+        raise ValueError("Empty field path")
+    keys = tuple(path.split("."))
+
+    def getter(obj: Any) -> Any:
+        for key in keys:
+            obj = _get(obj, key)
+            if obj is _MISSING or obj is None:
+                return None
+        return obj
+
+    return getter
+
+
+def _resolve_operator(name: str) -> SearchOperator:
+    if name in CYODA_OPERATOR_MAPPING:
+        return CYODA_OPERATOR_MAPPING[name]
+    try:
+        return SearchOperator(name.lower())
+    except ValueError:
+        raise ValueError(f"Unknown operator '{name}'") from None
+
+
+def _compare(op: Callable[[Any, Any], bool], expected: Any) -> Callable[[Any], bool]:
+    def test(value: Any) -> bool:
+        if value is None:
+            return False
+        try:
+            return op(value, expected)
+        except TypeError:
+            return False
+
+    return test
+
+
+def _text(op: Callable[[str, str], bool], expected: Any, fold: bool) -> Predicate:
+    needle = str(expected).casefold() if fold else str(expected)
+
+    def test(value: Any) -> bool:
+        if value is None:
+            return False
+        text = str(value)
+        return op(text.casefold() if fold else text, needle)
+
+    return test
+
+
+def _like_regex(pattern: str) -> "re.Pattern[str]":
+    """Translate a SQL LIKE pattern (% and _ wildcards) into a regex."""
+    parts = [
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    ]
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _range(expected: Any) -> Tuple[Any, Any]:
+    if not isinstance(expected, (list, tuple)) or len(expected) != 2:
+        raise ValueError("Range operators need a [low, high] value")
+    return expected[0], expected[1]
+
+
+def _compile_test(operator: SearchOperator, expected: Any) -> Predicate:
+    """Compile a single operator and operand into a value test."""
+    op = SearchOperator
+    if operator is op.EQUALS:
+        return lambda value: bool(value == expected)
+    if operator is op.NOT_EQUALS:
+        return lambda value: bool(value != expected)
+    if operator in (op.IEQUALS, op.INOT_EQUALS):
+        folded = str(expected).casefold()
+        negate = operator is op.INOT_EQUALS
+        return (
+            lambda value: (value is not None and str(value).casefold() == folded)
+            is not negate
+        )
+    if operator is op.IS_NULL:
+        return lambda value: value is None
+    if operator is op.NOT_NULL:
+        return lambda value: value is not None
+    if operator is op.GREATER_THAN:
+        return _compare(lambda v, e: v > e, expected)
+    if operator is op.GREATER_OR_EQUAL:
+        return _compare(lambda v, e: v >= e, expected)
+    if operator is op.LESS_THAN:
+        return _compare(lambda v, e: v < e, expected)
+    if operator is op.LESS_OR_EQUAL:
+        return _compare(lambda v, e: v <= e, expected)
+    if operator in (op.CONTAINS, op.NOT_CONTAINS):
+        negate = operator is op.NOT_CONTAINS
+
+        def contains(value: Any) -> bool:
+            if value is None:
+                return negate
+            if isinstance(value, (list, tuple, set, dict)):
+                return (expected in value) is not negate
+            return (str(expected) in str(value)) is not negate
+
+        return contains
+    text_ops: Dict[SearchOperator, Tuple[Callable[[str, str], bool], bool, bool]] = {
+        op.STARTS_WITH: (str.startswith, False, False),
+        op.NOT_STARTS_WITH: (str.startswith, False, True),
+        op.ENDS_WITH: (str.endswith, False, False),
+        op.NOT_ENDS_WITH: (str.endswith, False, True),
+        op.ICONTAINS: (lambda v, e: e in v, True, False),
+        op.INOT_CONTAINS: (lambda v, e: e in v, True, True),
+        op.ISTARTS_WITH: (str.startswith, True, False),
+        op.INOT_STARTS_WITH: (str.startswith, True, True),
+        op.IENDS_WITH: (str.endswith, True, False),
+        op.INOT_ENDS_WITH: (str.endswith, True, True),
+    }
+    if operator in text_ops:
+        text_op, fold, negate = text_ops[operator]
+        test = _text(text_op, expected, fold)
+        if negate:
+            return lambda value: value is None or not test(value)
+        return test
+    if operator in (op.MATCHES_PATTERN, op.LIKE):
+        try:
+            regex = (
+                re.compile(str(expected))
+                if operator is op.MATCHES_PATTERN
+                else _like_regex(str(expected))
+            )
+        except re.error as e:
+            raise ValueError(f"Invalid pattern '{expected}': {e}") from None
+        return lambda value: value is not None and bool(regex.fullmatch(str(value)))
+    if operator in (op.BETWEEN, op.BETWEEN_INCLUSIVE):
+        low, high = _range(expected)
+        if operator is op.BETWEEN:
+            return _compare(lambda v, _: low < v < high, None)
+        return _compare(lambda v, _: low <= v <= high, None)
+    if operator in (op.IN, op.NOT_IN):
+        if not isinstance(expected, (list, tuple, set)):
+            raise ValueError(f"Operator '{operator.value}' needs a list value")
+        try:
+            options: Any = frozenset(expected)
+        except TypeError:
+            options = list(expected)
+        negate = operator is op.NOT_IN
+
+        def member(value: Any) -> bool:
+            try:
+                return (value in options) is not negate
+            except TypeError:
+                return negate
+
+        return member
+    raise ValueError(
+        f"Operator '{operator.value}' is not supported in declarative criteria"
+    )
+
+
+def compile_condition(spec: Dict[str, Any]) -> Predicate:
+    """
+    Compile a condition or condition group into a predicate.
+
+    Args:
+        spec: ``{"field", "operator", "value"}`` condition or
+            ``{"operator": "and"|"or", "conditions": [...]}`` group
+
+    Returns:
+        Predicate taking an entity (or plain dict) and returning a bool
+
+    Raises:
+        ValueError: If the rule is malformed or uses an unsupported operator
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"Condition must be an object, got {type(spec).__name__}")
+
+    if "conditions" in spec:
+        logical = str(spec.get("operator", "and")).lower()
+        if logical not in ("and", "or"):
+            raise ValueError(f"Unknown group operator '{logical}'")
+        predicates = tuple(compile_condition(child) for child in spec["conditions"])
+        if logical == "and":
+            return lambda entity: all(p(entity) for p in predicates)
+        return lambda entity: any(p(entity) for p in predicates)
+
+    field = spec.get("field") or spec.get("jsonPath")
+    if not field:
+        raise ValueError(f"Condition without field: {spec}")
+    operator = _resolve_operator(
+        str(spec.get("operator") or spec.get("operatorType") or "eq")
+    )
+    getter = compile_path(str(field))
+    test = _compile_test(operator, spec.get("value"))
+    return lambda entity: test(getter(entity))
+
+
+class DeclarativeCriteria(CyodaCriteriaChecker):
+    """Criteria checker evaluating a compiled JSON rule."""
+
+    def __init__(
+        self,
+        name: str,
+        rule: Dict[str, Any],
+        description: str = "",
+        source: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize and compile the criteria.
+
+        Args:
+            name: Criteria name referenced by workflows
+            rule: Condition or condition group
+            description: Human-readable description
+            source: File the rule was loaded from
+
+        Raises:
+            ValueError: If the rule does not compile
+        """
+        super().__init__(name=name, description=description)
+        self.rule = rule
+        self.source = source
+        self._predicate = compile_condition(rule)
+
+    async def check(self, entity: CyodaEntity, **kwargs: Any) -> bool:
+        return self._predicate(entity)
+
+    def get_info(self) -> Dict[str, Any]:
+        info = super().get_info()
+        info["declarative"] = True
+        info["source"] = self.source
+        return info
+
+
+def parse_criteria(
+    document: Any, source: Optional[str] = None
+) -> List[DeclarativeCriteria]:
+    """
+    Build criteria from a parsed rule document.
+
+    Raises:
+        ValueError: If a definition is malformed
+    """
+    definitions = document.get("criteria") if isinstance(document, dict) else None
+    if definitions is None:
+        definitions = [document]
+    criteria = []
+    for definition in definitions:
+        if not isinstance(definition, dict) or "name" not in definition:
+            raise ValueError("Criteria definition needs a name")
+        if "rule" not in definition:
+            raise ValueError(f"Criteria '{definition['name']}' has no rule")
+        criteria.append(
+            DeclarativeCriteria(
+                name=definition["name"],
+                rule=definition["rule"],
+                description=definition.get("description", ""),
+                source=source,
+            )
+        )
+    return criteria
+
+
+class DeclarativeCriteriaStore:
+    """Loads rule files and reloads the ones that changed."""
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        reload_interval: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            paths: Rule files or directories of ``*.json`` rule files
+            reload_interval: Minimum seconds between file change checks
+                (0 checks on every refresh)
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.paths = [str(path) for path in paths]
+        self.reload_interval = max(0.0, reload_interval)
+        self._clock = clock
+        self._checked_at: Optional[float] = None
+        # File -> (mtime_ns, names of the criteria it defines)
+        self._files: Dict[str, Tuple[int, List[str]]] = {}
+        # File -> mtime_ns of a version that failed to load, retried once edited
+        self._failed: Dict[str, int] = {}
+
+    def _rule_files(self) -> Dict[str, int]:
+        files: Dict[str, int] = {}
+        for path in self.paths:
+            candidates = (
+                sorted(Path(path).glob("*.json"))
+                if os.path.isdir(path)
+                else [Path(path)]
+            )
+            for candidate in candidates:
+                try:
+                    files[str(candidate)] = os.stat(candidate).st_mtime_ns
+                except OSError:
+                    continue
+        return files
+
+    def refresh(
+        self, force: bool = False
+    ) -> Tuple[List[DeclarativeCriteria], List[str]]:
+        """
+        Compile new and changed rule files.
+
+        A file that fails to load is logged and its previously loaded criteria
+        are kept; it is not retried until it changes again.
+
+        Args:
+            force: Check files even if the reload interval has not passed
+
+        Returns:
+            Tuple of (criteria to register, names of criteria to remove)
+        """
+        now = self._clock()
+        if (
+            not force
+            and self._checked_at is not None
+            and now - self._checked_at < self.reload_interval
+        ):
+            return [], []
+        self._checked_at = now
+
+        loaded: List[DeclarativeCriteria] = []
+        removed: List[str] = []
+        current = self._rule_files()
+
+        for path in list(self._files):
+            if path not in current:
+                removed.extend(self._files.pop(path)[1])
+        for path in list(self._failed):
+            if path not in current:
+                del self._failed[path]
+
+        for path, mtime in current.items():
+            known = self._files.get(path)
+            if known is not None and known[0] == mtime:
+                continue
+            if self._failed.get(path) == mtime:
+                continue
+            try:
+                with open(path, encoding="utf-8") as rule_file:
+                    criteria = parse_criteria(json.load(rule_file), source=path)
+            except (OSError, TypeError, ValueError) as e:
+                self._failed[path] = mtime
+                logger.error(f"Cannot load declarative criteria from {path}: {e}")
+                continue
+            self._failed.pop(path, None)
+            names = [c.name for c in criteria]
+            if known is not None:
+                removed.extend(name for name in known[1] if name not in names)
+            self._files[path] = (mtime, names)
+            loaded.extend(criteria)
+            logger.info(f"Compiled declarative criteria {names} from {path}")
+
+        return loaded, removed
@@ -115,3 +115,91 @@ class CriteriaNotFoundError(CriteriaError):
             criteria_name=criteria_name,
             message=f"Criteria checker '{criteria_name}' not found",
         )
+
+
+class ProcessorTimeoutError(ProcessorError):
+    """Exception raised when a processor does not finish before its deadline."""
+
+    def __init__(
+        self, processor_name: str, timeout: float, entity_id: Optional[str] = None
+    ):
+        super().__init__(
+            processor_name=processor_name,
+            message=f"Processing exceeded deadline of {timeout:g}s",
+            entity_id=entity_id,
+            context={"timeout": timeout},
+        )
+        self.timeout = timeout
+
+
+class CriteriaTimeoutError(CriteriaError):
+    """Exception raised when a criteria checker does not finish before its deadline."""
+
+    def __init__(
+        self, criteria_name: str, timeout: float, entity_id: Optional[str] = None
+    ):
+        super().__init__(
+            criteria_name=criteria_name,
+            message=f"Criteria check exceeded deadline of {timeout:g}s",
+            entity_id=entity_id,
+            context={"timeout": timeout},
+        )
+        self.timeout = timeout
+
+
+class ProcessorUnavailableError(ProcessorError):
+    """Exception raised when a processor call is rejected without running it."""
+
+    def __init__(
+        self,
+        processor_name: str,
+        reason: str,
+        retry_after: Optional[float] = None,
+        entity_id: Optional[str] = None,
+    ):
+        """
+        Initialize the error.
+
+        Args:
+            processor_name: Name of the rejected processor
+            reason: "circuit_open" or "bulkhead_full"
+            retry_after: Seconds until the processor accepts calls again, if known
+            entity_id: ID of the entity that was not processed
+        """
+        super().__init__(
+            processor_name=processor_name,
+            message=f"Processor unavailable ({reason})",
+            entity_id=entity_id,
+            context={"reason": reason, "retry_after": retry_after},
+        )
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class CriteriaUnavailableError(CriteriaError):
+    """Exception raised when a criteria check is rejected without running it."""
+
+    def __init__(
+        self,
+        criteria_name: str,
+        reason: str,
+        retry_after: Optional[float] = None,
+        entity_id: Optional[str] = None,
+    ):
+        """
+        Initialize the error.
+
+        Args:
+            criteria_name: Name of the rejected criteria checker
+            reason: "circuit_open" or "bulkhead_full"
+            retry_after: Seconds until the criteria accepts calls again, if known
+            entity_id: ID of the entity that was not checked
+        """
+        super().__init__(
+            criteria_name=criteria_name,
+            message=f"Criteria checker unavailable ({reason})",
+            entity_id=entity_id,
+            context={"reason": reason, "retry_after": retry_after},
+        )
+        self.reason = reason
+        self.retry_after = retry_after
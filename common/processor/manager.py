@@ -2,48 +2,230 @@
 Processor manager for automatic discovery and execution of processors and criteria checkers.
 """
 
+import asyncio
 import importlib
 import inspect
 import logging
 import pkgutil
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Type
 
-from common.entity.cyoda_entity import CyodaEntity
+from common.entity.cyoda_entity import CyodaEntity, deferred_validation
 from common.interfaces.services import IProcessorManager
 
 from .base import CyodaCriteriaChecker, CyodaProcessor
+from .batching import MicroBatcher
+from .declarative import DeclarativeCriteria, DeclarativeCriteriaStore
 from .errors import (
     CriteriaError,
     CriteriaNotFoundError,
+    CriteriaTimeoutError,
+    CriteriaUnavailableError,
     ProcessorError,
     ProcessorNotFoundError,
+    ProcessorTimeoutError,
+    ProcessorUnavailableError,
 )
+from .resilience import Bulkhead, CircuitBreaker, CircuitBreakerConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROCESSOR_MODULES = [
+    "application.processor",
+    "application.criterion",
+    "example_application.processor",
+    "example_application.criterion",
+]
+
 
 class ProcessorManager(IProcessorManager):
     """
     Manager for processors and criteria checkers with automatic discovery.
 
     This manager automatically discovers and registers processors and criteria checkers
-    from specified modules using OOP-friendly discovery methods.
+    from specified modules using OOP-friendly discovery methods. When a manifest
+    (see ``common.processor.manifest``) is given, discovery is skipped and each
+    processor is imported and instantiated on first use instead.
     """
 
-    def __init__(self, modules: Optional[List[str]] = None) -> None:
+    def __init__(
+        self,
+        modules: Optional[List[str]] = None,
+        default_timeout: Optional[float] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+        batch_window: float = 0.0,
+        max_batch_size: int = 32,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        max_concurrency: Optional[int] = None,
+        criteria_paths: Optional[List[str]] = None,
+        criteria_reload_interval: float = 2.0,
+    ) -> None:
         """
         Initialize the processor manager.
 
         Args:
             modules: List of module names to scan for processors and criteria
+            default_timeout: Deadline in seconds for processors and criteria
+                that do not define their own (None or 0 disables it)
+            manifest: Prebuilt name -> "module:Class" manifest enabling lazy loading
+            batch_window: Seconds concurrent requests for a batch-capable
+                processor or criteria are collected into one batch (0 disables
+                micro-batching)
+            max_batch_size: Batch size that is run without waiting for the window
+            circuit_breaker: Thresholds of the per-processor/criteria circuit
+                breakers (None disables them)
+            max_concurrency: Default bulkhead size, the maximum number of
+                concurrent calls per processor/criteria (None or 0 is unlimited)
+            criteria_paths: Declarative criteria rule files or directories
+            criteria_reload_interval: Minimum seconds between checks of the
+                rule files for changes
         """
         self.processors: Dict[str, CyodaProcessor] = {}
         self.criteria: Dict[str, CyodaCriteriaChecker] = {}
         self.modules: List[str] = modules or []
+        self.default_timeout = default_timeout
+        self.manifest = manifest
+        self._timeouts: Counter[str] = Counter()
+        self._import_times: Dict[str, float] = {}
+        # Manifest entries not imported yet, keyed by processor/criteria name
+        self._pending_processors: Dict[str, str] = {}
+        self._pending_criteria: Dict[str, str] = {}
+        self._batcher: Optional[MicroBatcher] = (
+            MicroBatcher(batch_window, max_batch_size) if batch_window > 0 else None
+        )
+        self.circuit_breaker = (
+            circuit_breaker
+            if circuit_breaker is not None and circuit_breaker.enabled
+            else None
+        )
+        self.max_concurrency = max_concurrency
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._bulkheads: Dict[str, Bulkhead] = {}
+        self._criteria_store: Optional[DeclarativeCriteriaStore] = (
+            DeclarativeCriteriaStore(criteria_paths, criteria_reload_interval)
+            if criteria_paths
+            else None
+        )
+
+        started = time.perf_counter()
+        if manifest is not None:
+            self._load_manifest(manifest)
+        else:
+            # Automatically discover and register processors and criteria
+            self._discover_and_register()
+        self.reload_declarative_criteria(force=True)
+        self._startup_seconds = time.perf_counter() - started
+        logger.info(
+            f"ProcessorManager ready in {self._startup_seconds * 1000:.1f}ms "
+            f"({'manifest' if manifest is not None else 'discovery'} mode, "
+            f"{len(self.list_processors())} processors, {len(self.list_criteria())} criteria)"
+        )
+
+    def _load_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Register manifest entries for lazy loading.
+
+        Args:
+            manifest: Manifest as produced by ``build_manifest``
+        """
+        manifest_modules = manifest.get("modules")
+        if self.modules and manifest_modules and manifest_modules != self.modules:
+            logger.warning(
+                f"Processor manifest was built for modules {manifest_modules}, "
+                f"configured modules are {self.modules}; regenerate the manifest"
+            )
+        self._pending_processors = dict(manifest.get("processors", {}))
+        self._pending_criteria = dict(manifest.get("criteria", {}))
+
+    def _import_module(self, module_name: str) -> ModuleType:
+        """Import a module, recording how long the import took."""
+        started = time.perf_counter()
+        try:
+            return importlib.import_module(module_name)
+        finally:
+            self._import_times.setdefault(module_name, time.perf_counter() - started)
+
+    def _resolve_class(self, target: str) -> Any:
+        """Import the class referenced by a "module:Class" manifest target."""
+        module_name, _, qualname = target.partition(":")
+        obj: Any = self._import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+    def _get_processor(self, processor_name: str) -> CyodaProcessor:
+        """
+        Get a processor, importing and instantiating it from the manifest if needed.
+
+        Raises:
+            ProcessorNotFoundError: If the processor is unknown or cannot be loaded
+        """
+        processor = self.processors.get(processor_name)
+        if processor is not None:
+            return processor
+
+        target = self._pending_processors.pop(processor_name, None)
+        if target is None:
+            raise ProcessorNotFoundError(processor_name)
+        try:
+            self._register_processor_class(self._resolve_class(target))
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Cannot load processor '{processor_name}' from {target}: {e}")
+
+        processor = self.processors.get(processor_name)
+        if processor is None:
+            raise ProcessorNotFoundError(processor_name)
+        return processor
+
+    def _get_criteria(self, criteria_name: str) -> CyodaCriteriaChecker:
+        """
+        Get a criteria checker, importing and instantiating it from the manifest if needed.
+
+        Raises:
+            CriteriaNotFoundError: If the criteria is unknown or cannot be loaded
+        """
+        self.reload_declarative_criteria()
+        criteria = self.criteria.get(criteria_name)
+        if criteria is not None:
+            return criteria
 
-        # Automatically discover and register processors and criteria
-        self._discover_and_register()
+        target = self._pending_criteria.pop(criteria_name, None)
+        if target is None:
+            raise CriteriaNotFoundError(criteria_name)
+        try:
+            self._register_criteria_class(self._resolve_class(target))
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Cannot load criteria '{criteria_name}' from {target}: {e}")
+
+        criteria = self.criteria.get(criteria_name)
+        if criteria is None:
+            raise CriteriaNotFoundError(criteria_name)
+        return criteria
+
+    def reload_declarative_criteria(self, force: bool = False) -> List[str]:
+        """
+        Recompile declarative criteria whose rule files changed.
+
+        Called before each criteria lookup; file checks are throttled by the
+        reload interval unless ``force`` is set.
+
+        Returns:
+            Names of the criteria that were (re)loaded
+        """
+        if self._criteria_store is None:
+            return []
+        loaded, removed = self._criteria_store.refresh(force=force)
+        for name in removed:
+            # A Python criteria registered under the same name stays
+            if isinstance(self.criteria.get(name), DeclarativeCriteria):
+                del self.criteria[name]
+                logger.info(f"Removed declarative criteria: {name}")
+        for criteria in loaded:
+            self.register_criteria(criteria)
+        return [criteria.name for criteria in loaded]
 
     def _discover_and_register(self) -> None:
         """Discover and register all processors and criteria from specified modules."""
@@ -62,7 +244,7 @@ class ProcessorManager(IProcessorManager):
         """
         try:
             # Import the module
-            module = importlib.import_module(module_name)
+            module = self._import_module(module_name)
 
             # Check if it's a package and scan submodules
             if hasattr(module, "__path__"):
@@ -88,7 +270,7 @@ class ProcessorManager(IProcessorManager):
             getattr(package, "__path__", []), package_name + "."
         ):
             try:
-                module = importlib.import_module(modname)
+                module = self._import_module(modname)
                 self._discover_from_single_module(module)
             except Exception as e:
                 logger.warning(f"Failed to import submodule '{modname}': {e}")
@@ -194,15 +376,111 @@ class ProcessorManager(IProcessorManager):
         self.criteria[criteria.name] = criteria
         logger.debug(f"Registered criteria: {criteria.name}")
 
+    def _resolve_timeout(
+        self, component: Any, timeout: Optional[float]
+    ) -> Optional[float]:
+        """
+        Pick the effective deadline: request, then component, then manager default.
+
+        Returns:
+            Deadline in seconds, or None when no positive deadline applies
+        """
+        for candidate in (timeout, getattr(component, "timeout", None)):
+            if candidate is not None:
+                return candidate if candidate > 0 else None
+        if self.default_timeout and self.default_timeout > 0:
+            return self.default_timeout
+        return None
+
+    def _get_breaker(self, name: str) -> Optional[CircuitBreaker]:
+        if self.circuit_breaker is None:
+            return None
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, self.circuit_breaker)
+        return breaker
+
+    def _get_bulkhead(self, name: str, component: Any) -> Optional[Bulkhead]:
+        limit = getattr(component, "max_concurrency", None) or self.max_concurrency
+        if not limit or limit <= 0:
+            return None
+        bulkhead = self._bulkheads.get(name)
+        if bulkhead is None or bulkhead.max_concurrent != limit:
+            bulkhead = self._bulkheads[name] = Bulkhead(name, limit)
+        return bulkhead
+
+    @contextmanager
+    def _guarded(
+        self,
+        name: str,
+        component: Any,
+        unavailable: Callable[[str, Optional[float]], Exception],
+    ) -> Iterator[None]:
+        """
+        Run a call behind the component's bulkhead and circuit breaker.
+
+        Args:
+            name: Processor or criteria name
+            component: The processor or criteria checker
+            unavailable: Builds the fast-fail error from a reason and retry hint
+
+        Raises:
+            Exception: The ``unavailable`` error when the call is rejected
+        """
+        bulkhead = self._get_bulkhead(name, component)
+        breaker = self._get_breaker(name)
+        if bulkhead is not None and not bulkhead.try_acquire():
+            raise unavailable("bulkhead_full", None)
+        if breaker is not None and not breaker.allow():
+            if bulkhead is not None:
+                bulkhead.release()
+            raise unavailable("circuit_open", breaker.retry_after())
+
+        started = time.monotonic()
+        try:
+            yield
+        except Exception:
+            if breaker is not None:
+                breaker.record(time.monotonic() - started, failed=True)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record(time.monotonic() - started, failed=False)
+        finally:
+            if bulkhead is not None:
+                bulkhead.release()
+
     async def process_entity(
-        self, processor_name: str, entity: CyodaEntity, **kwargs: Any
+        self,
+        processor_name: str,
+        entity: CyodaEntity,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
     ) -> CyodaEntity:
         """
         Process an entity using the specified processor.
 
+        The processor runs under a deadline; when it passes, the processor task
+        is cancelled at its next await point and ProcessorTimeoutError is raised.
+        Processors with ``defer_validation`` run inside ``deferred_validation()``,
+        so entity classes with ``DEFER_VALIDATION`` get a single validation when
+        the processor returns instead of one per field assignment. When
+        micro-batching is enabled, concurrent calls for a processor that
+        implements ``process_batch`` are grouped and processed together; each
+        call keeps its own deadline, a call that times out before its batch
+        starts is left out of it, and the batch stops at its earliest deadline.
+        Calls are rejected up front while the processor's circuit is open or
+        its bulkhead is full.
+
         Args:
             processor_name: Name of the processor to use
             entity: The entity to process
+            timeout: Deadline in seconds propagated from the request, overriding
+                the processor and manager defaults (0 disables it)
             **kwargs: Additional processing parameters
 
         Returns:
@@ -210,34 +488,112 @@ class ProcessorManager(IProcessorManager):
 
         Raises:
             ProcessorNotFoundError: If the processor is not found
+            ProcessorTimeoutError: If the deadline passes
+            ProcessorUnavailableError: If the circuit is open or the bulkhead full
             ProcessorError: If processing fails
         """
-        if processor_name not in self.processors:
-            raise ProcessorNotFoundError(processor_name)
+        processor = self._get_processor(processor_name)
+        effective_timeout = self._resolve_timeout(processor, timeout)
 
-        processor = self.processors[processor_name]
+        def unavailable(reason: str, retry_after: Optional[float]) -> Exception:
+            return ProcessorUnavailableError(
+                processor_name, reason, retry_after, entity.entity_id
+            )
 
-        try:
-            return await processor.process(entity, **kwargs)
-        except Exception as e:
-            if isinstance(e, ProcessorError):
-                raise
-            raise ProcessorError(
-                processor_name=processor_name,
-                message=str(e),
-                original_error=e,
-                entity_id=entity.entity_id,
+        with self._guarded(processor_name, processor, unavailable):
+            try:
+                call = self._processor_call(
+                    processor, entity, effective_timeout, **kwargs
+                )
+                if effective_timeout is None:
+                    result = await call
+                else:
+                    result = await asyncio.wait_for(call, effective_timeout)
+                return result
+            except asyncio.TimeoutError:
+                self._timeouts[processor_name] += 1
+                logger.warning(
+                    f"Processor '{processor_name}' timed out after {effective_timeout}s "
+                    f"for entity {entity.entity_id}"
+                )
+                raise ProcessorTimeoutError(
+                    processor_name=processor_name,
+                    timeout=effective_timeout or 0.0,
+                    entity_id=entity.entity_id,
+                )
+            except Exception as e:
+                if isinstance(e, ProcessorError):
+                    raise
+                raise ProcessorError(
+                    processor_name=processor_name,
+                    message=str(e),
+                    original_error=e,
+                    entity_id=entity.entity_id,
+                )
+
+    def _processor_call(
+        self,
+        processor: CyodaProcessor,
+        entity: CyodaEntity,
+        timeout: Optional[float],
+        **kwargs: Any,
+    ) -> Awaitable[CyodaEntity]:
+        """Start a processor call, through the micro-batcher when it applies."""
+        if self._batcher is not None and processor.supports_batch and not kwargs:
+            return self._batcher.submit(
+                f"processor:{processor.name}",
+                entity,
+                lambda entities: self._run_processor_batch(processor, entities),
+                timeout,
+            )
+        return self._run_processor(processor, entity, **kwargs)
+
+    def _criteria_call(
+        self,
+        criteria: CyodaCriteriaChecker,
+        entity: CyodaEntity,
+        timeout: Optional[float],
+        **kwargs: Any,
+    ) -> Awaitable[Any]:
+        """Start a criteria check, through the micro-batcher when it applies."""
+        if self._batcher is not None and criteria.supports_batch and not kwargs:
+            return self._batcher.submit(
+                f"criteria:{criteria.name}", entity, criteria.check_batch, timeout
             )
+        return criteria.check(entity, **kwargs)
+
+    @staticmethod
+    async def _run_processor(
+        processor: CyodaProcessor, entity: CyodaEntity, **kwargs: Any
+    ) -> CyodaEntity:
+        with deferred_validation() if processor.defer_validation else nullcontext():
+            return await processor.process(entity, **kwargs)
+
+    @staticmethod
+    async def _run_processor_batch(
+        processor: CyodaProcessor, entities: List[CyodaEntity]
+    ) -> List[CyodaEntity]:
+        with deferred_validation() if processor.defer_validation else nullcontext():
+            return await processor.process_batch(entities)
 
     async def check_criteria(
-        self, criteria_name: str, entity: CyodaEntity, **kwargs: Any
+        self,
+        criteria_name: str,
+        entity: CyodaEntity,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
     ) -> bool:
         """
         Check if entity meets the specified criteria.
 
+        The check runs under the same deadline, micro-batching, circuit
+        breaker and bulkhead rules as process_entity.
+
         Args:
             criteria_name: Name of the criteria checker to use
             entity: The entity to check
+            timeout: Deadline in seconds propagated from the request, overriding
+                the criteria and manager defaults (0 disables it)
             **kwargs: Additional criteria parameters
 
         Returns:
@@ -245,57 +601,158 @@ class ProcessorManager(IProcessorManager):
 
         Raises:
             CriteriaNotFoundError: If the criteria checker is not found
+            CriteriaTimeoutError: If the deadline passes
+            CriteriaUnavailableError: If the circuit is open or the bulkhead full
             CriteriaError: If criteria checking fails
         """
-        if criteria_name not in self.criteria:
-            raise CriteriaNotFoundError(criteria_name)
-
-        criteria = self.criteria[criteria_name]
+        criteria = self._get_criteria(criteria_name)
+        effective_timeout = self._resolve_timeout(criteria, timeout)
 
-        try:
-            return await criteria.check(entity, **kwargs)
-        except Exception as e:
-            if isinstance(e, CriteriaError):
-                raise
-            raise CriteriaError(
-                criteria_name=criteria_name,
-                message=str(e),
-                original_error=e,
-                entity_id=entity.entity_id,
+        def unavailable(reason: str, retry_after: Optional[float]) -> Exception:
+            return CriteriaUnavailableError(
+                criteria_name, reason, retry_after, entity.entity_id
             )
 
+        with self._guarded(criteria_name, criteria, unavailable):
+            try:
+                call = self._criteria_call(
+                    criteria, entity, effective_timeout, **kwargs
+                )
+                if effective_timeout is None:
+                    return bool(await call)
+                return bool(await asyncio.wait_for(call, effective_timeout))
+            except asyncio.TimeoutError:
+                self._timeouts[criteria_name] += 1
+                logger.warning(
+                    f"Criteria '{criteria_name}' timed out after {effective_timeout}s "
+                    f"for entity {entity.entity_id}"
+                )
+                raise CriteriaTimeoutError(
+                    criteria_name=criteria_name,
+                    timeout=effective_timeout or 0.0,
+                    entity_id=entity.entity_id,
+                )
+            except Exception as e:
+                if isinstance(e, CriteriaError):
+                    raise
+                raise CriteriaError(
+                    criteria_name=criteria_name,
+                    message=str(e),
+                    original_error=e,
+                    entity_id=entity.entity_id,
+                )
+
+    def get_timeout_stats(self) -> Dict[str, int]:
+        """Get the number of timed-out requests per processor/criteria name."""
+        return dict(self._timeouts)
+
+    def get_resilience_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker and bulkhead state per processor/criteria name.
+
+        Returns:
+            Mapping of name to {"circuit": ..., "bulkhead": ...}; a part is
+            None when that protection is not active for the name
+        """
+        names = sorted(set(self._breakers) | set(self._bulkheads))
+        return {
+            name: {
+                "circuit": (
+                    self._breakers[name].get_stats() if name in self._breakers else None
+                ),
+                "bulkhead": (
+                    self._bulkheads[name].get_stats()
+                    if name in self._bulkheads
+                    else None
+                ),
+            }
+            for name in names
+        }
+
+    def reset_circuit(self, name: str) -> bool:
+        """
+        Close the circuit of a processor/criteria.
+
+        Returns:
+            True if the name had a circuit breaker
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            return False
+        breaker.reset()
+        return True
+
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """Get micro-batching statistics (empty when batching is disabled)."""
+        return self._batcher.get_stats() if self._batcher is not None else {}
+
     def list_processors(self) -> List[str]:
-        """List available processors."""
-        return list(self.processors.keys())
+        """List available processors (loaded and not yet loaded from the manifest)."""
+        return list(self.processors) + [
+            name for name in self._pending_processors if name not in self.processors
+        ]
 
     def list_criteria(self) -> List[str]:
-        """List available criteria."""
-        return list(self.criteria.keys())
+        """List available criteria (loaded and not yet loaded from the manifest)."""
+        return list(self.criteria) + [
+            name for name in self._pending_criteria if name not in self.criteria
+        ]
 
     def get_processor_info(self, processor_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a processor."""
-        if processor_name in self.processors:
-            return self.processors[processor_name].get_info()
-        return None
+        try:
+            return self._get_processor(processor_name).get_info()
+        except ProcessorNotFoundError:
+            return None
 
     def get_criteria_info(self, criteria_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a criteria checker."""
-        if criteria_name in self.criteria:
-            return self.criteria[criteria_name].get_info()
-        return None
+        try:
+            return self._get_criteria(criteria_name).get_info()
+        except CriteriaNotFoundError:
+            return None
+
+    def get_import_report(self) -> Dict[str, Any]:
+        """
+        Get the import-time report.
+
+        Returns:
+            Startup mode and duration, total import time, per-module import
+            times (slowest first) and loaded/pending component counts
+        """
+        return {
+            "mode": "manifest" if self.manifest is not None else "discovery",
+            "startup_seconds": self._startup_seconds,
+            "import_seconds": sum(self._import_times.values()),
+            "modules": dict(
+                sorted(self._import_times.items(), key=lambda i: i[1], reverse=True)
+            ),
+            "loaded": {
+                "processors": len(self.processors),
+                "criteria": len(self.criteria),
+            },
+            "pending": {
+                "processors": len(self._pending_processors),
+                "criteria": len(self._pending_criteria),
+            },
+        }
 
 
 # Global processor manager instance
 _processor_manager: Optional[ProcessorManager] = None
 
 
-def get_processor_manager(modules: Optional[List[str]] = None) -> ProcessorManager:
+def get_processor_manager(
+    modules: Optional[List[str]] = None, manifest_path: Optional[str] = None
+) -> ProcessorManager:
     """
     Get the global processor manager instance.
 
     Args:
         modules: List of module names to scan for processors and criteria.
                 If None and no global instance exists, uses default modules.
+        manifest_path: Processor manifest enabling lazy loading; defaults to
+                the PROCESSOR_MANIFEST setting (discovery when unset)
 
     Returns:
         The global processor manager instance
@@ -303,14 +760,58 @@ def get_processor_manager(modules: Optional[List[str]] = None) -> ProcessorManag
     global _processor_manager
 
     if _processor_manager is None:
+        from common.config.config import (
+            PROCESSOR_BATCH_WINDOW_MS,
+            PROCESSOR_CIRCUIT_FAILURE_RATE,
+            PROCESSOR_CIRCUIT_MIN_CALLS,
+            PROCESSOR_CIRCUIT_OPEN_SECONDS,
+            PROCESSOR_CIRCUIT_SLOW_CALL_SECONDS,
+            PROCESSOR_CIRCUIT_WINDOW_SIZE,
+            PROCESSOR_CRITERIA_PATHS,
+            PROCESSOR_CRITERIA_RELOAD_SECONDS,
+            PROCESSOR_DEFAULT_TIMEOUT_SECONDS,
+            PROCESSOR_MANIFEST,
+            PROCESSOR_MAX_BATCH_SIZE,
+            PROCESSOR_MAX_CONCURRENCY,
+        )
+
         # Use provided modules or default ones
         if modules is None:
-            modules = [
-                "application.processor",
-                "application.criterion",
-                "example_application.processor",
-                "example_application.criterion",
-            ]
-        _processor_manager = ProcessorManager(modules)
+            modules = list(DEFAULT_PROCESSOR_MODULES)
+
+        manifest: Optional[Dict[str, Any]] = None
+        manifest_path = manifest_path or PROCESSOR_MANIFEST
+        if manifest_path:
+            from .manifest import load_manifest
+
+            try:
+                manifest = load_manifest(manifest_path)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Ignoring processor manifest '{manifest_path}', "
+                    f"falling back to discovery: {e}"
+                )
+
+        _processor_manager = ProcessorManager(
+            modules,
+            default_timeout=PROCESSOR_DEFAULT_TIMEOUT_SECONDS,
+            manifest=manifest,
+            batch_window=PROCESSOR_BATCH_WINDOW_MS / 1000,
+            max_batch_size=PROCESSOR_MAX_BATCH_SIZE,
+            circuit_breaker=CircuitBreakerConfig(
+                failure_rate_threshold=PROCESSOR_CIRCUIT_FAILURE_RATE,
+                slow_call_seconds=PROCESSOR_CIRCUIT_SLOW_CALL_SECONDS,
+                window_size=PROCESSOR_CIRCUIT_WINDOW_SIZE,
+                minimum_calls=PROCESSOR_CIRCUIT_MIN_CALLS,
+                open_seconds=PROCESSOR_CIRCUIT_OPEN_SECONDS,
+            ),
+            max_concurrency=PROCESSOR_MAX_CONCURRENCY,
+            criteria_paths=[
+                path.strip()
+                for path in PROCESSOR_CRITERIA_PATHS.split(",")
+                if path.strip()
+            ],
+            criteria_reload_interval=PROCESSOR_CRITERIA_RELOAD_SECONDS,
+        )
 
     return _processor_manager
@@ -0,0 +1,114 @@
+"""
+Processor manifest: a build-time map of processor/criteria names to classes.
+
+Loading a manifest lets ProcessorManager skip package discovery at startup and
+import each processor only when it is first used. Generate it at build time:
+
+    python -m common.processor.manifest --output processor_manifest.json
+
+and point the PROCESSOR_MANIFEST setting at the file. Use ``--report`` to print
+the import-time report of a full discovery instead.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .manager import DEFAULT_PROCESSOR_MODULES, ProcessorManager
+
+MANIFEST_VERSION = 1
+
+
+def _target(component: Any) -> str:
+    component_class = type(component)
+    return f"{component_class.__module__}:{component_class.__qualname__}"
+
+
+def build_manifest(modules: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Discover processors and criteria and map their names to "module:Class".
+
+    Args:
+        modules: Modules to scan, defaults to the standard processor modules
+
+    Returns:
+        The manifest dictionary
+    """
+    modules = list(modules or DEFAULT_PROCESSOR_MODULES)
+    manager = ProcessorManager(modules)
+    return {
+        "version": MANIFEST_VERSION,
+        "modules": modules,
+        "processors": {
+            name: _target(processor)
+            for name, processor in sorted(manager.processors.items())
+        },
+        "criteria": {
+            name: _target(criteria)
+            for name, criteria in sorted(manager.criteria.items())
+        },
+    }
+
+
+def write_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    """Write a manifest as JSON."""
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """
+    Load a manifest written by ``write_manifest``.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a manifest of a supported version
+    """
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported processor manifest format in {path}")
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate the processor manifest used for lazy processor loading"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default="processor_manifest.json",
+        help="Manifest file to write (default: processor_manifest.json)",
+    )
+    parser.add_argument(
+        "--module",
+        "-m",
+        action="append",
+        dest="modules",
+        help="Module to scan (repeatable, default: standard processor modules)",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print the discovery import-time report instead of writing a manifest",
+    )
+    args = parser.parse_args(argv)
+
+    if args.report:
+        manager = ProcessorManager(args.modules or list(DEFAULT_PROCESSOR_MODULES))
+        print(json.dumps(manager.get_import_report(), indent=2))
+        return 0
+
+    manifest = build_manifest(args.modules)
+    write_manifest(args.output, manifest)
+    print(
+        f"Wrote {len(manifest['processors'])} processors and "
+        f"{len(manifest['criteria'])} criteria to {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Processor pipelines: several processors and criteria behind one processor name.
+
+Each processor configured on a workflow transition costs a calc round-trip
+through Cyoda: the entity is serialized, sent, parsed and validated again for
+every step. A pipeline runs the steps in-process instead, handing the typed
+entity from stage to stage, so a multi-step transition needs one calc request
+and one response.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from common.entity.cyoda_entity import CyodaEntity, deferred_validation
+
+from .base import CyodaCriteriaChecker, CyodaProcessor
+from .errors import ProcessorError
+
+logger = logging.getLogger(__name__)
+
+PipelineStage = Union[CyodaProcessor, CyodaCriteriaChecker]
+
+
+class _StageStats:
+    """Timing counters for one pipeline stage."""
+
+    __slots__ = ("calls", "failures", "stops", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.stops = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, duration: float) -> None:
+        self.calls += 1
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "stops": self.stops,
+            "avg_ms": self.total_seconds / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+        }
+
+
+class ProcessorPipeline(CyodaProcessor):
+    """
+    Processor that runs a sequence of processors and criteria on one entity.
+
+    Processor stages transform the entity in order. Criteria stages act as
+    guards: when a check returns False the remaining stages are skipped and
+    the entity is returned as processed so far. Subclass it with a no-argument
+    constructor to have it discovered like any other processor::
+
+        class OrderPipeline(ProcessorPipeline):
+            def __init__(self) -> None:
+                super().__init__(
+                    name="OrderPipeline",
+                    stages=[ValidateOrder(), IsPaidCriterion(), ShipOrder()],
+                )
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stages: Sequence[PipelineStage],
+        description: str = "",
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            name: Unique name for the pipeline processor
+            stages: Processors and criteria checkers, run in order
+            description: Human-readable description of the pipeline
+            timeout: Deadline in seconds for the whole pipeline
+
+        Raises:
+            ValueError: If there are no stages, a stage has the wrong type or
+                two stages share a name
+        """
+        super().__init__(name=name, description=description, timeout=timeout)
+        if not stages:
+            raise ValueError(f"Pipeline '{name}' needs at least one stage")
+        names = set()
+        for stage in stages:
+            if not isinstance(stage, (CyodaProcessor, CyodaCriteriaChecker)):
+                raise ValueError(
+                    f"Pipeline '{name}' stage {stage!r} is not a processor or criteria"
+                )
+            if stage.name in names:
+                raise ValueError(
+                    f"Pipeline '{name}' has duplicate stage '{stage.name}'"
+                )
+            names.add(stage.name)
+        self.stages: List[PipelineStage] = list(stages)
+        self._stage_stats = {stage.name: _StageStats() for stage in self.stages}
+
+    async def process(self, entity: CyodaEntity, **kwargs: Any) -> CyodaEntity:
+        """
+        Run the stages on the entity.
+
+        Args:
+            entity: The entity to process
+            **kwargs: Additional parameters passed to every stage
+
+        Returns:
+            The processed entity
+
+        Raises:
+            ProcessorError: If a stage fails; ``context["stage"]`` names it
+        """
+        for stage in self.stages:
+            stats = self._stage_stats[stage.name]
+            started = time.perf_counter()
+            try:
+                if isinstance(stage, CyodaProcessor):
+                    entity = await self._run_processor_stage(stage, entity, **kwargs)
+                    passed = True
+                else:
+                    passed = await stage.check(entity, **kwargs)
+            except Exception as e:
+                stats.failures += 1
+                stats.record(time.perf_counter() - started)
+                raise ProcessorError(
+                    processor_name=self.name,
+                    message=f"stage '{stage.name}' failed: {e}",
+                    original_error=e,
+                    entity_id=entity.entity_id,
+                    context={"stage": stage.name},
+                )
+            stats.record(time.perf_counter() - started)
+            if not passed:
+                stats.stops += 1
+                logger.info(
+                    f"Pipeline '{self.name}' stopped at criteria '{stage.name}' "
+                    f"for entity {entity.entity_id}"
+                )
+                break
+        return entity
+
+    @staticmethod
+    async def _run_processor_stage(
+        stage: CyodaProcessor, entity: CyodaEntity, **kwargs: Any
+    ) -> CyodaEntity:
+        """Run a processor stage, validating deferred assignments before the next stage."""
+        if not stage.defer_validation:
+            return await stage.process(entity, **kwargs)
+        with deferred_validation():
+            return await stage.process(entity, **kwargs)
+
+    def get_stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-stage timing.
+
+        Returns:
+            Stage name -> calls, failures, stops (criteria returning False),
+            average and maximum duration in milliseconds
+        """
+        return {name: stats.to_dict() for name, stats in self._stage_stats.items()}
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get information about this pipeline and its stages.
+
+        Returns:
+            Dictionary containing pipeline information and per-stage timing
+        """
+        info = super().get_info()
+        stage_stats = self.get_stage_stats()
+        info["stages"] = [
+            {
+                "name": stage.name,
+                "kind": (
+                    "processor" if isinstance(stage, CyodaProcessor) else "criteria"
+                ),
+                **stage_stats[stage.name],
+            }
+            for stage in self.stages
+        ]
+        return info
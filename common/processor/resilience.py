@@ -0,0 +1,250 @@
+"""
+Circuit breakers and bulkheads for processors and criteria checkers.
+
+A processor whose downstream dependency is failing would otherwise be invoked
+for every calc request, each one spending its full deadline before erroring.
+The circuit breaker watches a rolling window of recent calls and, once too many
+fail or run slow, rejects calls immediately for a cool-down period before
+letting a few probe calls through. The bulkhead caps the number of concurrent
+calls per processor so one slow processor cannot absorb every worker.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Circuit breaker thresholds.
+
+    Attributes:
+        failure_rate_threshold: Failed share of the window that opens the
+            circuit (0 disables failure-rate tripping)
+        slow_call_seconds: Calls taking at least this long count as slow
+            (0 disables latency tripping)
+        slow_call_rate_threshold: Slow share of the window that opens the circuit
+        window_size: Number of most recent calls evaluated
+        minimum_calls: Calls needed in the window before the circuit can open
+        open_seconds: Time the circuit stays open before probing
+        half_open_max_calls: Probe calls allowed while half-open; all of them
+            must succeed to close the circuit
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 0.0
+    slow_call_rate_threshold: float = 1.0
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_rate_threshold > 0 or self.slow_call_seconds > 0
+
+
+class CircuitBreaker:
+    """Failure-rate and latency based circuit breaker for one processor."""
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Processor or criteria name, used in logs
+            config: Thresholds
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.name = name
+        self.config = config
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        # (failed, slow) per recent call while closed
+        self._window: Deque[Tuple[bool, bool]] = deque(
+            maxlen=max(1, config.window_size)
+        )
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its cool-down passed."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.config.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> Optional[float]:
+        """Seconds until an open circuit starts probing, None when not open."""
+        if self.state is not CircuitState.OPEN:
+            return None
+        return max(0.0, self._opened_at + self.config.open_seconds - self._clock())
+
+    def allow(self) -> bool:
+        """
+        Ask permission for a call.
+
+        Every permitted call must be followed by ``record`` or ``abandon``.
+
+        Returns:
+            False if the call must fail fast
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._probes_in_flight + self._probe_successes
+            < self.config.half_open_max_calls
+        ):
+            self._probes_in_flight += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def record(self, duration: float, failed: bool) -> None:
+        """
+        Record the outcome of a permitted call.
+
+        Args:
+            duration: Call duration in seconds
+            failed: Whether the call raised
+        """
+        slow = 0 < self.config.slow_call_seconds <= duration
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if failed or slow:
+                self._open()
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.config.half_open_max_calls:
+                    self._transition(CircuitState.CLOSED)
+            return
+        if self._state is CircuitState.OPEN:
+            # Late result of a call started before the circuit opened
+            return
+
+        self._window.append((failed, slow))
+        if self._should_open():
+            self._open()
+
+    def abandon(self) -> None:
+        """Release a permitted call that was cancelled before finishing."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _should_open(self) -> bool:
+        calls = len(self._window)
+        if calls < max(1, self.config.minimum_calls):
+            return False
+        failures = sum(1 for failed, _slow in self._window if failed)
+        slow_calls = sum(1 for _failed, slow in self._window if slow)
+        threshold = self.config.failure_rate_threshold
+        if threshold > 0 and failures / calls >= threshold:
+            return True
+        return (
+            self.config.slow_call_seconds > 0
+            and slow_calls / calls >= self.config.slow_call_rate_threshold
+        )
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._times_opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is not self._state:
+            logger.warning(
+                f"Circuit for '{self.name}' {self._state.value} -> {state.value}"
+            )
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state is not CircuitState.OPEN:
+            self._window.clear()
+
+    def reset(self) -> None:
+        """Close the circuit and forget recorded calls."""
+        self._transition(CircuitState.CLOSED)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the circuit state and counters."""
+        calls = len(self._window)
+        return {
+            "state": self.state.value,
+            "window_calls": calls,
+            "failure_rate": (
+                sum(1 for failed, _ in self._window if failed) / calls if calls else 0.0
+            ),
+            "slow_call_rate": (
+                sum(1 for _, slow in self._window if slow) / calls if calls else 0.0
+            ),
+            "rejected": self._rejected,
+            "times_opened": self._times_opened,
+            "retry_after_seconds": self.retry_after(),
+        }
+
+
+class Bulkhead:
+    """Concurrency cap for one processor; calls over the cap fail fast."""
+
+    def __init__(self, name: str, max_concurrent: int) -> None:
+        """
+        Initialize the bulkhead.
+
+        Args:
+            name: Processor or criteria name
+            max_concurrent: Maximum number of calls in flight
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self._active = 0
+        self._peak = 0
+        self._rejected = 0
+
+    def try_acquire(self) -> bool:
+        """Take a slot, returning False when the bulkhead is full."""
+        if self._active >= self.max_concurrent:
+            self._rejected += 1
+            return False
+        self._active += 1
+        self._peak = max(self._peak, self._active)
+        return True
+
+    def release(self) -> None:
+        """Return a slot taken with try_acquire."""
+        self._active = max(0, self._active - 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bulkhead usage counters."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "peak": self._peak,
+            "rejected": self._rejected,
+        }
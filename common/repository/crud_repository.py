@@ -7,7 +7,7 @@ following repository pattern best practices.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, TypeVar
 
 # Generic type for entity
 T = TypeVar("T")
@@ -223,6 +223,26 @@ class CrudRepository(ABC, Generic[T]):
                 results.append(entity)
         return results
 
+    async def iter_all(
+        self, meta: Dict[str, Any], page_size: int
+    ) -> AsyncIterator[List[T]]:
+        """
+        Iterate over all entities of a specific model, one page at a time.
+
+        Repositories with a paged API should override this so only one page is
+        held in memory; the default pages through ``find_all``.
+
+        Args:
+            meta: Metadata containing entity model information
+            page_size: Maximum number of entities per page
+
+        Yields:
+            Pages of entities
+        """
+        entities = await self.find_all(meta)
+        for start in range(0, len(entities), max(1, page_size)):
+            yield entities[start : start + page_size]
+
     async def delete_all(self, meta: Dict[str, Any]) -> None:
         """
         Delete all entities of a specific model.
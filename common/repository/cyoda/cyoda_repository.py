@@ -10,8 +10,9 @@ import json
 import logging
 import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, cast
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, cast
+from urllib.parse import quote
 
 from common.config.config import CYODA_ENTITY_TYPE_EDGE_MESSAGE
 from common.config.conts import (
@@ -28,6 +29,25 @@ logger = logging.getLogger(__name__)
 _edge_messages_cache: Dict[str, Any] = {}
 
 
+def _point_in_time_param(point_in_time: datetime) -> str:
+    """
+    Format a point in time as a pointInTime query parameter.
+
+    Aware datetimes are sent in UTC with a ``Z`` suffix, and the value is
+    URL-encoded so an offset's ``+`` is not decoded as a space.
+
+    Args:
+        point_in_time: Point in time to read at
+
+    Returns:
+        Query parameter, e.g. ``pointInTime=2025-01-02T03:04:05Z``
+    """
+    if point_in_time.tzinfo is not None:
+        point_in_time = point_in_time.astimezone(timezone.utc)
+    pit_str = point_in_time.isoformat().replace("+00:00", "Z")
+    return f"pointInTime={quote(pit_str, safe=':')}"
+
+
 class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
     """
     Thread-safe singleton repository for interacting with the Cyoda API.
@@ -76,6 +96,17 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
                     return str(ids[0])
         return None
 
+    @staticmethod
+    def _extract_technical_ids_from_result(result: Any) -> List[str]:
+        """Extract every technical ID from a Cyoda 'json' result payload."""
+        ids: List[str] = []
+        if isinstance(result, list):
+            for entry in result:
+                entity_ids = entry.get("entityIds") if isinstance(entry, dict) else None
+                if isinstance(entity_ids, list):
+                    ids.extend(str(i) for i in entity_ids if i is not None)
+        return ids
+
     @staticmethod
     def _coerce_list_of_dicts(value: Any) -> List[Dict[str, Any]]:
         """Return a list of dicts or an empty list if shape isn't as expected."""
@@ -152,17 +183,19 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         # Build path with optional point_in_time parameter
         path = f"entity/{entity_id}"
         if point_in_time:
-            # Format datetime to ISO 8601 format
-            pit_str = point_in_time.isoformat()
-            path = f"{path}?pointInTime={pit_str}"
+            path = f"{path}?{_point_in_time_param(point_in_time)}"
 
         resp = await send_cyoda_request(
             cyoda_auth_service=self._cyoda_auth_service, method="get", path=path
         )
 
-        # Handle 404 responses (entity not found)
+        # Handle 404 responses (entity not found); any other failure is an error
         if resp.get("status") == 404:
             return None
+        if resp.get("status") != 200:
+            raise Exception(
+                f"Failed to get entity {entity_id}: status {resp.get('status')}"
+            )
 
         payload = resp.get("json", {})
         if not isinstance(payload, dict):
@@ -188,6 +221,53 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         json_data = resp.get("json", [])
         return json_data if isinstance(json_data, list) else []
 
+    async def iter_all(
+        self, meta: Dict[str, Any], page_size: int
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Find all entities of a model page by page using Cyoda's pageSize/pageNumber.
+
+        Every page is read at the point in time the iteration started, so
+        entities created or deleted meanwhile do not shift the page offsets.
+
+        Raises:
+            Exception: If Cyoda answers a page with a status other than 200/404
+        """
+        page_size = max(1, page_size)
+        base_path = (
+            f"entity/{meta['entity_model']}/{meta['entity_version']}"
+            f"?{_point_in_time_param(datetime.now(timezone.utc))}"
+        )
+        page_number = 0
+        previous_ids: List[Any] = []
+        while True:
+            resp: Dict[str, Any] = await send_cyoda_request(
+                cyoda_auth_service=self._cyoda_auth_service,
+                method="get",
+                path=f"{base_path}&pageSize={page_size}&pageNumber={page_number}",
+            )
+            if resp.get("status") == 404:
+                return
+            if resp.get("status") != 200:
+                raise Exception(
+                    f"Failed to read page {page_number} of {meta['entity_model']}: "
+                    f"status {resp.get('status')}"
+                )
+            page = self._ensure_technical_id_on_entities(
+                self._coerce_list_of_dicts(resp.get("json", []))
+            )
+            ids = [entity.get("technical_id") for entity in page]
+            # Paging ignored: the previous page comes back for the next page number
+            if page and ids == previous_ids:
+                return
+            previous_ids = ids
+            if page:
+                yield page
+            # A short page is the last one; a long one means paging was ignored
+            if len(page) != page_size:
+                return
+            page_number += 1
+
     async def find_all_by_criteria(
         self,
         meta: Dict[str, Any],
@@ -200,8 +280,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
 
         # Add point_in_time parameter if provided
         if point_in_time:
-            pit_str = point_in_time.isoformat()
-            search_path = f"{search_path}?pointInTime={pit_str}"
+            search_path = f"{search_path}?{_point_in_time_param(point_in_time)}"
 
         # Convert criteria to Cyoda-native format if needed
         search_criteria: Dict[str, Any] = self._ensure_cyoda_format(criteria)
@@ -405,6 +484,22 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
         result = resp.get("json", [])
         return self._extract_technical_id_from_result(result)
 
+    async def save_all_ids(
+        self, meta: Dict[str, Any], entities: List[Any]
+    ) -> List[str]:
+        """Save multiple entities in one request and return all of their IDs."""
+        data = json.dumps(entities, default=custom_serializer)
+        path = f"entity/JSON/{meta['entity_model']}/{meta['entity_version']}"
+        resp: Dict[str, Any] = await send_cyoda_request(
+            cyoda_auth_service=self._cyoda_auth_service,
+            method="post",
+            path=path,
+            data=data,
+        )
+        if resp.get("status") != 200:
+            raise Exception(f"Cyoda batch save failed: {resp.get('json')}")
+        return self._extract_technical_ids_from_result(resp.get("json", []))
+
     async def update(
         self, meta: Dict[str, Any], technical_id: Any, entity: Optional[Any] = None
     ) -> Optional[str]:
@@ -528,8 +623,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
 
         # Add point_in_time parameter if provided
         if point_in_time:
-            pit_str = point_in_time.isoformat()
-            path = f"{path}?pointInTime={pit_str}"
+            path = f"{path}?{_point_in_time_param(point_in_time)}"
 
         resp: Dict[str, Any] = await send_cyoda_request(
             cyoda_auth_service=self._cyoda_auth_service, method="get", path=path
@@ -574,8 +668,7 @@ class CyodaRepository(CrudRepository[Any]):  # type: ignore[type-arg]
 
         # Add point_in_time parameter if provided
         if point_in_time:
-            pit_str = point_in_time.isoformat()
-            path = f"{path}?pointInTime={pit_str}"
+            path = f"{path}?{_point_in_time_param(point_in_time)}"
 
         resp: Dict[str, Any] = await send_cyoda_request(
             cyoda_auth_service=self._cyoda_auth_service, method="get", path=path
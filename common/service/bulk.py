@@ -0,0 +1,273 @@
+"""
+Bulk entity writes with per-item results.
+
+Ingest jobs that send one entity per request pay the request overhead (auth,
+validation, a Cyoda round-trip) for every entity. BulkWriter takes many items
+at once: creates go through EntityService.save_all, one batch request per
+chunk, while updates and transitions run concurrently within a chunk through
+a unit of work. Every item gets its own result, so one bad item does not fail
+the others:
+
+    writer = BulkWriter(entity_service, ExampleEntity.ENTITY_NAME, "1")
+    results = await run_bulk(items, parse=validate_item, write=writer.save)
+    return summarize(results)
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import ValidationError
+
+from common.config.config import BULK_CHUNK_SIZE, BULK_MAX_CONCURRENCY
+from common.service.service import BatchSaveMismatchError
+from common.service.unit_of_work import UnitOfWork, UnitOfWorkError
+
+if TYPE_CHECKING:
+    from common.service.entity_service import EntityService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# (request index, payload) pairs; the index is reported back in the results
+Indexed = Sequence[Tuple[int, T]]
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of one bulk item."""
+
+    index: int
+    success: bool
+    id: Optional[str] = None
+    error: Optional[str] = None
+    # True when the write may have happened but could not be confirmed
+    unknown: Optional[bool] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+class BulkUpdate(NamedTuple):
+    """An update by technical id, optionally triggering a transition."""
+
+    entity_id: str
+    entity: Dict[str, Any]
+    transition: Optional[str] = None
+
+
+class BulkTransition(NamedTuple):
+    """A workflow transition by technical id."""
+
+    entity_id: str
+    transition: str
+
+
+class BulkWriter:
+    """Writes chunks of indexed items through an entity service."""
+
+    def __init__(
+        self,
+        entity_service: "EntityService",
+        entity_class: str,
+        entity_version: str = "1",
+        max_concurrency: int = BULK_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            entity_service: Service the writes are executed against
+            entity_class: Entity class/model name
+            entity_version: Entity model version
+            max_concurrency: Updates or transitions in flight at once
+        """
+        self._entity_service = entity_service
+        self._entity_class = entity_class
+        self._entity_version = entity_version
+        self._max_concurrency = max_concurrency
+
+    async def save(self, items: Indexed[Dict[str, Any]]) -> List[BulkItemResult]:
+        """
+        Create a chunk of entities with one batch save.
+
+        The batch either succeeds or fails as a whole, so a failure is
+        reported on every item of the chunk. When Cyoda answers with the wrong
+        number of IDs, the entities may exist already; the items are then
+        reported as unknown rather than failed, so they are not blindly retried
+        into duplicates.
+
+        Args:
+            items: (index, entity data) pairs
+
+        Returns:
+            One result per item
+        """
+        try:
+            responses = await self._entity_service.save_all(
+                [entity for _, entity in items],
+                self._entity_class,
+                self._entity_version,
+            )
+        except BatchSaveMismatchError as e:
+            logger.warning(
+                f"Bulk save of {len(items)} {self._entity_class} has an unknown "
+                f"outcome: {e}; returned IDs: {e.ids}"
+            )
+            return [
+                BulkItemResult(index, False, error=str(e), unknown=True)
+                for index, _ in items
+            ]
+        except Exception as e:
+            logger.warning(
+                f"Bulk save of {len(items)} {self._entity_class} failed: {e}"
+            )
+            return [BulkItemResult(index, False, error=str(e)) for index, _ in items]
+        return [
+            BulkItemResult(index, True, id=response.get_id())
+            for (index, _), response in zip(items, responses)
+        ]
+
+    async def update(self, items: Indexed[BulkUpdate]) -> List[BulkItemResult]:
+        """
+        Update a chunk of entities concurrently.
+
+        Args:
+            items: (index, update) pairs
+
+        Returns:
+            One result per item
+        """
+        uow = self._entity_service.unit_of_work(self._max_concurrency)
+        for _, update in items:
+            uow.update(
+                update.entity_id,
+                update.entity,
+                self._entity_class,
+                transition=update.transition,
+                entity_version=self._entity_version,
+            )
+        return await self._flush(uow, items)
+
+    async def transition(self, items: Indexed[BulkTransition]) -> List[BulkItemResult]:
+        """
+        Run a chunk of workflow transitions concurrently.
+
+        Args:
+            items: (index, transition) pairs
+
+        Returns:
+            One result per item
+        """
+        uow = self._entity_service.unit_of_work(self._max_concurrency)
+        for _, item in items:
+            uow.transition(
+                item.entity_id,
+                item.transition,
+                self._entity_class,
+                self._entity_version,
+            )
+        return await self._flush(uow, items)
+
+    @staticmethod
+    async def _flush(uow: UnitOfWork, items: Indexed[Any]) -> List[BulkItemResult]:
+        errors: Dict[int, Exception] = {}
+        try:
+            responses = await uow.flush()
+        except UnitOfWorkError as e:
+            responses = e.results
+            errors = {position: error for position, _, error in e.errors}
+        return [
+            (
+                BulkItemResult(index, False, error=str(errors[position]))
+                if position in errors
+                else BulkItemResult(index, True, id=responses[position].get_id())
+            )
+            for position, (index, _) in enumerate(items)
+        ]
+
+
+def _describe(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error)
+
+
+async def run_bulk(
+    items: AsyncIterable[Tuple[int, Any]],
+    parse: Callable[[Any], T],
+    write: Callable[[Indexed[T]], Awaitable[List[BulkItemResult]]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[BulkItemResult]:
+    """
+    Validate items as they arrive and write them in chunks.
+
+    Items are validated in a single pass; invalid ones are reported without
+    being written and do not hold up the rest of their chunk.
+
+    Args:
+        items: (index, raw item) pairs, e.g. decoded from an array or NDJSON;
+            an exception in place of the item marks an undecodable one
+        parse: Validates a raw item into the payload for ``write``; raises
+            ValueError (including pydantic's ValidationError) when invalid
+        write: Writes one chunk, e.g. a BulkWriter method
+        chunk_size: Valid items per write
+
+    Returns:
+        One result per item, in index order
+    """
+    results: List[BulkItemResult] = []
+    pending: List[Tuple[int, T]] = []
+    async for index, item in items:
+        try:
+            if isinstance(item, Exception):
+                raise item
+            pending.append((index, parse(item)))
+        except ValueError as e:
+            results.append(BulkItemResult(index, False, error=_describe(e)))
+            continue
+        if len(pending) >= chunk_size:
+            results.extend(await write(pending))
+            pending = []
+    if pending:
+        results.extend(await write(pending))
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def summarize(results: Sequence[BulkItemResult]) -> Dict[str, Any]:
+    """
+    Build a bulk response body.
+
+    Args:
+        results: Per-item results
+
+    Returns:
+        Totals and the per-item results as plain dicts
+    """
+    succeeded = sum(1 for result in results if result.success)
+    unknown = sum(1 for result in results if result.unknown)
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded - unknown,
+        "unknown": unknown,
+        "results": [result.to_dict() for result in results],
+    }
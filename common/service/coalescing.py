@@ -0,0 +1,142 @@
+"""
+Single-flight coalescing of identical concurrent reads.
+
+When several callers ask for the same entity or run the same search at the
+same moment, only the first one reaches the repository; the others wait for
+its result. Writes evict the in-flight reads they may affect, so a read issued
+after a write never joins a flight that started before it. Results are plain JSON-like data, so each waiter receives its own
+copy of the containers and can modify it without affecting the other callers.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def read_key(
+    operation: str,
+    entity_class: str,
+    entity_version: str,
+    target: Any = None,
+    point_in_time: Any = None,
+) -> Tuple[Hashable, ...]:
+    """
+    Build the coalescing key of a read.
+
+    Args:
+        operation: Repository operation name
+        entity_class: Entity class/model name
+        entity_version: Entity model version
+        target: Entity ID or search criteria; criteria are serialized with
+            sorted keys so equal criteria give equal keys
+        point_in_time: Point in time of a temporal read; aware datetimes are
+            converted to UTC so one instant gives one key
+
+    Returns:
+        Hashable key identifying the read
+    """
+    if not isinstance(target, Hashable):
+        target = json.dumps(target, sort_keys=True, default=str)
+    if isinstance(point_in_time, datetime):
+        if point_in_time.tzinfo is not None:
+            point_in_time = point_in_time.astimezone(timezone.utc)
+        point_in_time = point_in_time.isoformat()
+    elif point_in_time is not None:
+        point_in_time = str(point_in_time)
+    return (operation, entity_class, entity_version, target, point_in_time)
+
+
+def copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like value; other values are shared."""
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self, copy: Callable[[Any], Any] = copy_json) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            copy: Function giving a waiter its own copy of the shared result
+        """
+        self._copy = copy
+        self._in_flight: Dict[Tuple[Any, Hashable], "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.evicted = 0
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fetch`` unless an identical call is already in flight.
+
+        The call runs as its own task, so a caller that is cancelled does not
+        cancel it for the others. Failures are shared with the waiters and are
+        not remembered: the next call after a failure runs again.
+
+        Args:
+            key: Key identifying the call, e.g. from read_key()
+            fetch: Coroutine factory performing the call
+
+        Returns:
+            The call result; waiters receive a copy of it
+        """
+        self.calls += 1
+        # Tasks belong to one event loop, so calls only coalesce within a loop
+        flight_key = (asyncio.get_running_loop(), key)
+        task: Optional["asyncio.Future[Any]"] = self._in_flight.get(flight_key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"Coalescing read {key}")
+            return self._copy(await asyncio.shield(task))
+
+        self.executed += 1
+        task = asyncio.ensure_future(fetch())
+        self._in_flight[flight_key] = task
+        task.add_done_callback(lambda done: self._finish(flight_key, done))
+        return await asyncio.shield(task)
+
+    def evict(self, match: Callable[[Hashable], bool]) -> None:
+        """
+        Stop sharing in-flight calls whose key matches.
+
+        Callers already waiting on such a call still get its result; later
+        callers start a new call instead of joining it.
+
+        Args:
+            match: Predicate on the keys passed to do()
+        """
+        stale = [flight_key for flight_key in self._in_flight if match(flight_key[1])]
+        for flight_key in stale:
+            del self._in_flight[flight_key]
+        self.evicted += len(stale)
+
+    def _finish(
+        self, flight_key: Tuple[Any, Hashable], task: "asyncio.Future[Any]"
+    ) -> None:
+        if self._in_flight.get(flight_key) is task:
+            del self._in_flight[flight_key]
+        if not task.cancelled():
+            # Mark as retrieved in case every caller was cancelled
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call counts and the share of calls served by another caller's read."""
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "evicted": self.evicted,
+            "coalesced_ratio": self.coalesced / self.calls if self.calls else 0.0,
+        }
@@ -0,0 +1,103 @@
+"""
+Validation of Cyoda-native search conditions.
+
+Conditions already in Cyoda's format (``group``, ``simple`` and ``lifecycle``
+conditions, groups nested to any depth) are checked against a JSON schema and
+then forwarded to the repository as they are, instead of being decomposed into
+a flat SearchConditionRequest and rebuilt. The schema validator is built once
+and reused for every search.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict
+
+import jsonschema
+from jsonschema import Draft202012Validator
+
+from common.service.entity_service import CyodaOperator
+
+CONDITION_TYPES = ("group", "simple", "lifecycle")
+
+CYODA_CONDITION_SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$ref": "#/$defs/condition",
+    "$defs": {
+        # Dispatch on "type" so errors point at the failing field
+        "condition": {
+            "type": "object",
+            "properties": {"type": {"enum": list(CONDITION_TYPES)}},
+            "required": ["type"],
+            "allOf": [
+                {
+                    "if": {"properties": {"type": {"const": kind}}},
+                    "then": {"$ref": f"#/$defs/{kind}"},
+                }
+                for kind in CONDITION_TYPES
+            ],
+        },
+        "operatorType": {"enum": [op.value for op in CyodaOperator]},
+        "group": {
+            "type": "object",
+            "properties": {
+                "type": {"const": "group"},
+                "operator": {"enum": ["AND", "OR"]},
+                "conditions": {
+                    "type": "array",
+                    "items": {"$ref": "#/$defs/condition"},
+                },
+            },
+            "required": ["type", "operator", "conditions"],
+        },
+        "simple": {
+            "type": "object",
+            "properties": {
+                "type": {"const": "simple"},
+                "jsonPath": {"type": "string", "pattern": r"^\$"},
+                "operatorType": {"$ref": "#/$defs/operatorType"},
+            },
+            "required": ["type", "jsonPath", "operatorType"],
+        },
+        "lifecycle": {
+            "type": "object",
+            "properties": {
+                "type": {"const": "lifecycle"},
+                "field": {"type": "string", "minLength": 1},
+                "operatorType": {"$ref": "#/$defs/operatorType"},
+            },
+            "required": ["type", "field", "operatorType"],
+        },
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _validator() -> Draft202012Validator:
+    Draft202012Validator.check_schema(CYODA_CONDITION_SCHEMA)
+    return Draft202012Validator(CYODA_CONDITION_SCHEMA)
+
+
+def is_cyoda_condition(value: Any) -> bool:
+    """Check whether a value is meant as a Cyoda-native condition."""
+    return isinstance(value, dict) and value.get("type") in CONDITION_TYPES
+
+
+def validate_cyoda_condition(condition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a Cyoda-native condition and return it as a group.
+
+    Args:
+        condition: Group condition, or a single simple/lifecycle condition
+
+    Returns:
+        The condition itself if it is a group, otherwise an AND group holding it
+
+    Raises:
+        ValueError: If the condition does not match Cyoda's condition format
+    """
+    error = jsonschema.exceptions.best_match(_validator().iter_errors(condition))
+    if error is not None:
+        location = "/".join(str(part) for part in error.absolute_path) or "condition"
+        raise ValueError(f"Invalid Cyoda condition at {location}: {error.message}")
+    if condition["type"] == "group":
+        return condition
+    return {"type": "group", "operator": "AND", "conditions": [condition]}
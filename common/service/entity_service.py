@@ -11,11 +11,23 @@ FOR RETRIEVAL:
 - Use find_by_business_id() when you have a business identifier (e.g., "CART-123", "PAY-456")
 - Use find_all() to get all entities of a type (use sparingly, can be slow)
 - Use search() for complex queries with multiple conditions
+- Use search_page() to page through a search with cursors; pages are read at
+  the point in time of the first page and ordered by technical UUID. With
+  raw=True the page holds the stored entity documents without model parsing
+  (read-only endpoints that only re-serialize the result)
+- Use search_by_criteria() when the condition is already in Cyoda's format
+  (nested groups included); it is validated and forwarded untouched
+- Pass projection=["field", "$.nested.field"] to get_by_id()/find_all()/search()
+  when only a few fields are needed; model parsing is skipped for those reads
+- Use iter_all() to export all entities of a type page by page in constant memory
 
 FOR MUTATIONS:
 - Use save() for new entities
 - Use update() for existing entities with technical UUID
 - Use update_by_business_id() for existing entities with business identifier
+- Use unit_of_work() to queue several independent writes and flush them together
+- Use execute_transition() to move an entity through its workflow in one call;
+  it does not read the entity, so fetch it only if the new state is needed
 
 PERFORMANCE NOTES:
 - Technical UUID operations are fastest (direct lookup)
@@ -25,12 +37,23 @@ PERFORMANCE NOTES:
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 from common.entity.cyoda_entity import CyodaEntity
+from common.service.pagination import (
+    PageCursor,
+    encode_cursor,
+    keyset_page,
+    open_page,
+    query_fingerprint,
+    snapshot_time,
+)
+
+if TYPE_CHECKING:
+    from common.service.unit_of_work import UnitOfWork
 
 
 class SearchOperator(Enum):
@@ -201,6 +224,17 @@ class EntityResponse:
         return self.metadata.state
 
 
+@dataclass
+class SearchPage:
+    """One page of a cursor-paginated search."""
+
+    entities: List[EntityResponse]
+    next_cursor: Optional[str] = None  # None on the last page
+    total: int = 0  # Matching entities at the point in time of the search
+    # Unparsed entity documents of a raw page (entities is then empty)
+    items: List[Dict[str, Any]] = field(default_factory=list)
+
+
 @dataclass
 class SearchCondition:
     """Search condition for entity queries."""
@@ -280,6 +314,16 @@ class SearchConditionRequestBuilder:
         )
 
 
+def search_fingerprint(condition: SearchConditionRequest) -> str:
+    """Fingerprint the conditions of a search, ignoring its limit and offset."""
+    return query_fingerprint(
+        {
+            "operator": condition.operator,
+            "conditions": [asdict(c) for c in condition.conditions],
+        }
+    )
+
+
 class EntityService(ABC):
     """
     Simplified EntityService interface with clear method selection guidance.
@@ -294,7 +338,11 @@ class EntityService(ABC):
 
     @abstractmethod
     async def get_by_id(
-        self, entity_id: str, entity_class: str, entity_version: str = "1"
+        self,
+        entity_id: str,
+        entity_class: str,
+        entity_version: str = "1",
+        projection: Optional[List[str]] = None,
     ) -> Optional[EntityResponse]:
         """
         Get entity by technical UUID (FASTEST - use when you have the UUID).
@@ -303,6 +351,8 @@ class EntityService(ABC):
             entity_id: Technical UUID from EntityResponse.metadata.id
             entity_class: Entity class/model name
             entity_version: Entity model version
+            projection: JSON paths of the fields to return; the data is then a
+                plain dict holding only those fields instead of a model
 
         Returns:
             EntityResponse with entity and metadata, or None if not found
@@ -359,7 +409,10 @@ class EntityService(ABC):
 
     @abstractmethod
     async def find_all(
-        self, entity_class: str, entity_version: str = "1"
+        self,
+        entity_class: str,
+        entity_version: str = "1",
+        projection: Optional[List[str]] = None,
     ) -> List[EntityResponse]:
         """
         Get all entities of a type (SLOW - use sparingly).
@@ -367,6 +420,7 @@ class EntityService(ABC):
         Args:
             entity_class: Entity class/model name
             entity_version: Entity model version
+            projection: JSON paths of the fields to return (see get_by_id)
 
         Returns:
             List of EntityResponse with entities and metadata
@@ -396,6 +450,7 @@ class EntityService(ABC):
         entity_class: str,
         condition: SearchConditionRequest,
         entity_version: str = "1",
+        projection: Optional[List[str]] = None,
     ) -> List[EntityResponse]:
         """
         Search entities with complex conditions (SLOWEST - most flexible).
@@ -405,12 +460,149 @@ class EntityService(ABC):
             entity_class: Entity class/model name
             condition: Search condition (use SearchConditionRequest.builder())
             entity_version: Entity model version
+            projection: JSON paths of the fields to return (see get_by_id)
 
         Returns:
             List of EntityResponse with entities and metadata
         """
         pass
 
+    async def iter_all(
+        self, entity_class: str, entity_version: str = "1", page_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all entities of a type as pages of plain entity data.
+
+        Meant for exports: pages are yielded as they are read and entities are
+        not parsed into models. The default pages through ``find_all``.
+
+        Args:
+            entity_class: Entity class/model name
+            entity_version: Entity model version
+            page_size: Maximum number of entities per page
+
+        Yields:
+            Pages of entity data dictionaries
+        """
+        results = await self.find_all(entity_class, entity_version)
+        page_size = max(1, page_size)
+        for start in range(0, len(results), page_size):
+            yield [
+                r.data if isinstance(r.data, dict) else r.data.model_dump(by_alias=True)
+                for r in results[start : start + page_size]
+            ]
+
+    async def search_page(
+        self,
+        entity_class: str,
+        condition: SearchConditionRequest,
+        entity_version: str = "1",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        projection: Optional[List[str]] = None,
+        raw: bool = False,
+    ) -> SearchPage:
+        """
+        Get one page of a search, ordered by technical UUID.
+
+        The first page is read unpinned and records the point in time every
+        following page is read at, so concurrent writes do not show up
+        halfway through the search. Pass the returned ``next_cursor`` to get
+        the next page. The default pages through ``search`` and
+        ``search_at_time`` and ignores the projection.
+
+        A raw page returns the entity documents in ``items`` instead of
+        ``entities``, each with its ``technical_id``, for callers that only
+        serialize them again.
+
+        Args:
+            entity_class: Entity class/model name
+            condition: Search condition (use SearchConditionRequest.builder())
+            entity_version: Entity model version
+            limit: Maximum entities per page; defaults to the condition's limit,
+                and no limit returns all remaining entities
+            cursor: Cursor from the previous page, or None for the first page
+            projection: JSON paths of the fields to return (see get_by_id)
+            raw: Return entity documents in ``items`` instead of responses
+
+        Returns:
+            SearchPage with the entities and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another search
+        """
+        query = search_fingerprint(condition)
+        point_in_time, after = open_page(cursor, query)
+        if point_in_time is None:
+            results = await self.search(
+                entity_class,
+                replace(condition, limit=None, offset=None),
+                entity_version,
+            )
+        else:
+            results = await self.search_at_time(
+                entity_class, condition, point_in_time, entity_version
+            )
+        page, more = keyset_page(
+            results, EntityResponse.get_id, after, limit or condition.limit
+        )
+        next_cursor = (
+            encode_cursor(
+                PageCursor(page[-1].get_id(), snapshot_time(point_in_time), query)
+            )
+            if more
+            else None
+        )
+        if raw:
+            items = [
+                {
+                    **(
+                        r.data
+                        if isinstance(r.data, dict)
+                        else r.data.model_dump(by_alias=True)
+                    ),
+                    "technical_id": r.get_id(),
+                }
+                for r in page
+            ]
+            return SearchPage([], next_cursor, len(results), items)
+        return SearchPage(page, next_cursor, len(results))
+
+    @abstractmethod
+    async def search_by_criteria(
+        self,
+        entity_class: str,
+        criteria: Dict[str, Any],
+        entity_version: str = "1",
+        projection: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        """
+        Search entities with a Cyoda-native condition.
+
+        The condition is validated against Cyoda's condition format and sent
+        to the repository as it is, so nested groups are kept. Paging works as
+        in search_page() once a limit or cursor is given.
+
+        Args:
+            entity_class: Entity class/model name
+            criteria: Cyoda condition, e.g. {"type": "group", "operator": "AND",
+                "conditions": [...]}, or a single simple/lifecycle condition
+            entity_version: Entity model version
+            projection: JSON paths of the fields to return (see get_by_id)
+            limit: Maximum entities per page; all results when neither limit
+                nor cursor is given
+            cursor: Cursor from the previous page, or None for the first page
+
+        Returns:
+            SearchPage with the entities and the cursor of the next page
+
+        Raises:
+            ValueError: If the condition or cursor is malformed
+        """
+        pass
+
     # ========================================
     # PRIMARY MUTATION METHODS (Use These)
     # ========================================
@@ -523,6 +715,23 @@ class EntityService(ABC):
     # BATCH OPERATIONS (Use Sparingly)
     # ========================================
 
+    def unit_of_work(self, max_concurrency: int = 8) -> "UnitOfWork":
+        """
+        Create a unit of work for independent side-effect writes.
+
+        Queued saves, updates and deletes are flushed concurrently, and all
+        failures are reported together in a UnitOfWorkError.
+
+        Args:
+            max_concurrency: Maximum number of writes in flight at once
+
+        Returns:
+            A new UnitOfWork bound to this service
+        """
+        from common.service.unit_of_work import UnitOfWork
+
+        return UnitOfWork(self, max_concurrency=max_concurrency)
+
     @abstractmethod
     async def save_all(
         self,
@@ -596,7 +805,8 @@ class EntityService(ABC):
             entity_version: Entity model version
 
         Returns:
-            EntityResponse with updated entity and metadata
+            EntityResponse with the entity ID; the entity is not read, so call
+            get_by_id() afterwards when its new state is needed
         """
         pass
 
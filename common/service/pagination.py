@@ -0,0 +1,314 @@
+"""
+Keyset pagination for entity searches.
+
+A cursor is an opaque token carrying the technical ID of the last entity of a
+page, the point in time the first page was read at and a fingerprint of the
+search. The first page is read unpinned, so it sees everything Cyoda holds;
+every following page is read at the point in time recorded once the first
+page came back, so entities written meanwhile do not show up halfway through.
+Pages are ordered by technical ID so a page starts right after the previous
+one instead of counting and skipping the entities before it.
+
+The sorted result of a search is kept for the lifetime of its cursors in a
+SearchSnapshotCache, so following pages are sliced from it by binary search
+instead of reading and filtering the whole result again.
+"""
+
+import base64
+import bisect
+import hashlib
+import heapq
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or belongs to another search."""
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position of a page within a search."""
+
+    after: str  # Technical ID of the last entity of the previous page
+    point_in_time: datetime  # Snapshot all pages of the search are read at
+    query: str  # Fingerprint of the search the cursor belongs to
+
+
+def query_fingerprint(query: Any) -> str:
+    """
+    Fingerprint a search so a cursor cannot be replayed against another one.
+
+    Args:
+        query: JSON-like description of the search
+
+    Returns:
+        Short hex digest of the search
+    """
+    blob = json.dumps(query, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def encode_cursor(cursor: PageCursor) -> str:
+    """
+    Encode a page position as an opaque URL-safe token.
+
+    Args:
+        cursor: Page position
+
+    Returns:
+        Cursor token
+    """
+    payload = {
+        "a": cursor.after,
+        "t": cursor.point_in_time.isoformat(),
+        "q": cursor.query,
+    }
+    blob = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(blob).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> PageCursor:
+    """
+    Decode a cursor token.
+
+    Args:
+        token: Token from encode_cursor()
+
+    Returns:
+        Page position
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        blob = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(blob)
+        return PageCursor(
+            after=str(payload["a"]),
+            point_in_time=datetime.fromisoformat(payload["t"]),
+            query=str(payload["q"]),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def open_page(
+    cursor: Optional[str], query: str
+) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    Resolve where a page of a search starts.
+
+    Args:
+        cursor: Cursor token, or None for the first page
+        query: Fingerprint of the search from query_fingerprint()
+
+    Returns:
+        (point in time to read at, technical ID the page starts after); both
+        are None for the first page, which is read unpinned
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another search
+    """
+    if cursor is None:
+        return None, None
+    position = decode_cursor(cursor)
+    if position.query != query:
+        raise InvalidCursorError("Pagination cursor belongs to a different search")
+    return position.point_in_time, position.after
+
+
+def snapshot_time(point_in_time: Optional[datetime]) -> datetime:
+    """
+    Get the point in time following pages of a search are read at.
+
+    Call it after the page has been read: the first page was read unpinned,
+    so its snapshot is taken from the local clock once Cyoda has answered.
+
+    Args:
+        point_in_time: Point in time the page was read at, or None if unpinned
+
+    Returns:
+        Point in time to record in the next cursor
+    """
+    return point_in_time or datetime.now(timezone.utc)
+
+
+def keyset_page(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    after: Optional[str],
+    limit: Optional[int],
+) -> Tuple[List[T], bool]:
+    """
+    Select the page of items following a key, in key order.
+
+    Only the page is sorted, but every call still scans all items; use a
+    SearchSnapshot to page through one result repeatedly.
+
+    Args:
+        items: Items of the search
+        key: Sort key of an item (its technical ID)
+        after: Key the page starts after, or None for the first page
+        limit: Maximum number of items, or None for all remaining items
+
+    Returns:
+        (items of the page, whether more items follow)
+    """
+    remaining = [item for item in items if after is None or key(item) > after]
+    if limit is None or len(remaining) <= limit:
+        return sorted(remaining, key=key), False
+    return heapq.nsmallest(limit, remaining, key=key), True
+
+
+def entity_key(entity: Any) -> str:
+    """Get the pagination key of a repository entity dictionary."""
+    return str(entity.get("technical_id") or "") if isinstance(entity, dict) else ""
+
+
+class SearchSnapshot(Generic[T]):
+    """Result of a search sorted by pagination key, sliced page by page."""
+
+    def __init__(self, items: Iterable[T], key: Callable[[T], str]) -> None:
+        """
+        Sort the result once.
+
+        Args:
+            items: Items of the search
+            key: Sort key of an item (its technical ID)
+        """
+        self.items: List[T] = sorted(items, key=key)
+        self.keys: List[str] = [key(item) for item in self.items]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def page(self, after: Optional[str], limit: Optional[int]) -> Tuple[List[T], bool]:
+        """
+        Select the page following a key with a binary search.
+
+        Args:
+            after: Key the page starts after, or None for the first page
+            limit: Maximum number of items, or None for all remaining items
+
+        Returns:
+            (items of the page, whether more items follow)
+        """
+        start = 0 if after is None else bisect.bisect_right(self.keys, after)
+        end = len(self.items) if limit is None else min(start + limit, len(self.items))
+        return self.items[start:end], end < len(self.items)
+
+
+class SearchSnapshotCache:
+    """LRU cache of search snapshots, bounded by entity count and age."""
+
+    def __init__(
+        self,
+        max_entities: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entities: Maximum number of entities held across all snapshots
+            ttl_seconds: How long a snapshot is kept for its cursors
+            clock: Monotonic clock, injectable for tests
+
+        Raises:
+            ValueError: If max_entities is not positive
+        """
+        if max_entities <= 0:
+            raise ValueError("max_entities must be positive")
+        self.max_entities = max_entities
+        self.ttl = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, SearchSnapshot[Any]]]" = (
+            OrderedDict()
+        )
+        self._entities = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[SearchSnapshot[Any]]:
+        """
+        Look up the snapshot of a search.
+
+        Args:
+            key: Search key including the point in time of its cursors
+
+        Returns:
+            The snapshot, or None if it is unknown or has expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            self._drop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, snapshot: SearchSnapshot[Any]) -> None:
+        """
+        Store a snapshot unless it is larger than the cache.
+
+        Args:
+            key: Search key including the point in time of its cursors
+            snapshot: Sorted search result; callers must not modify its items
+        """
+        if len(snapshot) > self.max_entities:
+            return
+        self._drop(key)
+        self._entries[key] = (self._clock() + self.ttl, snapshot)
+        self._entities += len(snapshot)
+        while self._entities > self.max_entities:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._entities -= len(evicted)
+            self.evictions += 1
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entities -= len(entry[1])
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._entries.clear()
+        self._entities = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "snapshots": len(self._entries),
+            "entities": self._entities,
+            "max_entities": self.max_entities,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "ttl_seconds": self.ttl,
+        }
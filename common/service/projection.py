@@ -0,0 +1,99 @@
+"""
+Field projection for entity reads.
+
+A projection is a list of JSON paths (``"name"``, ``"$.address.city"``) naming
+the fields a caller needs. It is applied to the raw entity documents right
+after they are read, before model parsing, so unneeded fields cost neither
+parsing nor response bytes. Nested paths keep their nesting in the result;
+paths through a list are applied to every element.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+Projection = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# Nested tree of requested keys; True marks a fully selected value
+_Tree = Dict[str, Union[bool, "_Tree"]]
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated ``fields`` query parameter.
+
+    Args:
+        fields: Comma-separated paths, or None
+
+    Returns:
+        The list of paths, or None when no field was given
+    """
+    if not fields:
+        return None
+    paths = [path.strip() for path in fields.split(",") if path.strip()]
+    return paths or None
+
+
+def _split(path: str) -> List[str]:
+    if path.startswith("$."):
+        path = path[2:]
+    parts = path.split(".")
+    if not path or any(not part for part in parts):
+        raise ValueError(f"Invalid projection path: {path!r}")
+    return parts
+
+
+def _build_tree(paths: Sequence[str]) -> _Tree:
+    tree: _Tree = {}
+    for path in paths:
+        node = tree
+        parts = _split(path)
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                break  # a parent is already fully selected
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _apply(tree: _Tree, value: Any) -> Any:
+    if isinstance(value, list):
+        return [_apply(tree, item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result: Dict[str, Any] = {}
+    for key, selection in tree.items():
+        if key not in value:
+            continue
+        selected = value[key]
+        result[key] = (
+            _apply(selection, selected) if isinstance(selection, dict) else selected
+        )
+    return result
+
+
+def compile_projection(paths: Optional[Sequence[str]]) -> Optional[Projection]:
+    """
+    Compile a list of JSON paths into a projection function.
+
+    Args:
+        paths: Field paths, with or without a ``$.`` prefix
+
+    Returns:
+        A function returning the selected subset of an entity document, or
+        None when no paths were given
+
+    Raises:
+        ValueError: If a path is empty or malformed
+    """
+    if not paths:
+        return None
+    tree = _build_tree(paths)
+
+    def project(document: Dict[str, Any]) -> Dict[str, Any]:
+        projected: Dict[str, Any] = _apply(tree, document)
+        return projected
+
+    return project
@@ -7,23 +7,73 @@ with proper error handling, type safety, and performance optimizations.
 
 import logging
 import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from common.config.config import CHAT_REPOSITORY
+from common.config.config import (
+    CHAT_REPOSITORY,
+    ENTITY_READ_COALESCING,
+    SEARCH_SNAPSHOT_MAX_ENTITIES,
+    SEARCH_SNAPSHOT_TTL_SECONDS,
+    TEMPORAL_CACHE_MAX_ENTITIES,
+    TEMPORAL_CACHE_SAFETY_MARGIN_SECONDS,
+)
 from common.repository.crud_repository import CrudRepository
+from common.service.coalescing import SingleFlight, copy_json, read_key
+from common.service.cyoda_conditions import validate_cyoda_condition
 from common.service.entity_service import (
     EntityMetadata,
     EntityResponse,
     EntityService,
     SearchCondition,
     SearchConditionRequest,
+    SearchPage,
+    search_fingerprint,
 )
+from common.service.pagination import (
+    PageCursor,
+    SearchSnapshot,
+    SearchSnapshotCache,
+    encode_cursor,
+    entity_key,
+    open_page,
+    query_fingerprint,
+    snapshot_time,
+)
+from common.service.projection import Projection, compile_projection
+from common.service.temporal_cache import TemporalReadCache
 from common.utils.utils import parse_entity
 
 logger = logging.getLogger("quart")
 
 
+def _temporal_cache() -> Optional[TemporalReadCache]:
+    if TEMPORAL_CACHE_MAX_ENTITIES <= 0:
+        return None
+    return TemporalReadCache(
+        TEMPORAL_CACHE_MAX_ENTITIES, TEMPORAL_CACHE_SAFETY_MARGIN_SECONDS
+    )
+
+
+def _snapshot_cache() -> Optional[SearchSnapshotCache]:
+    if SEARCH_SNAPSHOT_MAX_ENTITIES <= 0:
+        return None
+    return SearchSnapshotCache(
+        SEARCH_SNAPSHOT_MAX_ENTITIES, SEARCH_SNAPSHOT_TTL_SECONDS
+    )
+
+
 class EntityServiceError(Exception):
     """Custom exception for entity service operations."""
 
@@ -38,6 +88,22 @@ class EntityServiceError(Exception):
         self.entity_id = entity_id
 
 
+class BatchSaveMismatchError(EntityServiceError):
+    """
+    Raised when a batch save reports a different number of IDs than entities.
+
+    Cyoda may have created the entities anyway, so their outcome is unknown.
+    """
+
+    def __init__(self, ids: List[str], expected: int, entity_class: str) -> None:
+        super().__init__(
+            f"Batch save returned {len(ids)} IDs for {expected} entities",
+            entity_class,
+        )
+        self.ids = ids
+        self.expected = expected
+
+
 class EntityServiceImpl(EntityService):
     """
     Enhanced implementation of EntityService with comprehensive functionality.
@@ -67,6 +133,12 @@ class EntityServiceImpl(EntityService):
         """
         self._repository: CrudRepository[Any] = repository
         self._model_registry: Dict[str, Any] = model_registry or {}
+        self._meta_cache: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._reads: Optional[SingleFlight] = (
+            SingleFlight() if ENTITY_READ_COALESCING else None
+        )
+        self._history: Optional[TemporalReadCache] = _temporal_cache()
+        self._snapshots: Optional[SearchSnapshotCache] = _snapshot_cache()
         logger.info("EntityServiceImpl initialized")
 
     @classmethod
@@ -97,6 +169,12 @@ class EntityServiceImpl(EntityService):
                     # Attach attributes directly to avoid calling __init__ on an existing instance
                     instance._repository = repository  # type: ignore[attr-defined]
                     instance._model_registry = model_registry or {}  # type: ignore[attr-defined]
+                    instance._meta_cache = {}  # type: ignore[attr-defined]
+                    instance._reads = (  # type: ignore[attr-defined]
+                        SingleFlight() if ENTITY_READ_COALESCING else None
+                    )
+                    instance._history = _temporal_cache()  # type: ignore[attr-defined]
+                    instance._snapshots = _snapshot_cache()  # type: ignore[attr-defined]
                     logger.info("EntityServiceImpl singleton created")
                     cls._instance = instance  # type: ignore[assignment]
         elif repository is not None:
@@ -112,7 +190,11 @@ class EntityServiceImpl(EntityService):
     # ========================================
 
     def _create_entity_response(
-        self, data: Any, entity_id: Optional[str] = None, state: Optional[str] = None
+        self,
+        data: Any,
+        entity_id: Optional[str] = None,
+        state: Optional[str] = None,
+        created_at: Optional[datetime] = None,
     ) -> EntityResponse:
         """
         Create EntityResponse with proper metadata.
@@ -121,6 +203,7 @@ class EntityServiceImpl(EntityService):
             data: Entity data
             entity_id: Technical UUID
             state: Entity state
+            created_at: Response timestamp, now if omitted
 
         Returns:
             EntityResponse with data and metadata
@@ -136,7 +219,7 @@ class EntityServiceImpl(EntityService):
         metadata = EntityMetadata(
             id=entity_id or "unknown",
             state=state,
-            created_at=datetime.now(),
+            created_at=created_at or datetime.now(),
             entity_type="entity",
         )
 
@@ -156,11 +239,109 @@ class EntityServiceImpl(EntityService):
         if not data:
             return data
 
-        model_cls = self._model_registry.get(entity_class.lower())
+        model_cls = self._model_class(entity_class)
         if model_cls:
             return parse_entity(model_cls, data)
         return data
 
+    def _model_class(self, entity_class: str) -> Any:
+        """Look up the registered model class for an entity class, if any."""
+        return self._model_registry.get(entity_class.lower())
+
+    def _build_response(
+        self,
+        item: Any,
+        entity_class: str,
+        project: Optional[Projection] = None,
+        entity_id: Optional[str] = None,
+    ) -> EntityResponse:
+        """
+        Create an EntityResponse from a repository item, optionally projected.
+
+        A projected item skips model parsing; its metadata still comes from the
+        full item so id and state survive projections that leave them out.
+
+        Args:
+            item: Raw entity data from the repository
+            entity_class: Entity class name
+            project: Compiled projection, if any
+            entity_id: Technical UUID, if known
+
+        Returns:
+            EntityResponse with data and metadata
+        """
+        return self._shape_item(
+            item, self._model_class(entity_class), project, entity_id, datetime.now()
+        )
+
+    def _build_responses(
+        self,
+        items: List[Any],
+        entity_class: str,
+        project: Optional[Projection] = None,
+    ) -> List[EntityResponse]:
+        """
+        Create EntityResponses for a page of repository items.
+
+        Same as _build_response per item, but the model class and the
+        timestamp are resolved once for the whole page.
+
+        Args:
+            items: Raw entity data from the repository
+            entity_class: Entity class name
+            project: Compiled projection, if any
+
+        Returns:
+            List of EntityResponse in item order
+        """
+        model_cls = self._model_class(entity_class)
+        created_at = datetime.now()
+        return [
+            self._shape_item(item, model_cls, project, None, created_at)
+            for item in items
+        ]
+
+    @staticmethod
+    def _raw_items(
+        items: List[Any], project: Optional[Projection] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Shape a page of repository items without model parsing.
+
+        Args:
+            items: Raw entity data from the repository
+            project: Compiled projection, if any
+
+        Returns:
+            Entity documents, projected ones keeping their technical_id
+        """
+        documents = [item for item in items if isinstance(item, dict)]
+        if project is None:
+            return documents
+        return [
+            {**project(item), "technical_id": item.get("technical_id")}
+            for item in documents
+        ]
+
+    def _shape_item(
+        self,
+        item: Any,
+        model_cls: Any,
+        project: Optional[Projection],
+        entity_id: Optional[str],
+        created_at: datetime,
+    ) -> EntityResponse:
+        """Project or parse one repository item and wrap it in an EntityResponse."""
+        if project is None or not isinstance(item, dict):
+            data = parse_entity(model_cls, item) if model_cls and item else item
+            return self._create_entity_response(data, entity_id, None, created_at)
+        return self._create_entity_response(
+            project(item),
+            entity_id or item.get("technical_id") or item.get("id"),
+            item.get("current_state") or item.get("state"),
+            created_at,
+        )
+
     def _handle_repository_error(
         self,
         data: Any,
@@ -200,6 +381,10 @@ class EntityServiceImpl(EntityService):
         """
         Get repository metadata with optional additional metadata.
 
+        The repository's metadata is fetched once per (token, class, version)
+        and shared between calls, so repositories must treat it as read-only;
+        additional metadata is merged into a copy.
+
         Args:
             token: Authentication token
             entity_class: Entity class name
@@ -209,17 +394,98 @@ class EntityServiceImpl(EntityService):
         Returns:
             Complete metadata dictionary
         """
-        meta = await self._repository.get_meta(token, entity_class, entity_version)
+        key = (token, entity_class, entity_version)
+        meta = self._meta_cache.get(key)
+        if meta is None:
+            meta = await self._repository.get_meta(token, entity_class, entity_version)
+            self._meta_cache[key] = meta
         if additional_meta:
-            meta.update(additional_meta)
+            return {**meta, **additional_meta}
         return meta
 
+    async def _read(
+        self,
+        key: Tuple[Any, ...],
+        fetch: Callable[[], Awaitable[Any]],
+        point_in_time: Optional[datetime] = None,
+    ) -> Any:
+        """
+        Run a repository read, sharing it with identical concurrent reads.
+
+        Reads at a point in time older than the safety margin are answered
+        from the temporal cache when possible.
+
+        Args:
+            key: Read key from read_key()
+            fetch: Coroutine factory performing the repository read
+            point_in_time: Point in time of a temporal read
+
+        Returns:
+            The repository result
+        """
+        history = self._history
+        if history is not None and not history.is_historical(point_in_time):
+            history = None
+        if history is not None:
+            found, cached = history.get(key)
+            if found:
+                return cached
+
+        if self._reads is None:
+            result = await fetch()
+        else:
+            result = await self._reads.do(key, fetch)
+        if history is not None:
+            history.put(key, result)
+        return result
+
+    @contextmanager
+    def _writing(self, entity_class: str) -> Iterator[None]:
+        """
+        Wrap a repository write so later reads do not join older flights.
+
+        Once the write is done, in-flight reads of the entity class are
+        forgotten: reads issued after the write start a new flight and see it,
+        while callers already waiting keep the result they were promised.
+        """
+        try:
+            yield
+        finally:
+            if self._reads is not None:
+                # read_key() puts the entity class second
+                self._reads.evict(
+                    lambda key: isinstance(key, tuple) and key[1] == entity_class
+                )
+
+    def get_read_stats(self) -> Dict[str, Any]:
+        """
+        Get read coalescing, temporal cache and search snapshot statistics.
+
+        Returns:
+            Dictionary with ``coalescing``, ``temporal_cache`` and
+            ``search_snapshots`` statistics; a disabled feature reports an
+            empty dictionary
+        """
+        return {
+            "coalescing": self._reads.get_stats() if self._reads is not None else {},
+            "temporal_cache": (
+                self._history.get_stats() if self._history is not None else {}
+            ),
+            "search_snapshots": (
+                self._snapshots.get_stats() if self._snapshots is not None else {}
+            ),
+        }
+
     # ========================================
     # PRIMARY RETRIEVAL METHODS
     # ========================================
 
     async def get_by_id(
-        self, entity_id: str, entity_class: str, entity_version: str = "1.0"
+        self,
+        entity_id: str,
+        entity_class: str,
+        entity_version: str = "1.0",
+        projection: Optional[List[str]] = None,
     ) -> Optional[EntityResponse]:
         """
         Get entity by technical UUID (FASTEST - use when you have the UUID).
@@ -228,15 +494,23 @@ class EntityServiceImpl(EntityService):
             entity_id: Technical UUID
             entity_class: Entity class/model name
             entity_version: Entity model version
+            projection: JSON paths of the fields to return
 
         Returns:
             EntityResponse with entity and metadata, or None if not found
+
+        Raises:
+            ValueError: If a projection path is malformed
         """
+        project = compile_projection(projection)
         try:
             # Use empty token for now - this should be injected properly in production
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
-            data = await self._repository.find_by_id(meta, entity_id)
+            data = await self._read(
+                read_key("find_by_id", entity_class, entity_version, entity_id),
+                lambda: self._repository.find_by_id(meta, entity_id),
+            )
             if not data:
                 return None
 
@@ -245,11 +519,8 @@ class EntityServiceImpl(EntityService):
                 data, "get_by_id", entity_class, entity_id
             )
 
-            # Parse entity data
-            parsed_data = self._parse_entity_data(data, entity_class)
-
-            # Create response
-            return self._create_entity_response(parsed_data, entity_id)
+            # Project or parse entity data and create response
+            return self._build_response(data, entity_class, project, entity_id)
 
         except EntityServiceError:
             raise
@@ -345,7 +616,10 @@ class EntityServiceImpl(EntityService):
             )
 
     async def find_all(
-        self, entity_class: str, entity_version: str = "1.0"
+        self,
+        entity_class: str,
+        entity_version: str = "1.0",
+        projection: Optional[List[str]] = None,
     ) -> List[EntityResponse]:
         """
         Get all entities of a type (SLOW - use sparingly).
@@ -353,14 +627,22 @@ class EntityServiceImpl(EntityService):
         Args:
             entity_class: Entity class/model name
             entity_version: Entity model version
+            projection: JSON paths of the fields to return
 
         Returns:
             List of EntityResponse with entities and metadata
+
+        Raises:
+            ValueError: If a projection path is malformed
         """
+        project = compile_projection(projection)
         try:
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
-            data = await self._repository.find_all(meta)
+            data = await self._read(
+                read_key("find_all", entity_class, entity_version),
+                lambda: self._repository.find_all(meta),
+            )
 
             # Handle repository errors
             data = self._handle_repository_error(data, "find_all", entity_class)
@@ -368,12 +650,10 @@ class EntityServiceImpl(EntityService):
             if not data:
                 return []
 
-            # Parse and create responses
-            results: List[EntityResponse] = []
-            for item in data if isinstance(data, list) else [data]:
-                parsed_item = self._parse_entity_data(item, entity_class)
-                response = self._create_entity_response(parsed_item)
-                results.append(response)
+            # Project or parse and create responses
+            results = self._build_responses(
+                data if isinstance(data, list) else [data], entity_class, project
+            )
 
             logger.debug(f"Found {len(results)} entities of type {entity_class}")
             return results
@@ -403,7 +683,11 @@ class EntityServiceImpl(EntityService):
 
             # Use find_all_by_criteria with empty criteria and point_in_time
             # This will return all entities as they existed at the specified time
-            data = await self._repository.find_all_by_criteria(meta, {}, point_in_time)
+            data = await self._read(
+                read_key("search", entity_class, entity_version, {}, point_in_time),
+                lambda: self._repository.find_all_by_criteria(meta, {}, point_in_time),
+                point_in_time,
+            )
 
             # Handle repository errors
             data = self._handle_repository_error(data, "find_all_at_time", entity_class)
@@ -412,11 +696,9 @@ class EntityServiceImpl(EntityService):
                 return []
 
             # Parse and create responses
-            results: List[EntityResponse] = []
-            for item in data if isinstance(data, list) else [data]:
-                parsed_item = self._parse_entity_data(item, entity_class)
-                response = self._create_entity_response(parsed_item)
-                results.append(response)
+            results = self._build_responses(
+                data if isinstance(data, list) else [data], entity_class
+            )
 
             logger.debug(
                 f"Found {len(results)} entities of type {entity_class} at time {point_in_time}"
@@ -436,6 +718,7 @@ class EntityServiceImpl(EntityService):
         entity_class: str,
         condition: SearchConditionRequest,
         entity_version: str = "1.0",
+        projection: Optional[List[str]] = None,
     ) -> List[EntityResponse]:
         """
         Search entities with complex conditions (SLOWEST - most flexible).
@@ -444,17 +727,25 @@ class EntityServiceImpl(EntityService):
             entity_class: Entity class/model name
             condition: Search condition
             entity_version: Entity model version
+            projection: JSON paths of the fields to return
 
         Returns:
             List of EntityResponse with entities and metadata
+
+        Raises:
+            ValueError: If a projection path is malformed
         """
+        project = compile_projection(projection)
         try:
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
             # Convert SearchConditionRequest to repository format
             criteria = self._convert_search_condition(condition)
 
-            data = await self._repository.find_all_by_criteria(meta, criteria)
+            data = await self._read(
+                read_key("search", entity_class, entity_version, criteria),
+                lambda: self._repository.find_all_by_criteria(meta, criteria),
+            )
 
             # Handle repository errors
             data = self._handle_repository_error(data, "search", entity_class)
@@ -462,16 +753,16 @@ class EntityServiceImpl(EntityService):
             if not data:
                 return []
 
-            # Parse and create responses
-            results: List[EntityResponse] = []
-            for item in data if isinstance(data, list) else [data]:
-                parsed_item = self._parse_entity_data(item, entity_class)
-                response = self._create_entity_response(parsed_item)
-                results.append(response)
+            items = data if isinstance(data, list) else [data]
+            # Apply offset and limit before parsing so trimmed items are never parsed
+            start = condition.offset or 0
+            if condition.limit:
+                items = items[start : start + condition.limit]
+            elif start:
+                items = items[start:]
 
-            # Apply limit if specified
-            if condition.limit and len(results) > condition.limit:
-                results = results[: condition.limit]
+            # Project or parse and create responses
+            results = self._build_responses(items, entity_class, project)
 
             logger.debug(f"Search found {len(results)} entities of type {entity_class}")
             return results
@@ -482,6 +773,214 @@ class EntityServiceImpl(EntityService):
             logger.exception(f"Failed to search entities of type: {entity_class}")
             raise EntityServiceError(f"Search failed: {str(e)}", entity_class)
 
+    async def search_page(
+        self,
+        entity_class: str,
+        condition: SearchConditionRequest,
+        entity_version: str = "1",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        projection: Optional[List[str]] = None,
+        raw: bool = False,
+    ) -> SearchPage:
+        """
+        Get one page of a search, ordered by technical UUID.
+
+        The page is selected from the repository result before model parsing,
+        so only the returned entities are parsed. The first page is read
+        unpinned and every following page at the point in time recorded in
+        its cursor. The sorted result is kept for the cursor's lifetime, so
+        following pages are sliced from it without reading Cyoda again. A raw
+        page skips model parsing altogether and returns the entity documents.
+
+        Args:
+            entity_class: Entity class/model name
+            condition: Search condition
+            entity_version: Entity model version
+            limit: Maximum entities per page; defaults to the condition's limit
+            cursor: Cursor from the previous page, or None for the first page
+            projection: JSON paths of the fields to return
+            raw: Return entity documents in ``items`` instead of responses
+
+        Returns:
+            SearchPage with the entities and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another search
+            ValueError: If a projection path is malformed
+        """
+        project = compile_projection(projection)
+        query = search_fingerprint(condition)
+        point_in_time, after = open_page(cursor, query)
+        try:
+            criteria = self._convert_search_condition(condition)
+            return await self._criteria_page(
+                entity_class,
+                entity_version,
+                criteria,
+                query,
+                point_in_time,
+                after,
+                limit or condition.limit,
+                project,
+                raw,
+            )
+
+        except EntityServiceError:
+            raise
+        except Exception as e:
+            logger.exception(f"Failed to search a page of {entity_class}")
+            raise EntityServiceError(f"Search page failed: {str(e)}", entity_class)
+
+    async def search_by_criteria(
+        self,
+        entity_class: str,
+        criteria: Dict[str, Any],
+        entity_version: str = "1",
+        projection: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        """
+        Search entities with a Cyoda-native condition, forwarded untouched.
+
+        Args:
+            entity_class: Entity class/model name
+            criteria: Cyoda group condition, or a single simple/lifecycle one
+            entity_version: Entity model version
+            projection: JSON paths of the fields to return
+            limit: Maximum entities per page; all results when neither limit
+                nor cursor is given
+            cursor: Cursor from the previous page, or None for the first page
+
+        Returns:
+            SearchPage with the entities and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another search
+            ValueError: If the condition or a projection path is malformed
+        """
+        group = validate_cyoda_condition(criteria)
+        project = compile_projection(projection)
+        query = query_fingerprint(group)
+        point_in_time: Optional[datetime] = None
+        after: Optional[str] = None
+        if limit is not None or cursor is not None:
+            point_in_time, after = open_page(cursor, query)
+        try:
+            return await self._criteria_page(
+                entity_class,
+                entity_version,
+                group,
+                query,
+                point_in_time,
+                after,
+                limit,
+                project,
+            )
+
+        except EntityServiceError:
+            raise
+        except Exception as e:
+            logger.exception(f"Failed to search {entity_class} by criteria")
+            raise EntityServiceError(
+                f"Search by criteria failed: {str(e)}", entity_class
+            )
+
+    async def _criteria_page(
+        self,
+        entity_class: str,
+        entity_version: str,
+        criteria: Dict[str, Any],
+        query: str,
+        point_in_time: Optional[datetime],
+        after: Optional[str],
+        limit: Optional[int],
+        project: Optional[Projection],
+        raw: bool = False,
+    ) -> SearchPage:
+        """
+        Read repository criteria and build one keyset page of the result.
+
+        Args:
+            entity_class: Entity class/model name
+            entity_version: Entity model version
+            criteria: Repository criteria
+            query: Fingerprint of the search for the next cursor
+            point_in_time: Point in time to read at, or None for now
+            after: Technical ID the page starts after
+            limit: Maximum entities in the page
+            project: Compiled projection, if any
+            raw: Return the page's entity documents unparsed in ``items``
+
+        Returns:
+            SearchPage with the parsed page and the cursor of the next page
+        """
+        snapshots = self._snapshots
+        snapshot_key: Tuple[Any, ...] = (entity_class, entity_version, query)
+        snapshot = None
+        if snapshots is not None and point_in_time is not None:
+            snapshot = snapshots.get(snapshot_key + (point_in_time,))
+        cached = snapshot is not None
+        if snapshot is None:
+            meta = await self._get_repository_meta("", entity_class, entity_version)
+            data = await self._read(
+                read_key(
+                    "search", entity_class, entity_version, criteria, point_in_time
+                ),
+                lambda: self._repository.find_all_by_criteria(
+                    meta, criteria, point_in_time
+                ),
+                point_in_time,
+            )
+            data = self._handle_repository_error(data, "search", entity_class)
+            items = data if isinstance(data, list) else [data] if data else []
+            snapshot = SearchSnapshot(items, entity_key)
+
+        page, more = snapshot.page(after, limit)
+        next_cursor = None
+        if more:
+            taken_at = snapshot_time(point_in_time)
+            next_cursor = encode_cursor(
+                PageCursor(entity_key(page[-1]), taken_at, query)
+            )
+            if snapshots is not None and not cached:
+                snapshots.put(snapshot_key + (taken_at,), snapshot)
+        if cached:
+            # Items of a kept snapshot must not be modified by the caller
+            page = copy_json(page)
+        if raw:
+            return SearchPage(
+                [], next_cursor, len(snapshot), self._raw_items(page, project)
+            )
+        return SearchPage(
+            self._build_responses(page, entity_class, project),
+            next_cursor,
+            len(snapshot),
+        )
+
+    async def iter_all(
+        self, entity_class: str, entity_version: str = "1.0", page_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all entities of a type as pages read from the repository.
+
+        Args:
+            entity_class: Entity class/model name
+            entity_version: Entity model version
+            page_size: Maximum number of entities per page
+
+        Yields:
+            Pages of entity data dictionaries
+        """
+        try:
+            meta = await self._get_repository_meta("", entity_class, entity_version)
+            async for page in self._repository.iter_all(meta, page_size):
+                yield page
+        except Exception as e:
+            logger.exception(f"Failed to iterate entities of type: {entity_class}")
+            raise EntityServiceError(f"Iterate all failed: {str(e)}", entity_class)
+
     def _convert_search_condition(
         self, condition: SearchConditionRequest
     ) -> Dict[str, Any]:
@@ -494,6 +993,9 @@ class EntityServiceImpl(EntityService):
         Returns:
             Repository-compatible criteria dictionary
         """
+        if not condition.conditions:
+            # No condition - match every entity
+            return {}
         if len(condition.conditions) == 1:
             # Single condition - simple format
             cond: SearchCondition = condition.conditions[0]
@@ -544,7 +1046,8 @@ class EntityServiceImpl(EntityService):
         try:
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
-            entity_id = await self._repository.save(meta, entity)
+            with self._writing(entity_class):
+                entity_id = await self._repository.save(meta, entity)
 
             if not entity_id:
                 raise EntityServiceError(
@@ -601,7 +1104,8 @@ class EntityServiceImpl(EntityService):
                 "", entity_class, entity_version, additional_meta
             )
 
-            updated_id = await self._repository.update(meta, entity_id, entity)
+            with self._writing(entity_class):
+                updated_id = await self._repository.update(meta, entity_id, entity)
 
             if not updated_id:
                 raise EntityServiceError(
@@ -659,11 +1163,11 @@ class EntityServiceImpl(EntityService):
                     entity_class,
                 )
 
-            # Find existing entity
-            existing = await self.find_by_business_id(
-                entity_class, str(business_id), business_id_field, entity_version
+            meta = await self._get_repository_meta("", entity_class, entity_version)
+            entity_id = await self._find_id_by_business_id(
+                meta, business_id_field, business_id
             )
-            if not existing:
+            if not entity_id:
                 raise EntityServiceError(
                     f"Entity not found with {business_id_field}={business_id}",
                     entity_class,
@@ -672,7 +1176,7 @@ class EntityServiceImpl(EntityService):
 
             # Update using technical ID
             return await self.update(
-                existing.get_id(), entity, entity_class, transition, entity_version
+                entity_id, entity, entity_class, transition, entity_version
             )
 
         except EntityServiceError:
@@ -685,6 +1189,36 @@ class EntityServiceImpl(EntityService):
                 f"Update by business ID failed: {str(e)}", entity_class
             )
 
+    async def _find_id_by_business_id(
+        self, meta: Dict[str, Any], business_id_field: str, business_id: Any
+    ) -> Optional[str]:
+        """
+        Look up the technical ID of the entity holding a business ID.
+
+        One repository search; the match is not parsed into a model since
+        only its ID is needed.
+
+        Args:
+            meta: Repository metadata for the entity model
+            business_id_field: Field name containing the business ID
+            business_id: Business identifier value
+
+        Returns:
+            Technical UUID of the first match, or None if there is none
+        """
+        data = await self._repository.find_all_by_criteria(
+            meta, {business_id_field: business_id}
+        )
+        items = data if isinstance(data, list) else [data] if data else []
+        if not items:
+            return None
+        item = items[0]
+        if isinstance(item, dict):
+            entity_id = item.get("technical_id") or item.get("id")
+        else:
+            entity_id = getattr(item, "technical_id", None)
+        return str(entity_id) if entity_id else None
+
     async def delete_by_id(
         self, entity_id: str, entity_class: str, entity_version: str = "1.0"
     ) -> str:
@@ -702,7 +1236,8 @@ class EntityServiceImpl(EntityService):
         try:
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
-            await self._repository.delete_by_id(meta, entity_id)
+            with self._writing(entity_class):
+                await self._repository.delete_by_id(meta, entity_id)
 
             logger.debug(f"Deleted entity {entity_id} of type {entity_class}")
             return entity_id
@@ -735,15 +1270,17 @@ class EntityServiceImpl(EntityService):
             True if deleted, False if not found
         """
         try:
-            # Find existing entity
-            existing = await self.find_by_business_id(
-                entity_class, business_id, business_id_field, entity_version
+            meta = await self._get_repository_meta("", entity_class, entity_version)
+            entity_id = await self._find_id_by_business_id(
+                meta, business_id_field, business_id
             )
-            if not existing:
+            if not entity_id:
                 return False
 
             # Delete using technical ID
-            await self.delete_by_id(existing.get_id(), entity_class, entity_version)
+            with self._writing(entity_class):
+                await self._repository.delete_by_id(meta, entity_id)
+            logger.debug(f"Deleted entity {entity_id} of type {entity_class}")
             return True
 
         except Exception as e:
@@ -772,6 +1309,10 @@ class EntityServiceImpl(EntityService):
 
         Returns:
             List of EntityResponse with saved entities and metadata
+
+        Raises:
+            BatchSaveMismatchError: If the IDs returned do not match the entities
+            EntityServiceError: If the batch save failed
         """
         try:
             if not entities:
@@ -779,11 +1320,35 @@ class EntityServiceImpl(EntityService):
 
             meta = await self._get_repository_meta("", entity_class, entity_version)
 
-            # Use repository batch save if available, otherwise save individually
+            # Prefer a batch save that reports every ID, then any batch save,
+            # otherwise save individually
+            save_all_ids = getattr(self._repository, "save_all_ids", None)
+            if save_all_ids is not None:
+                with self._writing(entity_class):
+                    ids = await save_all_ids(meta, entities)
+                if len(ids) != len(entities):
+                    raise BatchSaveMismatchError(ids, len(entities), entity_class)
+                model_cls = self._model_class(entity_class)
+                created_at = datetime.now()
+                results: List[EntityResponse] = []
+                for entity, entity_id in zip(entities, ids):
+                    entity_with_id = {**entity, "technical_id": entity_id}
+                    parsed_entity = (
+                        parse_entity(model_cls, entity_with_id)
+                        if model_cls
+                        else entity_with_id
+                    )
+                    results.append(
+                        self._create_entity_response(
+                            parsed_entity, entity_id, "active", created_at
+                        )
+                    )
+                return results
             if hasattr(self._repository, "save_all"):
-                batch_base_id = await self._repository.save_all(meta, entities)
+                with self._writing(entity_class):
+                    batch_base_id = await self._repository.save_all(meta, entities)
                 # For batch operations, we might only get a base ID
-                results: List[EntityResponse] = []
+                results = []
                 for i, entity in enumerate(entities):
                     current_id = (
                         f"{batch_base_id}_{i}" if batch_base_id else f"batch_{i}"
@@ -833,7 +1398,8 @@ class EntityServiceImpl(EntityService):
                 return 0
 
             meta = await self._get_repository_meta("", entity_class, entity_version)
-            await self._repository.delete_all(meta)
+            with self._writing(entity_class):
+                await self._repository.delete_all(meta)
 
             logger.warning(f"Deleted ALL {count} entities of type {entity_class}")
             return count
@@ -891,6 +1457,10 @@ class EntityServiceImpl(EntityService):
         """
         Execute a workflow transition on an entity.
 
+        The transition is launched in a single repository call without
+        reading the entity first, so the response carries the entity ID only.
+        Use get_by_id() afterwards when the resulting state is needed.
+
         Args:
             entity_id: Technical UUID of the entity
             transition: Transition name to execute
@@ -898,28 +1468,22 @@ class EntityServiceImpl(EntityService):
             entity_version: Entity model version
 
         Returns:
-            EntityResponse with updated entity and metadata
+            EntityResponse with the entity ID
         """
         try:
-            # Get current entity
-            current_entity = await self.get_by_id(
-                entity_id, entity_class, entity_version
+            meta = await self._get_repository_meta(
+                "", entity_class, entity_version, {"update_transition": transition}
             )
-            if not current_entity:
-                raise EntityServiceError(
-                    f"Entity not found: {entity_id}", entity_class, entity_id
-                )
 
-            # Execute transition by updating with transition
-            if hasattr(current_entity.data, "model_dump"):
-                entity_data: Dict[str, Any] = current_entity.data.model_dump(
-                    by_alias=True
-                )
-            else:
-                entity_data = cast(Dict[str, Any], current_entity.data)
-            return await self.update(
-                entity_id, entity_data, entity_class, transition, entity_version
+            # Without entity data the repository launches the transition as is
+            with self._writing(entity_class):
+                await self._repository.update(meta, entity_id, None)
+
+            logger.debug(
+                f"Executed transition {transition} on entity {entity_id} "
+                f"of type {entity_class}"
             )
+            return self._create_entity_response({"technical_id": entity_id}, entity_id)
 
         except EntityServiceError:
             raise
@@ -956,8 +1520,12 @@ class EntityServiceImpl(EntityService):
         """
         try:
             meta = await self._get_repository_meta("", entity_class, entity_version)
-            entity_data = await self._repository.find_by_id(
-                meta, entity_id, point_in_time
+            entity_data = await self._read(
+                read_key(
+                    "find_by_id", entity_class, entity_version, entity_id, point_in_time
+                ),
+                lambda: self._repository.find_by_id(meta, entity_id, point_in_time),
+                point_in_time,
             )
 
             if entity_data is None:
@@ -1003,18 +1571,18 @@ class EntityServiceImpl(EntityService):
             criteria = self._convert_search_condition(condition)
 
             # Search with point_in_time
-            entities = await self._repository.find_all_by_criteria(
-                meta, criteria, point_in_time
+            entities = await self._read(
+                read_key(
+                    "search", entity_class, entity_version, criteria, point_in_time
+                ),
+                lambda: self._repository.find_all_by_criteria(
+                    meta, criteria, point_in_time
+                ),
+                point_in_time,
             )
 
             # Convert to EntityResponse objects
-            results: List[EntityResponse] = []
-            for entity_data in entities:
-                parsed_entity = self._parse_entity_data(entity_data, entity_class)
-                response = self._create_entity_response(parsed_entity)
-                results.append(response)
-
-            return results
+            return self._build_responses(entities, entity_class)
 
         except Exception as e:
             logger.exception(f"Failed to search {entity_class} at time {point_in_time}")
@@ -1039,7 +1607,12 @@ class EntityServiceImpl(EntityService):
         """
         try:
             meta = await self._repository.get_meta("", entity_class, entity_version)
-            return await self._repository.get_entity_count(meta, point_in_time)
+            count: int = await self._read(
+                read_key("count", entity_class, entity_version, None, point_in_time),
+                lambda: self._repository.get_entity_count(meta, point_in_time),
+                point_in_time,
+            )
+            return count
 
         except Exception:
             logger.exception(f"Failed to get entity count for {entity_class}")
@@ -0,0 +1,140 @@
+"""
+Cache for point-in-time reads.
+
+An entity, search result or count as of a moment in the past never changes, so
+repeated as-of reads (audit views, reports) can be answered locally. Only
+points in time older than a safety margin are cached, which leaves room for
+clock skew and for writes still landing at the platform; nothing needs to be
+invalidated. The cache is bounded by the number of entities it holds and
+evicts the least recently used results.
+"""
+
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from common.service.coalescing import copy_json
+
+logger = logging.getLogger(__name__)
+
+
+def _size(value: Any) -> int:
+    return len(value) if isinstance(value, list) else 1
+
+
+def _cacheable(value: Any) -> bool:
+    # Repositories report failures as empty results or error dicts
+    if not value:
+        return False
+    return not (isinstance(value, dict) and value.get("errorMessage"))
+
+
+class TemporalReadCache:
+    """LRU cache of point-in-time read results, bounded by entity count."""
+
+    def __init__(
+        self,
+        max_entities: int,
+        safety_margin_seconds: float,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entities: Maximum number of entities held across all results;
+                a list result counts its items, anything else counts one
+            safety_margin_seconds: Minimum age of a point in time to be cached
+            clock: UTC clock, injectable for tests
+
+        Raises:
+            ValueError: If max_entities is not positive
+        """
+        if max_entities <= 0:
+            raise ValueError("max_entities must be positive")
+        self.max_entities = max_entities
+        self.safety_margin = timedelta(seconds=safety_margin_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._entities = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_historical(self, point_in_time: Optional[datetime]) -> bool:
+        """
+        Check whether reads at a point in time are old enough to be cached.
+
+        Naive values are taken as UTC.
+
+        Args:
+            point_in_time: Point in time of a read
+
+        Returns:
+            True if the point in time is older than the safety margin
+        """
+        if point_in_time is None:
+            return False
+        if point_in_time.tzinfo is None:
+            point_in_time = point_in_time.replace(tzinfo=timezone.utc)
+        return point_in_time <= self._clock() - self.safety_margin
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Read key
+
+        Returns:
+            (found, copy of the result)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, copy_json(entry[1])
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result unless it is empty, an error or larger than the cache.
+
+        Args:
+            key: Read key
+            value: Repository result; a copy is stored
+        """
+        size = _size(value)
+        if not _cacheable(value) or size > self.max_entities:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._entities -= previous[0]
+        self._entries[key] = (size, copy_json(value))
+        self._entities += size
+        while self._entities > self.max_entities:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._entities -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._entities = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "results": len(self._entries),
+            "entities": self._entities,
+            "max_entities": self.max_entities,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "safety_margin_seconds": self.safety_margin.total_seconds(),
+        }
@@ -0,0 +1,207 @@
+"""
+Unit of work for entity side-effect writes.
+
+Processors often create or update several related entities while handling one
+entity. Awaiting each save in turn makes processor latency grow linearly with
+the number of writes. A unit of work queues the writes and flushes them
+concurrently in one step, collecting every failure instead of stopping at the
+first one:
+
+    async with entity_service.unit_of_work() as uow:
+        for data in related:
+            uow.save(data, OtherEntity.ENTITY_NAME, "1")
+
+    responses = uow.results
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+from common.service.service import EntityServiceError
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from common.service.entity_service import EntityService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass
+class _Operation:
+    """A queued entity service call."""
+
+    method: str
+    entity_class: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        return f"{self.method}({self.entity_class})"
+
+
+class UnitOfWorkError(EntityServiceError):
+    """Raised by UnitOfWork.flush when one or more queued writes failed."""
+
+    def __init__(
+        self,
+        errors: List[Tuple[int, str, Exception]],
+        results: List[Any],
+    ) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            errors: (queue index, operation description, exception) per failure
+            results: Results in queue order, None for failed operations
+        """
+        self.errors = errors
+        self.results = results
+        summary = "; ".join(f"#{i} {op}: {e}" for i, op, e in errors[:5])
+        if len(errors) > 5:
+            summary += f"; and {len(errors) - 5} more"
+        super().__init__(f"{len(errors)} of {len(results)} writes failed: {summary}")
+
+
+class UnitOfWork:
+    """
+    Queue of entity writes flushed concurrently.
+
+    Writes run in no particular order; queue only writes that do not depend on
+    each other. Results keep the queue order.
+    """
+
+    def __init__(
+        self,
+        entity_service: "EntityService",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize the unit of work.
+
+        Args:
+            entity_service: Service the writes are executed against
+            max_concurrency: Maximum number of writes in flight at once
+        """
+        self._entity_service = entity_service
+        self._max_concurrency = max(1, max_concurrency)
+        self._operations: List[_Operation] = []
+        self.results: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def save(
+        self, entity: Dict[str, Any], entity_class: str, entity_version: str = "1"
+    ) -> None:
+        """Queue a create (EntityService.save)."""
+        self._operations.append(
+            _Operation("save", entity_class, (entity, entity_class, entity_version))
+        )
+
+    def update(
+        self,
+        entity_id: str,
+        entity: Dict[str, Any],
+        entity_class: str,
+        transition: Optional[str] = None,
+        entity_version: str = "1",
+    ) -> None:
+        """Queue an update by technical id (EntityService.update)."""
+        self._operations.append(
+            _Operation(
+                "update",
+                entity_class,
+                (entity_id, entity, entity_class),
+                {"transition": transition, "entity_version": entity_version},
+            )
+        )
+
+    def transition(
+        self,
+        entity_id: str,
+        transition: str,
+        entity_class: str,
+        entity_version: str = "1",
+    ) -> None:
+        """Queue a workflow transition (EntityService.execute_transition)."""
+        self._operations.append(
+            _Operation(
+                "execute_transition",
+                entity_class,
+                (entity_id, transition, entity_class, entity_version),
+            )
+        )
+
+    def delete(
+        self, entity_id: str, entity_class: str, entity_version: str = "1"
+    ) -> None:
+        """Queue a delete by technical id (EntityService.delete_by_id)."""
+        self._operations.append(
+            _Operation(
+                "delete_by_id", entity_class, (entity_id, entity_class, entity_version)
+            )
+        )
+
+    async def flush(self) -> List[Any]:
+        """
+        Run all queued writes concurrently and clear the queue.
+
+        Returns:
+            One result per queued write, in queue order
+
+        Raises:
+            UnitOfWorkError: If any write failed; the other writes still ran
+                and their results are available on the error
+        """
+        operations, self._operations = self._operations, []
+        if not operations:
+            self.results = []
+            return self.results
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(operation: _Operation) -> Any:
+            async with semaphore:
+                method = getattr(self._entity_service, operation.method)
+                return await method(*operation.args, **operation.kwargs)
+
+        outcomes = await asyncio.gather(
+            *(run(operation) for operation in operations), return_exceptions=True
+        )
+
+        results: List[Any] = []
+        errors: List[Tuple[int, str, Exception]] = []
+        for index, (operation, outcome) in enumerate(zip(operations, outcomes)):
+            if isinstance(outcome, Exception):
+                errors.append((index, operation.describe(), outcome))
+                results.append(None)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
+
+        self.results = results
+        logger.debug(f"Flushed {len(operations)} writes, {len(errors)} failed")
+        if errors:
+            raise UnitOfWorkError(errors, results)
+        return results
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional["TracebackType"],
+    ) -> None:
+        # Writes queued by a block that failed are discarded, not flushed
+        if exc_type is None:
+            await self.flush()
+        else:
+            self._operations.clear()
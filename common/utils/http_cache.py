@@ -0,0 +1,126 @@
+"""
+ETags and conditional GETs for Quart routes.
+
+http_cache() tags a GET route's JSON response with a strong ETag computed
+from the response body and answers a matching If-None-Match with 304 Not
+Modified, so polling clients revalidate unchanged entities without
+downloading them again. The Cache-Control header is set per route.
+"""
+
+import hashlib
+import json
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, cast
+
+from quart import Response, make_response, request
+from quart.typing import ResponseReturnValue
+from quart.wrappers.response import DataBody
+
+from common.config.config import HTTP_CACHE_CONTROL
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute an ETag value for a response body.
+
+    Args:
+        body: Encoded response body
+
+    Returns:
+        Hex digest of the body, unquoted
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def etag_headers(content: Any) -> Dict[str, str]:
+    """
+    Build a weak ETag header from the content of a JSON response.
+
+    For bodies with volatile parts, such as a pagination cursor carrying a
+    timestamp: tagging only the content lets unchanged results revalidate.
+    The tag is weak because bodies sharing it are equivalent, not identical.
+
+    Args:
+        content: JSON-like content identifying the response
+
+    Returns:
+        Headers to return with the response
+    """
+    body = json.dumps(content, sort_keys=True, default=str).encode()
+    return {"ETag": f'W/"{compute_etag(body)}"'}
+
+
+async def apply_conditional(
+    response: Response, cache_control: Optional[str] = HTTP_CACHE_CONTROL
+) -> Response:
+    """
+    Add ETag and Cache-Control to a response and turn it into a 304 if current.
+
+    Only successful GET/HEAD responses with an in-memory body are handled;
+    streamed bodies are returned unchanged. An ETag already set on the
+    response, e.g. from an entity version, is kept instead of hashing the body.
+
+    Args:
+        response: Response produced by the route
+        cache_control: Cache-Control value, or None to leave the header unset
+
+    Returns:
+        The response, or an empty 304 response if the client's copy matches
+    """
+    if request.method not in _CACHEABLE_METHODS or response.status_code != 200:
+        return response
+    if not isinstance(response.response, DataBody):
+        return response
+
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+    etag, _ = response.get_etag()
+    if etag is None:
+        etag = compute_etag(response.response.data)
+        response.set_etag(etag)
+
+    if not request.if_none_match.contains_weak(etag):
+        return response
+
+    not_modified = Response(b"", status=304)
+    for header in ("ETag", "Cache-Control", "Vary"):
+        if header in response.headers:
+            not_modified.headers[header] = response.headers[header]
+    return not_modified
+
+
+def http_cache(cache_control: Optional[str] = HTTP_CACHE_CONTROL) -> Callable[[F], F]:
+    """
+    Enable ETags and conditional GETs on a route.
+
+    Place it directly below the ``route`` decorator so it sees the final
+    response, after schema validation::
+
+        @bp.route("/<entity_id>", methods=["GET"])
+        @http_cache("private, max-age=30")
+        @validate(...)
+        async def get_entity(entity_id: str) -> ResponseReturnValue: ...
+
+    Args:
+        cache_control: Cache-Control policy for this route; defaults to
+            HTTP_CACHE_CONTROL, None leaves the header unset
+
+    Returns:
+        Route decorator
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> ResponseReturnValue:
+            response = await make_response(await func(*args, **kwargs))
+            if isinstance(response, Response):
+                response = await apply_conditional(response, cache_control)
+            return response
+
+        return cast(F, wrapper)
+
+    return decorator
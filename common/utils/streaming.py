@@ -0,0 +1,130 @@
+"""
+Chunked JSON encoders for streaming entity exports, and an NDJSON line reader
+for streaming imports.
+
+Both encoders take an async iterator of entity pages and yield one bytes
+chunk per page, so an export holds at most one page in memory and the first
+bytes reach the client as soon as the first page is read.
+"""
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Tuple
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+JSON_CONTENT_TYPE = "application/json"
+
+Page = List[Dict[str, Any]]
+
+
+def _dumps(entity: Any) -> str:
+    return json.dumps(entity, default=str, separators=(",", ":"))
+
+
+async def ndjson_chunks(pages: AsyncIterator[Page]) -> AsyncIterator[bytes]:
+    """
+    Encode entity pages as newline-delimited JSON, one entity per line.
+
+    Args:
+        pages: Async iterator of entity pages
+
+    Yields:
+        One chunk per non-empty page
+    """
+    async for page in pages:
+        if page:
+            yield "".join(_dumps(entity) + "\n" for entity in page).encode()
+
+
+async def json_array_chunks(
+    pages: AsyncIterator[Page],
+) -> AsyncIterator[bytes]:
+    """
+    Encode entity pages as a single JSON array written incrementally.
+
+    Args:
+        pages: Async iterator of entity pages
+
+    Yields:
+        The opening bracket, one chunk per non-empty page and the closing bracket
+    """
+    yield b"["
+    first = True
+    async for page in pages:
+        if not page:
+            continue
+        body = ",".join(_dumps(entity) for entity in page)
+        yield (body if first else "," + body).encode()
+        first = False
+    yield b"]"
+
+
+async def prefetch(pages: AsyncIterator[Page]) -> AsyncIterator[Page]:
+    """
+    Read the first page before streaming starts.
+
+    Errors reaching the backend then surface while the handler can still
+    answer with an error status, instead of truncating a 200 response.
+
+    Args:
+        pages: Async iterator of entity pages
+
+    Returns:
+        An iterator yielding the prefetched page followed by the remaining ones
+    """
+    iterator = pages.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def resumed() -> AsyncIterator[Page]:
+        if first is not None:
+            yield first
+        async for page in iterator:
+            yield page
+
+    return resumed()
+
+
+def export_chunks(
+    pages: AsyncIterator[Page], fmt: str
+) -> Tuple[AsyncIterator[bytes], str]:
+    """
+    Pick the encoder for an export format.
+
+    Args:
+        pages: Async iterator of entity pages
+        fmt: "ndjson" or "json"
+
+    Returns:
+        Tuple of (chunk iterator, content type)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt == "ndjson":
+        return ndjson_chunks(pages), NDJSON_CONTENT_TYPE
+    if fmt == "json":
+        return json_array_chunks(pages), JSON_CONTENT_TYPE
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+async def ndjson_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split a streamed NDJSON body into lines as the chunks arrive.
+
+    Args:
+        chunks: Body chunks, split at arbitrary positions
+
+    Yields:
+        Each non-blank line, without the line terminator
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
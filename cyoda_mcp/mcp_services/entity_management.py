@@ -6,16 +6,11 @@ using the existing dependency injection system.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from common.config.config import ENTITY_VERSION
-from common.service.entity_service import (
-    CYODA_OPERATOR_MAPPING,
-    EntityService,
-    LogicalOperator,
-    SearchConditionRequest,
-    SearchOperator,
-)
+from common.service.cyoda_conditions import is_cyoda_condition
+from common.service.entity_service import EntityService, SearchConditionRequest
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +29,11 @@ class EntityManagementService:
         logger.info("EntityManagementService initialized")
 
     async def get_entity(
-        self, entity_model: str, entity_id: str, entity_version: str = ENTITY_VERSION
+        self,
+        entity_model: str,
+        entity_id: str,
+        entity_version: str = ENTITY_VERSION,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Retrieve a single entity by its technical ID.
@@ -43,6 +42,7 @@ class EntityManagementService:
             entity_model: The type of entity
             entity_id: The technical UUID of the entity
             entity_version: The entity model version
+            fields: JSON paths of the fields to return; all fields when omitted
 
         Returns:
             Dictionary containing entity data or error information
@@ -57,7 +57,7 @@ class EntityManagementService:
                 }
 
             result = await self.entity_service.get_by_id(
-                entity_id, entity_model, entity_version
+                entity_id, entity_model, entity_version, projection=fields
             )
 
             if not result:
@@ -88,7 +88,10 @@ class EntityManagementService:
             }
 
     async def list_entities(
-        self, entity_model: str, entity_version: str = ENTITY_VERSION
+        self,
+        entity_model: str,
+        entity_version: str = ENTITY_VERSION,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         List all entities of a specific type.
@@ -96,6 +99,7 @@ class EntityManagementService:
         Args:
             entity_model: The type of entity to list
             entity_version: The entity model version
+            fields: JSON paths of the fields to return; all fields when omitted
 
         Returns:
             Dictionary containing list of entities or error information
@@ -108,7 +112,9 @@ class EntityManagementService:
                     "entity_model": entity_model,
                 }
 
-            results = await self.entity_service.find_all(entity_model, entity_version)
+            results = await self.entity_service.find_all(
+                entity_model, entity_version, projection=fields
+            )
 
             entities = [
                 {"id": r.get_id(), "data": r.data, "state": r.metadata.state}
@@ -261,6 +267,17 @@ class EntityManagementService:
                 "entity_model": entity_model,
             }
 
+    def get_read_stats(self) -> Dict[str, Any]:
+        """
+        Get read coalescing and temporal cache statistics of the entity service.
+
+        Returns:
+            Dictionary containing the statistics; empty when the entity
+            service does not provide them
+        """
+        get_stats = getattr(self.entity_service, "get_read_stats", None)
+        return {"success": True, **(get_stats() if get_stats else {})}
+
     async def search_entities(
         self,
         entity_model: str,
@@ -286,40 +303,20 @@ class EntityManagementService:
                     "entity_model": entity_model,
                 }
 
-            # Build search request from conditions
-            builder = SearchConditionRequest.builder()
-
-            # Check if this is a Cyoda-style search condition
-            if (
-                isinstance(search_conditions, dict)
-                and search_conditions.get("type") == "group"
-            ):
-                # Handle complex Cyoda search structure (multiple conditions)
-                operator = search_conditions.get("operator", "AND").upper()
-                if operator == "AND":
-                    builder.operator(LogicalOperator.AND)
-                elif operator == "OR":
-                    builder.operator(LogicalOperator.OR)
-
-                conditions = search_conditions.get("conditions", [])
-                for condition in conditions:
-                    self._process_cyoda_condition(condition, builder)
-
-            elif isinstance(search_conditions, dict) and search_conditions.get(
-                "type"
-            ) in ["simple", "lifecycle"]:
-                # Handle single Cyoda condition (not wrapped in group)
-                self._process_cyoda_condition(search_conditions, builder)
-
+            if is_cyoda_condition(search_conditions):
+                # Cyoda-native condition: validated and forwarded as is
+                page = await self.entity_service.search_by_criteria(
+                    entity_model, search_conditions, entity_version
+                )
+                results = page.entities
             else:
                 # Handle simple field-value pairs (backward compatibility)
+                builder = SearchConditionRequest.builder()
                 for field, value in search_conditions.items():
                     builder.equals(field, value)
-
-            search_request = builder.build()
-            results = await self.entity_service.search(
-                entity_model, search_request, entity_version
-            )
+                results = await self.entity_service.search(
+                    entity_model, builder.build(), entity_version
+                )
 
             entities = [
                 {"id": r.get_id(), "data": r.data, "state": r.metadata.state}
@@ -342,36 +339,3 @@ class EntityManagementService:
                 "search_conditions": search_conditions,
                 "entity_model": entity_model,
             }
-
-    def _process_cyoda_condition(self, condition: Dict[str, Any], builder: Any) -> None:
-        """Process a single Cyoda condition and add it to the builder."""
-        condition_type = condition.get("type")
-
-        if condition_type == "lifecycle":
-            # Handle lifecycle conditions (entity state)
-            field = condition.get("field", "state")
-            operator_type = condition.get("operatorType", "EQUALS")
-            value = condition.get("value")
-
-            # Map Cyoda operators to internal operators using enum mapping
-            search_operator = CYODA_OPERATOR_MAPPING.get(
-                operator_type, SearchOperator.EQUALS
-            )
-            builder.add_condition(field, search_operator, value)
-
-        elif condition_type == "simple":
-            # Handle simple JSON path conditions
-            json_path = condition.get("jsonPath", "")
-            operator_type = condition.get("operatorType", "EQUALS")
-            value = condition.get("value")
-
-            # Convert JSON path to field name (remove $. prefix)
-            field = (
-                json_path.replace("$.", "") if json_path.startswith("$.") else json_path
-            )
-
-            # Map Cyoda operators to internal operators using enum mapping
-            search_operator = CYODA_OPERATOR_MAPPING.get(
-                operator_type, SearchOperator.EQUALS
-            )
-            builder.add_condition(field, search_operator, value)
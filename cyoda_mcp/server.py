@@ -23,6 +23,9 @@ from fastmcp import FastMCP  # noqa: E402
 
 from cyoda_mcp.tools.edge_message import mcp as mcp_edge_message  # noqa: E402
 from cyoda_mcp.tools.entity_management import mcp as mcp_entity  # noqa: E402
+from cyoda_mcp.tools.processor_management import (  # noqa: E402
+    mcp as mcp_processor_management,
+)
 from cyoda_mcp.tools.search import mcp as mcp_search  # noqa: E402
 from cyoda_mcp.tools.workflow_management import (  # noqa: E402
     mcp as mcp_workflow_management,
@@ -73,6 +76,7 @@ async def setup() -> None:
         await mcp.import_server(mcp_search, prefix="search")
         await mcp.import_server(mcp_edge_message, prefix="edge_message")
         await mcp.import_server(mcp_workflow_management, prefix="workflow_mgmt")
+        await mcp.import_server(mcp_processor_management, prefix="processor")
 
         logger.info("All MCP category servers imported successfully")
     except Exception as e:
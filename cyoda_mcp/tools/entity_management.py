@@ -6,7 +6,7 @@ This module provides FastMCP tools for entity management operations.
 
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastmcp import Context, FastMCP
 
@@ -27,6 +27,7 @@ async def get_entity_tool(
     entity_model: str,
     entity_id: str,
     entity_version: str = ENTITY_VERSION,
+    fields: Optional[List[str]] = None,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
@@ -36,6 +37,7 @@ async def get_entity_tool(
         entity_model: The type of entity (e.g., 'laureate', 'subscriber', 'job')
         entity_id: The technical UUID of the entity
         entity_version: The entity model version (default: from config)
+        fields: JSON paths of the fields to return; all fields when omitted
         ctx: FastMCP context for logging
 
     Returns:
@@ -46,13 +48,15 @@ async def get_entity_tool(
 
     entity_management_service = get_entity_management_service()
     return await entity_management_service.get_entity(
-        entity_model, entity_id, entity_version
+        entity_model, entity_id, entity_version, fields
     )
 
 
 @mcp.tool
 async def list_entities_tool(
-    entity_model: str, entity_version: str = ENTITY_VERSION
+    entity_model: str,
+    entity_version: str = ENTITY_VERSION,
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     List all entities of a specific type.
@@ -60,12 +64,15 @@ async def list_entities_tool(
     Args:
         entity_model: The type of entity to list
         entity_version: The entity model version
+        fields: JSON paths of the fields to return; all fields when omitted
 
     Returns:
         List of entities or error information
     """
     entity_management_service = get_entity_management_service()
-    return await entity_management_service.list_entities(entity_model, entity_version)
+    return await entity_management_service.list_entities(
+        entity_model, entity_version, fields
+    )
 
 
 @mcp.tool
@@ -152,3 +159,21 @@ async def delete_entity_tool(
     return await entity_management_service.delete_entity(
         entity_model, entity_id, entity_version
     )
+
+
+@mcp.tool
+async def get_entity_read_stats_tool(ctx: Optional[Context] = None) -> Dict[str, Any]:
+    """
+    Get how many entity reads were coalesced or served from the temporal cache.
+
+    Args:
+        ctx: FastMCP context for logging
+
+    Returns:
+        Coalesced read counts and point-in-time cache hits, misses and size
+    """
+    if ctx:
+        await ctx.info("Reading entity read statistics")
+
+    entity_management_service = get_entity_management_service()
+    return entity_management_service.get_read_stats()
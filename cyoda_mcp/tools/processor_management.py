@@ -0,0 +1,95 @@
+"""
+Processor Management MCP Presentation Layer
+
+This module provides FastMCP tools for inspecting processor health: circuit
+breaker and bulkhead state, timeouts and micro-batching statistics.
+"""
+
+import os
+import sys
+from typing import Any, Dict, Optional
+
+from fastmcp import Context, FastMCP
+
+from services.services import get_processor_manager
+
+# Add the parent directory to the path so we can import from the main app
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+# Create the MCP server for processor management operations
+mcp = FastMCP("Processor Management")
+
+
+@mcp.tool
+async def get_processor_health_tool(
+    processor_name: Optional[str] = None, ctx: Optional[Context] = None
+) -> Dict[str, Any]:
+    """
+    Get circuit breaker, bulkhead and timeout state of processors and criteria.
+
+    Args:
+        processor_name: Limit the result to one processor or criteria name
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dictionary containing per-name resilience state, timeout counts and
+        micro-batching statistics, or error information
+    """
+    if ctx:
+        await ctx.info(f"Reading processor health: {processor_name or 'all'}")
+
+    try:
+        processor_manager: Any = get_processor_manager()
+        resilience = processor_manager.get_resilience_stats()
+        timeouts = processor_manager.get_timeout_stats()
+        if processor_name:
+            resilience = {
+                name: stats
+                for name, stats in resilience.items()
+                if name == processor_name
+            }
+            timeouts = {
+                name: count
+                for name, count in timeouts.items()
+                if name == processor_name
+            }
+        return {
+            "success": True,
+            "processors": resilience,
+            "timeouts": timeouts,
+            "batching": processor_manager.get_batch_stats(),
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool
+async def reset_processor_circuit_tool(
+    processor_name: str, ctx: Optional[Context] = None
+) -> Dict[str, Any]:
+    """
+    Close the circuit breaker of a processor or criteria checker.
+
+    Args:
+        processor_name: Processor or criteria name
+        ctx: FastMCP context for logging
+
+    Returns:
+        Dictionary containing the reset result or error information
+    """
+    if ctx:
+        await ctx.info(f"Resetting circuit breaker: {processor_name}")
+
+    try:
+        processor_manager: Any = get_processor_manager()
+        if not processor_manager.reset_circuit(processor_name):
+            return {
+                "success": False,
+                "error": f"No circuit breaker for '{processor_name}'",
+                "processor_name": processor_name,
+            }
+        return {"success": True, "processor_name": processor_name}
+    except Exception as e:
+        return {"success": False, "error": str(e), "processor_name": processor_name}
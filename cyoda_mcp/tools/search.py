@@ -7,17 +7,13 @@ Contains only two tools: find_all and search.
 
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastmcp import Context, FastMCP
 
 from common.config.config import ENTITY_VERSION
-from common.service.entity_service import (
-    CYODA_OPERATOR_MAPPING,
-    LogicalOperator,
-    SearchConditionRequest,
-    SearchOperator,
-)
+from common.service.cyoda_conditions import is_cyoda_condition
+from common.service.entity_service import SearchConditionRequest, SearchPage
 from services.services import get_entity_service
 
 # Add the parent directory to the path so we can import from the main app
@@ -33,6 +29,7 @@ mcp = FastMCP("Search")
 async def find_all(
     entity_model: str,
     entity_version: str = ENTITY_VERSION,
+    fields: Optional[List[str]] = None,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
@@ -41,6 +38,8 @@ async def find_all(
     Args:
         entity_model: The type of entity to retrieve (e.g., 'laureate', 'subscriber', 'job')
         entity_version: The entity model version (default: from config)
+        fields: JSON paths of the fields to return (e.g., ['name', '$.address.city']);
+            all fields are returned when omitted
         ctx: FastMCP context for logging
 
     Returns:
@@ -58,7 +57,9 @@ async def find_all(
                 "entity_model": entity_model,
             }
 
-        results = await entity_service.find_all(entity_model, entity_version)
+        results = await entity_service.find_all(
+            entity_model, entity_version, projection=fields
+        )
 
         entities = [
             {
@@ -90,11 +91,19 @@ async def search(
     entity_model: str,
     search_conditions: Dict[str, Any],
     entity_version: str = ENTITY_VERSION,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """
     Search entities with Cyoda-native search conditions.
 
+    Pass ``limit`` to get results page by page: the response's
+    ``next_cursor`` is then passed as ``cursor`` to get the next page, and is
+    null on the last page. All pages are read at the point in time of the
+    first page, so concurrent writes do not shift results between pages.
+
     Args:
         entity_model: The type of entity to search (e.g., 'laureate', 'subscriber', 'job')
         search_conditions: Cyoda search condition structure:
@@ -117,10 +126,17 @@ async def search(
                 ]
             }
 
+            Groups may be nested. Cyoda conditions are validated and sent to
+            Cyoda as they are; an invalid one is reported as an error.
             For backward compatibility, simple field-value pairs are also supported:
             {"field1": "value1", "field2": "value2"}
 
         entity_version: The entity model version (default: from config)
+        fields: JSON paths of the fields to return (e.g., ['name', '$.address.city']);
+            all fields are returned when omitted
+        limit: Maximum entities per page; all results are returned when neither
+            limit nor cursor is given
+        cursor: next_cursor from the previous page
         ctx: FastMCP context for logging
 
     Returns:
@@ -140,41 +156,44 @@ async def search(
                 "entity_model": entity_model,
             }
 
-        # Build search request from Cyoda conditions
-        builder = SearchConditionRequest.builder()
-
-        # Check if this is a Cyoda-style search condition
-        if (
-            isinstance(search_conditions, dict)
-            and search_conditions.get("type") == "group"
-        ):
-            # Handle complex Cyoda search structure (multiple conditions)
-            operator = search_conditions.get("operator", "AND").upper()
-            if operator == "AND":
-                builder.operator(LogicalOperator.AND)
-            elif operator == "OR":
-                builder.operator(LogicalOperator.OR)
-
-            conditions = search_conditions.get("conditions", [])
-            for condition in conditions:
-                _process_cyoda_condition(condition, builder)
-
-        elif isinstance(search_conditions, dict) and search_conditions.get("type") in [
-            "simple",
-            "lifecycle",
-        ]:
-            # Handle single Cyoda condition (not wrapped in group)
-            _process_cyoda_condition(search_conditions, builder)
-
+        result_page: Optional[SearchPage] = None
+        if is_cyoda_condition(search_conditions):
+            # Cyoda-native condition: validated and forwarded as is
+            result_page = await entity_service.search_by_criteria(
+                entity_model,
+                search_conditions,
+                entity_version,
+                projection=fields,
+                limit=limit,
+                cursor=cursor,
+            )
         else:
-            # Handle simple field-value pairs (backward compatibility)
+            # Simple field-value pairs (backward compatibility)
+            builder = SearchConditionRequest.builder()
             for field, value in search_conditions.items():
                 builder.equals(field, value)
-
-        search_request = builder.build()
-        results = await entity_service.search(
-            entity_model, search_request, entity_version
-        )
+            if limit or cursor:
+                result_page = await entity_service.search_page(
+                    entity_model,
+                    builder.build(),
+                    entity_version,
+                    limit=limit,
+                    cursor=cursor,
+                    projection=fields,
+                )
+
+        page: Dict[str, Any] = {}
+        if result_page is None:
+            results = await entity_service.search(
+                entity_model, builder.build(), entity_version, projection=fields
+            )
+        else:
+            results = result_page.entities
+            if limit or cursor:
+                page = {
+                    "total": result_page.total,
+                    "next_cursor": result_page.next_cursor,
+                }
 
         entities = [
             {
@@ -196,6 +215,7 @@ async def search(
             "success": True,
             "count": len(entities),
             "entities": entities,
+            **page,
             "search_conditions": search_conditions,
             "entity_model": entity_model,
             "entity_version": entity_version,
@@ -212,37 +232,5 @@ async def search(
         }
 
 
-def _process_cyoda_condition(condition: Dict[str, Any], builder: Any) -> None:
-    """Process a single Cyoda condition and add it to the builder."""
-    condition_type = condition.get("type")
-
-    if condition_type == "lifecycle":
-        # Handle lifecycle conditions (entity state)
-        field = condition.get("field", "state")
-        operator_type = condition.get("operatorType", "EQUALS")
-        value = condition.get("value")
-
-        # Map Cyoda operators to internal operators using enum mapping
-        search_operator = CYODA_OPERATOR_MAPPING.get(
-            operator_type, SearchOperator.EQUALS
-        )
-        builder.add_condition(field, search_operator, value)
-
-    elif condition_type == "simple":
-        # Handle simple JSON path conditions
-        json_path = condition.get("jsonPath", "")
-        operator_type = condition.get("operatorType", "EQUALS")
-        value = condition.get("value")
-
-        # Convert JSON path to field name (remove $. prefix)
-        field = json_path.replace("$.", "") if json_path.startswith("$.") else json_path
-
-        # Map Cyoda operators to internal operators using enum mapping
-        search_operator = CYODA_OPERATOR_MAPPING.get(
-            operator_type, SearchOperator.EQUALS
-        )
-        builder.add_condition(field, search_operator, value)
-
-
 # Export the MCP server
 __all__ = ["mcp"]
@@ -118,10 +118,6 @@ class ExampleEntity(CyodaEntity):
 
         return self
 
-    def update_timestamp(self) -> None:
-        """Update the updated_at timestamp to current time"""
-        self.updated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
     def set_processed_data(self, processed_data: Dict[str, Any]) -> None:
         """Set processed data and update timestamp"""
         self.processed_data = processed_data
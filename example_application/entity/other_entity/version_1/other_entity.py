@@ -86,10 +86,6 @@ class OtherEntity(CyodaEntity):
             raise ValueError(f"Priority must be one of: {cls.ALLOWED_PRIORITIES}")
         return v
 
-    def update_timestamp(self) -> None:
-        """Update the updated_at timestamp to current time"""
-        self.updated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
     def set_source_entity(
         self, source_entity_id: str, updated_by: Optional[str] = None
     ) -> None:
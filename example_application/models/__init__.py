@@ -5,18 +5,25 @@ Provides request and response models for comprehensive API validation.
 """
 
 from .request_models import (
+    BulkTransitionItem,
+    BulkUpdateItem,
     EntityIdParam,
     ErrorResponse,
     ExampleEntityQueryParams,
     ExampleEntityUpdateQueryParams,
+    ExportQueryParams,
+    FieldsQueryParams,
     OtherEntityQueryParams,
     OtherEntitySearchRequest,
     OtherEntityUpdateQueryParams,
+    SearchPageQueryParams,
     SearchRequest,
     SuccessResponse,
     TransitionRequest,
 )
 from .response_models import (
+    BulkItemResponse,
+    BulkResponse,
     CountResponse,
     DeleteResponse,
 )
@@ -38,17 +45,24 @@ from .response_models import (
 
 __all__ = [
     # Request models
+    "BulkTransitionItem",
+    "BulkUpdateItem",
     "EntityIdParam",
     "ErrorResponse",
     "ExampleEntityQueryParams",
     "ExampleEntityUpdateQueryParams",
+    "ExportQueryParams",
+    "FieldsQueryParams",
     "OtherEntityQueryParams",
     "OtherEntitySearchRequest",
     "OtherEntityUpdateQueryParams",
+    "SearchPageQueryParams",
     "SearchRequest",
     "SuccessResponse",
     "TransitionRequest",
     # Response models
+    "BulkItemResponse",
+    "BulkResponse",
     "CountResponse",
     "DeleteResponse",
     "ExistsResponse",
@@ -50,6 +50,32 @@ class EntityListResponse(BaseModel):
     offset: Optional[int] = Field(default=None, description="Applied offset")
 
 
+class ExportQueryParams(BaseModel):
+    """Query parameters for streaming export endpoints."""
+
+    format: str = Field(
+        default="ndjson",
+        description="ndjson (one entity per line) or json (one array)",
+        pattern=r"^(ndjson|json)$",
+    )
+    chunk_size: Optional[int] = Field(
+        default=None,
+        alias="chunkSize",
+        description="Entities per page read and chunk written",
+        ge=1,
+        le=10000,
+    )
+
+
+class FieldsQueryParams(BaseModel):
+    """Query parameters for single-entity reads."""
+
+    fields: Optional[str] = Field(
+        default=None,
+        description="Comma-separated JSON paths of the fields to return",
+    )
+
+
 # ExampleEntity specific models
 class ExampleEntityQueryParams(BaseModel):
     """Query parameters for ExampleEntity endpoints."""
@@ -64,7 +90,16 @@ class ExampleEntityQueryParams(BaseModel):
         default=None, description="Filter by workflow state", pattern=r"^[a-z_]+$"
     )
     limit: int = Field(default=50, description="Number of results", ge=1, le=1000)
-    offset: int = Field(default=0, description="Pagination offset", ge=0)
+    offset: int = Field(
+        default=0, description="Entities to skip after the cursor position", ge=0
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="nextCursor of the previous page"
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        description="Comma-separated JSON paths of the fields to return",
+    )
 
     @field_validator("category")
     @classmethod
@@ -109,6 +144,37 @@ class TransitionRequest(BaseModel):
         return v
 
 
+class BulkUpdateItem(BaseModel):
+    """One item of a bulk update request."""
+
+    id: str = Field(..., description="Technical ID of the entity", min_length=1)
+    entity: Dict[str, Any] = Field(..., description="Updated entity data")
+    transition: Optional[str] = Field(
+        default=None, description="Workflow transition to trigger", pattern=r"^[a-z_]+$"
+    )
+
+
+class BulkTransitionItem(TransitionRequest):
+    """One item of a bulk transition request."""
+
+    id: str = Field(..., description="Technical ID of the entity", min_length=1)
+
+
+class SearchPageQueryParams(BaseModel):
+    """Query parameters for paging through search results."""
+
+    limit: Optional[int] = Field(
+        default=None,
+        description="Entities per page; all results are returned when neither "
+        "limit nor cursor is given",
+        ge=1,
+        le=1000,
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="nextCursor of the previous page"
+    )
+
+
 class SearchRequest(BaseModel):
     """Request model for entity search operations."""
 
@@ -151,7 +217,16 @@ class OtherEntityQueryParams(BaseModel):
         default=None, description="Filter by workflow state", pattern=r"^[a-z_]+$"
     )
     limit: int = Field(default=50, description="Number of results", ge=1, le=1000)
-    offset: int = Field(default=0, description="Pagination offset", ge=0)
+    offset: int = Field(
+        default=0, description="Entities to skip after the cursor position", ge=0
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="nextCursor of the previous page"
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        description="Comma-separated JSON paths of the fields to return",
+    )
 
     @field_validator("priority")
     @classmethod
@@ -81,6 +81,11 @@ class ExampleEntityListResponse(BaseModel):
     total: int = Field(..., description="Total number of entities")
     limit: Optional[int] = Field(default=None, description="Applied limit")
     offset: Optional[int] = Field(default=None, description="Applied offset")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        alias="nextCursor",
+        description="Cursor of the next page; null on the last page",
+    )
 
 
 class ExampleEntitySearchResponse(BaseModel):
@@ -91,6 +96,11 @@ class ExampleEntitySearchResponse(BaseModel):
     query: Optional[Dict[str, Any]] = Field(
         default=None, description="Applied search query"
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        alias="nextCursor",
+        description="Cursor of the next page; null on the last page",
+    )
 
 
 # OtherEntity Response Models
@@ -132,6 +142,11 @@ class OtherEntityListResponse(BaseModel):
     total: int = Field(..., description="Total number of entities")
     limit: Optional[int] = Field(default=None, description="Applied limit")
     offset: Optional[int] = Field(default=None, description="Applied offset")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        alias="nextCursor",
+        description="Cursor of the next page; null on the last page",
+    )
 
 
 # Workflow Response Models
@@ -142,11 +157,11 @@ class TransitionResponse(BaseModel):
     transition_name: str = Field(
         ..., alias="transitionName", description="Executed transition"
     )
-    previous_state: str = Field(
-        ..., alias="previousState", description="Previous workflow state"
+    previous_state: Optional[str] = Field(
+        default=None, alias="previousState", description="Previous workflow state"
     )
-    current_state: str = Field(
-        ..., alias="currentState", description="Current workflow state"
+    current_state: Optional[str] = Field(
+        default=None, alias="currentState", description="Current workflow state"
     )
     success: bool = Field(..., description="Transition success status")
     message: Optional[str] = Field(
@@ -224,3 +239,28 @@ class TransitionsResponse(BaseModel):
         ..., description="List of available transition names"
     )
     current_state: Optional[str] = Field(None, description="Current entity state")
+
+
+class BulkItemResponse(BaseModel):
+    """Result of one item of a bulk operation"""
+
+    index: int = Field(..., description="Position of the item in the request")
+    success: bool = Field(..., description="Whether the item was written")
+    id: Optional[str] = Field(default=None, description="Technical ID of the entity")
+    error: Optional[str] = Field(default=None, description="Why the item failed")
+    unknown: Optional[bool] = Field(
+        default=None,
+        description="The item may have been written; check before retrying it",
+    )
+
+
+class BulkResponse(BaseModel):
+    """Response model for bulk create, update and transition operations"""
+
+    total: int = Field(..., description="Number of items received")
+    succeeded: int = Field(..., description="Number of items written")
+    failed: int = Field(..., description="Number of items rejected or failed")
+    unknown: int = Field(
+        default=0, description="Number of items whose outcome could not be confirmed"
+    )
+    results: List[BulkItemResponse] = Field(..., description="Per-item results")
@@ -9,10 +9,11 @@ OtherEntity instances as specified in functional requirements.
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from common.entity.entity_casting import cast_entity
 from common.processor.base import CyodaEntity, CyodaProcessor
+from common.service.unit_of_work import UnitOfWorkError
 from example_application.entity.example_entity import ExampleEntity
 from example_application.entity.other_entity import (  # noqa: F401  # Imported for clarity; referenced by name in service calls
     OtherEntity,
@@ -100,55 +101,105 @@ class ExampleEntityProcessor(CyodaProcessor):
 
         return processed_data
 
-    async def _create_related_other_entities(self, entity: ExampleEntity) -> None:
+    async def process_batch(
+        self, entities: List[CyodaEntity], **kwargs: Any
+    ) -> List[CyodaEntity]:
         """
-        Create related OtherEntity instances according to functional requirements.
+        Process ExampleEntity instances that arrived together.
+
+        Enriches every entity and saves all related OtherEntity instances with
+        a single batched save instead of three saves per entity.
 
         Args:
-            entity: The processed ExampleEntity
+            entities: The ExampleEntity instances to process
+            **kwargs: Additional processing parameters
+
+        Returns:
+            The processed entities, in the same order
         """
-        entity_service = get_entity_service()
+        example_entities = [cast_entity(entity, ExampleEntity) for entity in entities]
+        related: List[Dict[str, Any]] = []
+        for example_entity in example_entities:
+            example_entity.processed_data = self._create_processed_data(example_entity)
+            related.extend(self._build_related_other_entities(example_entity))
+
+        try:
+            responses = await get_entity_service().save_all(
+                entities=related,
+                entity_class=OtherEntity.ENTITY_NAME,
+                entity_version=str(OtherEntity.ENTITY_VERSION),
+            )
+            self.logger.info(
+                f"Created {len(responses)} OtherEntity instances for "
+                f"{len(example_entities)} ExampleEntity instances"
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to create OtherEntity batch for "
+                f"{len(example_entities)} ExampleEntity instances: {str(e)}"
+            )
 
-        # Note: processing_id is available in processed_data but not needed for simplified OtherEntity creation
+        return list(example_entities)
 
-        # Create 3 related OtherEntity instances as specified
+    def _build_related_other_entities(
+        self, entity: ExampleEntity
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the 3 related OtherEntity payloads for a processed ExampleEntity.
+
+        Args:
+            entity: The processed ExampleEntity
+
+        Returns:
+            OtherEntity data ready for EntityService.save()
+        """
+        related: List[Dict[str, Any]] = []
         for i in range(1, 4):
-            try:
-                # Determine priority based on business rules
-                priority = self._determine_priority(entity.category, i)
-
-                # Create OtherEntity using direct Pydantic model construction
-                other_entity = OtherEntity(
-                    title=f"{entity.name}_Related_{i}",
-                    content=f"Generated from {entity.name} processing",
-                    priority=priority,
-                    sourceEntityId=entity.technical_id or entity.entity_id or "unknown",
-                    lastUpdatedBy="ExampleEntityProcessor",
-                )
+            # Create OtherEntity using direct Pydantic model construction
+            other_entity = OtherEntity(
+                title=f"{entity.name}_Related_{i}",
+                content=f"Generated from {entity.name} processing",
+                priority=self._determine_priority(entity.category, i),
+                sourceEntityId=entity.technical_id or entity.entity_id or "unknown",
+                lastUpdatedBy="ExampleEntityProcessor",
+            )
+            related.append(other_entity.model_dump(by_alias=True))
+        return related
 
-                # Convert Pydantic model to dict for EntityService.save()
-                other_entity_data = other_entity.model_dump(by_alias=True)
+    async def _create_related_other_entities(self, entity: ExampleEntity) -> None:
+        """
+        Create related OtherEntity instances according to functional requirements.
 
-                # Save the new OtherEntity using entity constants
-                response = await entity_service.save(
-                    entity=other_entity_data,
-                    entity_class=OtherEntity.ENTITY_NAME,
-                    entity_version=str(OtherEntity.ENTITY_VERSION),
-                )
+        The saves are independent, so they are flushed together through a unit
+        of work instead of being awaited one after another.
+
+        Args:
+            entity: The processed ExampleEntity
+        """
+        uow = get_entity_service().unit_of_work()
 
-                # Get the technical ID of the created entity
-                created_entity_id = response.metadata.id
+        # Create 3 related OtherEntity instances as specified
+        for other_entity_data in self._build_related_other_entities(entity):
+            uow.save(
+                entity=other_entity_data,
+                entity_class=OtherEntity.ENTITY_NAME,
+                entity_version=str(OtherEntity.ENTITY_VERSION),
+            )
 
-                self.logger.info(
-                    f"Created OtherEntity {created_entity_id} (index {i}) - workflow will handle state transitions automatically"
+        try:
+            await uow.flush()
+        except UnitOfWorkError as e:
+            # Keep the entities that were created even if some saves failed
+            for index, _operation, error in e.errors:
+                self.logger.error(
+                    f"Failed to create OtherEntity {index + 1} for ExampleEntity {entity.technical_id}: {str(error)}"
                 )
 
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to create OtherEntity {i} for ExampleEntity {entity.technical_id}: {str(e)}"
+        for index, response in enumerate(uow.results, start=1):
+            if response is not None:
+                self.logger.info(
+                    f"Created OtherEntity {response.metadata.id} (index {index}) - workflow will handle state transitions automatically"
                 )
-                # Continue with other entities even if one fails
-                continue
 
     def _determine_priority(self, category: str, index: int) -> str:
         """
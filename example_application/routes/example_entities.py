@@ -7,22 +7,40 @@ and workflow transitions as specified in functional requirements.
 
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from quart import Blueprint, jsonify, request
+from quart import Blueprint, Response, jsonify, request
 from quart.typing import ResponseReturnValue
 from quart_schema import (
+    document,
     operation_id,
     tag,
     validate,
     validate_querystring,
+    validate_request,
 )
 
+from common.config.config import EXPORT_CHUNK_SIZE
 from common.exception import is_not_found
-from common.service.entity_service import (
-    SearchConditionRequest,
+from common.service.bulk import (
+    BulkTransition,
+    BulkUpdate,
+    BulkWriter,
+    run_bulk,
+    summarize,
+)
+from common.service.entity_service import SearchConditionRequest
+from common.service.pagination import InvalidCursorError
+from common.service.projection import compile_projection, parse_fields
+from common.utils.http_cache import etag_headers, http_cache
+from common.utils.streaming import (
+    NDJSON_CONTENT_TYPE,
+    export_chunks,
+    ndjson_lines,
+    prefetch,
 )
 from services.services import get_entity_service
 
@@ -30,6 +48,9 @@ from services.services import get_entity_service
 from ..entity.example_entity import ExampleEntity  # noqa: F401
 from ..entity.other_entity import OtherEntity  # noqa: F401
 from ..models import (
+    BulkResponse,
+    BulkTransitionItem,
+    BulkUpdateItem,
     CountResponse,
     DeleteResponse,
     ErrorResponse,
@@ -39,6 +60,9 @@ from ..models import (
     ExampleEntitySearchResponse,
     ExampleEntityUpdateQueryParams,
     ExistsResponse,
+    ExportQueryParams,
+    FieldsQueryParams,
+    SearchPageQueryParams,
     SearchRequest,
     TransitionRequest,
     TransitionResponse,
@@ -66,6 +90,41 @@ def _to_entity_dict(data: Any) -> Dict[str, Any]:
     return data.model_dump(by_alias=True) if hasattr(data, "model_dump") else data
 
 
+async def _bulk_items() -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Decode the items of a bulk request body.
+
+    NDJSON bodies (Content-Type application/x-ndjson) are decoded line by line
+    as they stream in; anything else must be a JSON array. A line that is not
+    valid JSON is yielded as its decoding error.
+
+    Raises:
+        ValueError: If a non-NDJSON body is not a JSON array
+    """
+    if request.mimetype == NDJSON_CONTENT_TYPE:
+        index = 0
+        async for line in ndjson_lines(request.body):
+            try:
+                yield index, json.loads(line)
+            except ValueError as e:
+                yield index, ValueError(f"Invalid JSON: {e}")
+            index += 1
+        return
+    items = json.loads(await request.get_data())
+    if not isinstance(items, list):
+        raise ValueError("Request body must be a JSON array or NDJSON")
+    for index, item in enumerate(items):
+        yield index, item
+
+
+def _bulk_writer() -> BulkWriter:
+    return BulkWriter(
+        get_entity_service(),
+        ExampleEntity.ENTITY_NAME,
+        str(ExampleEntity.ENTITY_VERSION),
+    )
+
+
 example_entities_bp = Blueprint(
     "example_entities", __name__, url_prefix="/api/example-entities"
 )
@@ -117,9 +176,11 @@ async def create_example_entity(
 
 
 @example_entities_bp.route("/<entity_id>", methods=["GET"])
+@http_cache()
+@validate_querystring(FieldsQueryParams)
 @tag(["example-entities"])
 @operation_id("get_example_entity")
-@validate(
+@document(
     responses={
         200: (ExampleEntityResponse, None),
         404: (ErrorResponse, None),
@@ -127,7 +188,9 @@ async def create_example_entity(
         500: (ErrorResponse, None),
     }
 )
-async def get_example_entity(entity_id: str) -> ResponseReturnValue:
+async def get_example_entity(
+    entity_id: str, query_args: FieldsQueryParams
+) -> ResponseReturnValue:
     """Get ExampleEntity by ID with validation"""
     try:
         # Validate entity ID format
@@ -141,6 +204,7 @@ async def get_example_entity(entity_id: str) -> ResponseReturnValue:
             entity_id=entity_id,
             entity_class=ExampleEntity.ENTITY_NAME,
             entity_version=str(ExampleEntity.ENTITY_VERSION),
+            projection=parse_fields(query_args.fields),
         )
 
         if not response:
@@ -158,10 +222,11 @@ async def get_example_entity(entity_id: str) -> ResponseReturnValue:
 
 
 @example_entities_bp.route("", methods=["GET"])
+@http_cache()
 @validate_querystring(ExampleEntityQueryParams)
 @tag(["example-entities"])
 @operation_id("list_example_entities")
-@validate(
+@document(
     responses={
         200: (ExampleEntityListResponse, None),
         400: (ValidationErrorResponse, None),
@@ -172,48 +237,46 @@ async def list_example_entities(
     query_args: ExampleEntityQueryParams,
 ) -> ResponseReturnValue:
     """List ExampleEntities with optional filtering and validation"""
+    projection = parse_fields(query_args.fields)
+    try:
+        compile_projection(projection)
+    except ValueError as e:
+        return {"error": str(e), "code": "INVALID_FIELDS"}, 400
     try:
         # Build search conditions based on query parameters
-        search_conditions: Dict[str, str] = {}
+        builder = SearchConditionRequest.builder()
 
         if query_args.category:
-            search_conditions["category"] = query_args.category
+            builder.equals("category", query_args.category)
 
         if query_args.is_active is not None:
-            search_conditions["isActive"] = str(query_args.is_active).lower()
+            builder.equals("isActive", str(query_args.is_active).lower())
 
         if query_args.state:
-            search_conditions["state"] = query_args.state
+            builder.equals("state", query_args.state)
 
-        # Get entities
-        if search_conditions:
-            # Build search condition request
-            builder = SearchConditionRequest.builder()
-            for field, value in search_conditions.items():
-                builder.equals(field, value)
-            condition = builder.build()
-
-            entities = await service.search(
-                entity_class=ExampleEntity.ENTITY_NAME,
-                condition=condition,
-                entity_version=str(ExampleEntity.ENTITY_VERSION),
-            )
-        else:
-            entities = await service.find_all(
-                entity_class=ExampleEntity.ENTITY_NAME,
-                entity_version=str(ExampleEntity.ENTITY_VERSION),
-            )
-
-        # Thin proxy: return entities directly
-        entity_list = [_to_entity_dict(r.data) for r in entities]
-
-        # Apply pagination
-        start = query_args.offset
-        end = start + query_args.limit
-        paginated_entities = entity_list[start:end]
-
-        return jsonify({"entities": paginated_entities, "total": len(entity_list)}), 200
+        # Keyset page of stored entity documents, passed through without parsing
+        page = await service.search_page(
+            entity_class=ExampleEntity.ENTITY_NAME,
+            condition=builder.build(),
+            entity_version=str(ExampleEntity.ENTITY_VERSION),
+            limit=query_args.offset + query_args.limit,
+            cursor=query_args.cursor,
+            projection=projection,
+            raw=True,
+        )
 
+        body: Dict[str, Any] = {
+            "entities": page.items[query_args.offset :],
+            "total": page.total,
+        }
+        # The cursor carries a timestamp: weakly tag the entities so 304s still work
+        headers = etag_headers(body)
+        body["nextCursor"] = page.next_cursor
+        return body, 200, headers
+
+    except InvalidCursorError as e:
+        return {"error": str(e), "code": "INVALID_CURSOR"}, 400
     except Exception as e:  # pragma: no cover
         logger.exception("Error listing ExampleEntities: %s", str(e))
         return jsonify({"error": str(e)}), 500
@@ -262,7 +325,7 @@ async def update_example_entity(
         logger.info("Updated ExampleEntity %s", entity_id)
 
         # Return updated entity directly (thin proxy)
-        return jsonify(_to_entity_dict(response.data)), 200
+        return _to_entity_dict(response.data), 200
 
     except ValueError as e:
         logger.warning(
@@ -323,6 +386,7 @@ async def delete_example_entity(entity_id: str) -> ResponseReturnValue:
 
 
 @example_entities_bp.route("/by-business-id/<business_id>", methods=["GET"])
+@http_cache()
 @tag(["example-entities"])
 @operation_id("get_example_entity_by_business_id")
 @validate(
@@ -345,16 +409,16 @@ async def get_by_business_id(business_id: str) -> ResponseReturnValue:
         )
 
         if not result:
-            return jsonify({"error": "ExampleEntity not found"}), 404
+            return {"error": "ExampleEntity not found"}, 404
 
         # Thin proxy: return the entity directly
-        return jsonify(_to_entity_dict(result.data)), 200
+        return _to_entity_dict(result.data), 200
 
     except Exception as e:
         logger.exception(
             "Error getting ExampleEntity by business ID %s: %s", business_id, str(e)
         )
-        return jsonify({"error": str(e)}), 500
+        return {"error": str(e)}, 500
 
 
 @example_entities_bp.route("/<entity_id>/exists", methods=["GET"])
@@ -439,9 +503,11 @@ async def get_available_transitions(entity_id: str) -> ResponseReturnValue:
 
 
 @example_entities_bp.route("/search", methods=["POST"])
+@validate_querystring(SearchPageQueryParams)
 @tag(["example-entities"])
 @operation_id("search_example_entities")
-@validate(
+@validate_request(SearchRequest)
+@document(
     request=SearchRequest,
     responses={
         200: (ExampleEntitySearchResponse, None),
@@ -449,7 +515,9 @@ async def get_available_transitions(entity_id: str) -> ResponseReturnValue:
         500: (ErrorResponse, None),
     },
 )
-async def search_entities(data: SearchRequest) -> ResponseReturnValue:
+async def search_entities(
+    data: SearchRequest, query_args: SearchPageQueryParams
+) -> ResponseReturnValue:
     """Search ExampleEntities using simple field-value search with validation"""
     try:
         # Convert Pydantic model to dict for search
@@ -464,6 +532,20 @@ async def search_entities(data: SearchRequest) -> ResponseReturnValue:
             builder.equals(field, value)
 
         search_request = builder.build()
+        if query_args.limit or query_args.cursor:
+            page = await service.search_page(
+                entity_class=ExampleEntity.ENTITY_NAME,
+                condition=search_request,
+                entity_version=str(ExampleEntity.ENTITY_VERSION),
+                limit=query_args.limit,
+                cursor=query_args.cursor,
+            )
+            return {
+                "entities": [_to_entity_dict(r.data) for r in page.entities],
+                "total": page.total,
+                "nextCursor": page.next_cursor,
+            }, 200
+
         results = await service.search(
             entity_class=ExampleEntity.ENTITY_NAME,
             condition=search_request,
@@ -475,12 +557,15 @@ async def search_entities(data: SearchRequest) -> ResponseReturnValue:
 
         return {"entities": entities, "total": len(entities)}, 200
 
+    except InvalidCursorError as e:
+        return {"error": str(e), "code": "INVALID_CURSOR"}, 400
     except Exception as e:
         logger.exception("Error searching ExampleEntities: %s", str(e))
         return {"error": str(e)}, 500
 
 
 @example_entities_bp.route("/find-all", methods=["GET"])
+@http_cache()
 @tag(["example-entities"])
 @operation_id("find_all_example_entities")
 @validate(
@@ -502,6 +587,122 @@ async def find_all_entities() -> ResponseReturnValue:
         return {"error": str(e)}, 500
 
 
+@example_entities_bp.route("/export", methods=["GET"])
+@validate_querystring(ExportQueryParams)
+@tag(["example-entities"])
+@operation_id("export_example_entities")
+@validate(responses={500: (ErrorResponse, None)})
+async def export_example_entities(
+    query_args: ExportQueryParams,
+) -> ResponseReturnValue:
+    """Stream all ExampleEntities as NDJSON or a chunked JSON array"""
+    try:
+        pages = await prefetch(
+            service.iter_all(
+                entity_class=ExampleEntity.ENTITY_NAME,
+                entity_version=str(ExampleEntity.ENTITY_VERSION),
+                page_size=query_args.chunk_size or EXPORT_CHUNK_SIZE,
+            )
+        )
+        chunks, content_type = export_chunks(pages, query_args.format)
+        return Response(chunks, status=200, content_type=content_type)
+
+    except Exception as e:
+        logger.exception("Error exporting ExampleEntities: %s", str(e))
+        return {"error": str(e)}, 500
+
+
+# ---- Bulk Endpoints -------------------------------------------------------------
+
+
+def _parse_entity(item: Any) -> Dict[str, Any]:
+    entity_data: Dict[str, Any] = ExampleEntity.model_validate(item).model_dump(
+        by_alias=True
+    )
+    return entity_data
+
+
+def _parse_update(item: Any) -> BulkUpdate:
+    update = BulkUpdateItem.model_validate(item)
+    return BulkUpdate(update.id, _parse_entity(update.entity), update.transition)
+
+
+def _parse_transition(item: Any) -> BulkTransition:
+    transition = BulkTransitionItem.model_validate(item)
+    return BulkTransition(transition.id, transition.transition_name)
+
+
+@example_entities_bp.route("/bulk", methods=["POST"])
+@tag(["example-entities"])
+@operation_id("bulk_create_example_entities")
+@validate(
+    responses={
+        200: (BulkResponse, None),
+        400: (ErrorResponse, None),
+        500: (ErrorResponse, None),
+    }
+)
+async def bulk_create_example_entities() -> ResponseReturnValue:
+    """Create ExampleEntities from a JSON array or an NDJSON stream"""
+    try:
+        results = await run_bulk(_bulk_items(), _parse_entity, _bulk_writer().save)
+        return summarize(results), 200
+
+    except ValueError as e:
+        return {"error": str(e), "code": "INVALID_BODY"}, 400
+    except Exception as e:  # pragma: no cover
+        logger.exception("Error bulk creating ExampleEntities: %s", str(e))
+        return {"error": str(e)}, 500
+
+
+@example_entities_bp.route("/bulk", methods=["PUT"])
+@tag(["example-entities"])
+@operation_id("bulk_update_example_entities")
+@validate(
+    responses={
+        200: (BulkResponse, None),
+        400: (ErrorResponse, None),
+        500: (ErrorResponse, None),
+    }
+)
+async def bulk_update_example_entities() -> ResponseReturnValue:
+    """Update ExampleEntities given as {id, entity, transition} items"""
+    try:
+        results = await run_bulk(_bulk_items(), _parse_update, _bulk_writer().update)
+        return summarize(results), 200
+
+    except ValueError as e:
+        return {"error": str(e), "code": "INVALID_BODY"}, 400
+    except Exception as e:  # pragma: no cover
+        logger.exception("Error bulk updating ExampleEntities: %s", str(e))
+        return {"error": str(e)}, 500
+
+
+@example_entities_bp.route("/bulk/transitions", methods=["POST"])
+@tag(["example-entities"])
+@operation_id("bulk_transition_example_entities")
+@validate(
+    responses={
+        200: (BulkResponse, None),
+        400: (ErrorResponse, None),
+        500: (ErrorResponse, None),
+    }
+)
+async def bulk_transition_example_entities() -> ResponseReturnValue:
+    """Trigger workflow transitions given as {id, transitionName} items"""
+    try:
+        results = await run_bulk(
+            _bulk_items(), _parse_transition, _bulk_writer().transition
+        )
+        return summarize(results), 200
+
+    except ValueError as e:
+        return {"error": str(e), "code": "INVALID_BODY"}, 400
+    except Exception as e:  # pragma: no cover
+        logger.exception("Error bulk transitioning ExampleEntities: %s", str(e))
+        return {"error": str(e)}, 500
+
+
 @example_entities_bp.route("/<entity_id>/transitions", methods=["POST"])
 @tag(["example-entities"])
 @operation_id("trigger_example_entity_transition")
@@ -519,19 +720,7 @@ async def trigger_transition(
 ) -> ResponseReturnValue:
     """Trigger a specific workflow transition with validation"""
     try:
-        # Get current entity state
-        current_entity = await service.get_by_id(
-            entity_id=entity_id,
-            entity_class=ExampleEntity.ENTITY_NAME,
-            entity_version=str(ExampleEntity.ENTITY_VERSION),
-        )
-
-        if not current_entity:
-            return jsonify({"error": "ExampleEntity not found"}), 404
-
-        previous_state = current_entity.metadata.state
-
-        # Execute the transition
+        # One Cyoda call; the entity is not read before or after the transition
         response = await service.execute_transition(
             entity_id=entity_id,
             transition=data.transition_name,
@@ -545,23 +734,21 @@ async def trigger_transition(
             entity_id,
         )
 
-        return (
-            jsonify(
-                {
-                    "id": response.metadata.id,
-                    "message": "Transition executed successfully",
-                    "previousState": previous_state,
-                    "newState": response.metadata.state,
-                }
-            ),
-            200,
-        )
+        return {
+            "entity_id": response.metadata.id,
+            "transitionName": data.transition_name,
+            "currentState": response.metadata.state,
+            "success": True,
+            "message": "Transition executed successfully",
+        }, 200
 
-    except Exception as e:  # pragma: no cover
+    except Exception as e:
+        if is_not_found(e):
+            return {"error": "ExampleEntity not found", "code": "NOT_FOUND"}, 404
         logger.exception(
             "Error executing transition on ExampleEntity %s: %s", entity_id, str(e)
         )
-        return jsonify({"error": str(e)}), 500
+        return {"error": str(e)}, 500
 
 
 # ---- Temporal Query Endpoints (PR #41) ------------------------------------------
@@ -10,25 +10,36 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field
-from quart import Blueprint, request
+from quart import Blueprint, Response, request
+from quart.typing import ResponseReturnValue
 from quart_schema import (
+    document,
     operation_id,
     tag,
     validate,
     validate_querystring,
+    validate_request,
 )
 
+from common.config.config import EXPORT_CHUNK_SIZE
 from common.exception import is_not_found
 from common.service.entity_service import (
     SearchConditionRequest,
 )
+from common.service.pagination import InvalidCursorError
+from common.service.projection import compile_projection, parse_fields
+from common.utils.http_cache import etag_headers, http_cache
+from common.utils.streaming import export_chunks, prefetch
 from services.services import get_entity_service
 
 # Imported for entity constants
 from ..entity.other_entity import OtherEntity  # noqa: F401
 from ..models.request_models import (
+    ExportQueryParams,
+    FieldsQueryParams,
     OtherEntitySearchRequest,
     OtherEntityUpdateQueryParams,
+    SearchPageQueryParams,
     TransitionRequest,
 )
 from ..models.response_models import (
@@ -79,7 +90,15 @@ class OtherEntityQueryParams(BaseModel):
     )
     state: Optional[str] = Field(default=None, description="Filter by workflow state")
     limit: int = Field(default=50, description="Number of results")
-    offset: int = Field(default=0, description="Pagination offset")
+    offset: int = Field(
+        default=0, description="Entities to skip after the cursor position"
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="nextCursor of the previous page"
+    )
+    fields: Optional[str] = Field(
+        default=None, description="Comma-separated JSON paths of the fields to return"
+    )
 
 
 @other_entities_bp.route("", methods=["POST"])
@@ -120,9 +139,11 @@ async def create_other_entity(data: OtherEntity) -> Tuple[Dict[str, Any], int]:
 
 
 @other_entities_bp.route("/<entity_id>", methods=["GET"])
+@http_cache()
+@validate_querystring(FieldsQueryParams)
 @tag(["other-entities"])
 @operation_id("get_other_entity")
-@validate(
+@document(
     responses={
         200: (OtherEntityResponse, None),
         404: (ErrorResponse, None),
@@ -130,13 +151,16 @@ async def create_other_entity(data: OtherEntity) -> Tuple[Dict[str, Any], int]:
         500: (ErrorResponse, None),
     }
 )
-async def get_other_entity(entity_id: str) -> Tuple[Dict[str, Any], int]:
+async def get_other_entity(
+    entity_id: str, query_args: FieldsQueryParams
+) -> Tuple[Dict[str, Any], int]:
     """Get OtherEntity by ID with validation"""
     try:
         response = await service.get_by_id(
             entity_id=entity_id,
             entity_class=OtherEntity.ENTITY_NAME,
             entity_version=str(OtherEntity.ENTITY_VERSION),
+            projection=parse_fields(query_args.fields),
         )
 
         if not response:
@@ -154,10 +178,11 @@ async def get_other_entity(entity_id: str) -> Tuple[Dict[str, Any], int]:
 
 
 @other_entities_bp.route("", methods=["GET"])
+@http_cache()
 @validate_querystring(OtherEntityQueryParams)
 @tag(["other-entities"])
 @operation_id("list_other_entities")
-@validate(
+@document(
     responses={
         200: (OtherEntityListResponse, None),
         400: (ValidationErrorResponse, None),
@@ -166,50 +191,49 @@ async def get_other_entity(entity_id: str) -> Tuple[Dict[str, Any], int]:
 )
 async def list_other_entities(
     query_args: OtherEntityQueryParams,
-) -> Tuple[Dict[str, Any], int]:
+) -> ResponseReturnValue:
     """List OtherEntities with optional filtering and validation"""
+    projection = parse_fields(query_args.fields)
+    try:
+        compile_projection(projection)
+    except ValueError as e:
+        return {"error": str(e), "code": "INVALID_FIELDS"}, 400
     try:
         # Build search conditions based on query parameters
-        search_conditions = {}
+        condition_builder = SearchConditionRequest.builder()
 
         if query_args.source_entity_id:
-            search_conditions["sourceEntityId"] = query_args.source_entity_id
+            condition_builder.equals("sourceEntityId", query_args.source_entity_id)
 
         if query_args.priority:
-            search_conditions["priority"] = query_args.priority
+            condition_builder.equals("priority", query_args.priority)
 
         if query_args.state:
-            search_conditions["state"] = query_args.state
+            condition_builder.equals("state", query_args.state)
 
-        # Get entities
-        if search_conditions:
-            # Build SearchConditionRequest from the search conditions
-            condition_builder = SearchConditionRequest.builder()
-            for field, value in search_conditions.items():
-                condition_builder.equals(field, value)
-            condition = condition_builder.build()
-
-            entities = await service.search(
-                entity_class=OtherEntity.ENTITY_NAME,
-                condition=condition,
-                entity_version=str(OtherEntity.ENTITY_VERSION),
-            )
-        else:
-            entities = await service.find_all(
-                entity_class=OtherEntity.ENTITY_NAME,
-                entity_version=str(OtherEntity.ENTITY_VERSION),
-            )
-
-        # Thin proxy: return entities directly
-        entity_list = [_to_entity_dict(r.data) for r in entities]
+        # Keyset page of stored entity documents, passed through without parsing
+        page = await service.search_page(
+            entity_class=OtherEntity.ENTITY_NAME,
+            condition=condition_builder.build(),
+            entity_version=str(OtherEntity.ENTITY_VERSION),
+            limit=query_args.offset + query_args.limit,
+            cursor=query_args.cursor,
+            projection=projection,
+            raw=True,
+        )
 
-        # Apply pagination
-        start = query_args.offset
-        end = start + query_args.limit
-        paginated_entities = entity_list[start:end]
+        body: Dict[str, Any] = {
+            "entities": page.items[query_args.offset :],
+            "total": page.total,
+        }
 
-        return {"entities": paginated_entities, "total": len(entity_list)}, 200
+        # The cursor carries a timestamp: weakly tag the entities so 304s still work
+        headers = etag_headers(body)
+        body["nextCursor"] = page.next_cursor
+        return body, 200, headers
 
+    except InvalidCursorError as e:
+        return {"error": str(e), "code": "INVALID_CURSOR"}, 400
     except Exception as e:
         logger.exception("Error listing OtherEntities: %s", str(e))
         return {"error": str(e)}, 500
@@ -302,6 +326,7 @@ async def delete_other_entity(entity_id: str) -> Tuple[Dict[str, Any], int]:
 
 
 @other_entities_bp.route("/by-business-id/<business_id>", methods=["GET"])
+@http_cache()
 @tag(["other-entities"])
 @operation_id("get_other_entity_by_business_id")
 @validate(
@@ -437,10 +462,10 @@ async def trigger_transition(
 ) -> Tuple[Dict[str, Any], int]:
     """Trigger workflow transition for OtherEntity with validation"""
     try:
-        # Trigger the transition
-        response = await service.trigger_transition(
+        # Trigger the transition in a single Cyoda call
+        response = await service.execute_transition(
             entity_id=entity_id,
-            transition_name=data.transition_name,
+            transition=data.transition_name,
             entity_class=OtherEntity.ENTITY_NAME,
             entity_version=str(OtherEntity.ENTITY_VERSION),
         )
@@ -451,8 +476,13 @@ async def trigger_transition(
             entity_id,
         )
 
-        # Return transition result directly (thin proxy)
-        return _to_entity_dict(response.data), 200
+        return {
+            "entity_id": response.metadata.id,
+            "transitionName": data.transition_name,
+            "currentState": response.metadata.state,
+            "success": True,
+            "message": "Transition executed successfully",
+        }, 200
 
     except ValueError as e:
         logger.warning(
@@ -461,7 +491,9 @@ async def trigger_transition(
             str(e),
         )
         return {"error": str(e), "code": "VALIDATION_ERROR"}, 400
-    except Exception as e:  # pragma: no cover
+    except Exception as e:
+        if is_not_found(e):
+            return {"error": "OtherEntity not found", "code": "NOT_FOUND"}, 404
         logger.exception(
             "Error triggering transition for OtherEntity %s: %s", entity_id, str(e)
         )
@@ -472,9 +504,11 @@ async def trigger_transition(
 
 
 @other_entities_bp.route("/search", methods=["POST"])
+@validate_querystring(SearchPageQueryParams)
 @tag(["other-entities"])
 @operation_id("search_other_entities")
-@validate(
+@validate_request(OtherEntitySearchRequest)
+@document(
     request=OtherEntitySearchRequest,
     responses={
         200: (OtherEntityListResponse, None),
@@ -482,7 +516,9 @@ async def trigger_transition(
         500: (ErrorResponse, None),
     },
 )
-async def search_entities(data: OtherEntitySearchRequest) -> Tuple[Dict[str, Any], int]:
+async def search_entities(
+    data: OtherEntitySearchRequest, query_args: SearchPageQueryParams
+) -> Tuple[Dict[str, Any], int]:
     """Search OtherEntities using simple field-value search with validation"""
     try:
         # Convert Pydantic model to dict for search
@@ -497,6 +533,20 @@ async def search_entities(data: OtherEntitySearchRequest) -> Tuple[Dict[str, Any
             builder.equals(field, value)
 
         search_request = builder.build()
+        if query_args.limit or query_args.cursor:
+            page = await service.search_page(
+                entity_class=OtherEntity.ENTITY_NAME,
+                condition=search_request,
+                entity_version=str(OtherEntity.ENTITY_VERSION),
+                limit=query_args.limit,
+                cursor=query_args.cursor,
+            )
+            return {
+                "entities": [_to_entity_dict(r.data) for r in page.entities],
+                "total": page.total,
+                "nextCursor": page.next_cursor,
+            }, 200
+
         results = await service.search(
             entity_class=OtherEntity.ENTITY_NAME,
             condition=search_request,
@@ -507,12 +557,15 @@ async def search_entities(data: OtherEntitySearchRequest) -> Tuple[Dict[str, Any
         entities = [_to_entity_dict(r.data) for r in results]
         return {"entities": entities, "total": len(entities)}, 200
 
+    except InvalidCursorError as e:
+        return {"error": str(e), "code": "INVALID_CURSOR"}, 400
     except Exception as e:
         logger.exception("Error searching OtherEntities: %s", str(e))
         return {"error": str(e)}, 500
 
 
 @other_entities_bp.route("/find-all", methods=["GET"])
+@http_cache()
 @tag(["other-entities"])
 @operation_id("find_all_other_entities")
 @validate(responses={200: (OtherEntityListResponse, None), 500: (ErrorResponse, None)})
@@ -532,6 +585,31 @@ async def find_all_entities() -> Tuple[Dict[str, Any], int]:
         return {"error": str(e)}, 500
 
 
+@other_entities_bp.route("/export", methods=["GET"])
+@validate_querystring(ExportQueryParams)
+@tag(["other-entities"])
+@operation_id("export_other_entities")
+@validate(responses={500: (ErrorResponse, None)})
+async def export_other_entities(
+    query_args: ExportQueryParams,
+) -> ResponseReturnValue:
+    """Stream all OtherEntities as NDJSON or a chunked JSON array"""
+    try:
+        pages = await prefetch(
+            service.iter_all(
+                entity_class=OtherEntity.ENTITY_NAME,
+                entity_version=str(OtherEntity.ENTITY_VERSION),
+                page_size=query_args.chunk_size or EXPORT_CHUNK_SIZE,
+            )
+        )
+        chunks, content_type = export_chunks(pages, query_args.format)
+        return Response(chunks, status=200, content_type=content_type)
+
+    except Exception as e:
+        logger.exception("Error exporting OtherEntities: %s", str(e))
+        return {"error": str(e)}, 500
+
+
 # ---- Temporal Query Endpoints (PR #41) ------------------------------------------
 
 
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Bulk Route Throughput Benchmark
+
+Creates and updates ExampleEntities through the single-item routes and through
+the bulk routes (JSON array and NDJSON) using the Quart test client. The
+repository answers from memory after a fixed delay per call, standing in for
+the Cyoda round-trip, so the numbers show per-request overhead rather than
+backend speed.
+
+Usage:
+    python scripts/benchmarks/bench_bulk_routes.py
+    python scripts/benchmarks/bench_bulk_routes.py --items 2000 --latency-ms 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+# Add the project root to the path so we can import from the main app
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+for name in ("CYODA_HOST", "CYODA_CLIENT_ID", "CYODA_CLIENT_SECRET"):
+    os.environ.setdefault(name, "benchmark")
+
+from quart import Quart  # noqa: E402
+from quart_schema import QuartSchema  # noqa: E402
+
+from common.repository.crud_repository import CrudRepository  # noqa: E402
+from common.service.service import EntityServiceImpl  # noqa: E402
+from example_application.routes.example_entities import (  # noqa: E402
+    example_entities_bp,
+)
+
+ENTITY = {
+    "name": "Benchmark Entity",
+    "description": "Entity used for bulk route benchmarks",
+    "value": 42.0,
+    "category": "ELECTRONICS",
+    "isActive": True,
+}
+
+
+class LatencyRepository(CrudRepository[Any]):
+    """In-memory repository that waits a fixed time per call."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.storage: Dict[str, Any] = {}
+
+    async def _round_trip(self) -> None:
+        await asyncio.sleep(self.latency)
+
+    async def get_meta(self, token: str, entity_model: str, entity_version: str) -> Any:
+        return {"entity_model": entity_model, "entity_version": entity_version}
+
+    async def save(self, meta: Dict[str, Any], entity: Any) -> str:
+        await self._round_trip()
+        entity_id = f"id-{len(self.storage)}"
+        self.storage[entity_id] = entity
+        return entity_id
+
+    async def save_all(self, meta: Dict[str, Any], entities: List[Any]) -> Any:
+        return await self.save_all_ids(meta, entities)
+
+    async def save_all_ids(
+        self, meta: Dict[str, Any], entities: List[Any]
+    ) -> List[str]:
+        await self._round_trip()
+        ids = [f"id-{len(self.storage) + i}" for i in range(len(entities))]
+        self.storage.update(zip(ids, entities))
+        return ids
+
+    async def update(
+        self, meta: Dict[str, Any], entity_id: Any, entity: Optional[Any] = None
+    ) -> Any:
+        await self._round_trip()
+        self.storage[str(entity_id)] = entity
+        return entity_id
+
+    async def find_by_id(
+        self, meta: Dict[str, Any], entity_id: Any, point_in_time: Any = None
+    ) -> Any:
+        await self._round_trip()
+        return self.storage.get(str(entity_id))
+
+    async def find_all(self, meta: Dict[str, Any]) -> List[Any]:
+        return list(self.storage.values())
+
+    async def find_all_by_criteria(
+        self, meta: Dict[str, Any], criteria: Any, point_in_time: Any = None
+    ) -> List[Any]:
+        return []
+
+    async def delete_by_id(self, meta: Dict[str, Any], entity_id: Any) -> None:
+        self.storage.pop(str(entity_id), None)
+
+    async def count(self, meta: Dict[str, Any]) -> int:
+        return len(self.storage)
+
+    async def exists_by_key(self, meta: Dict[str, Any], key: Any) -> bool:
+        return str(key) in self.storage
+
+    async def get_entity_count(
+        self, meta: Dict[str, Any], point_in_time: Any = None
+    ) -> int:
+        return len(self.storage)
+
+    async def get_entity_changes_metadata(
+        self, entity_id: Any, point_in_time: Any = None
+    ) -> List[Any]:
+        return []
+
+
+async def timed(label: str, items: int, run: Callable[[], Awaitable[None]]) -> float:
+    started = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<35} {items / elapsed:10.0f} items/s  ({elapsed:6.2f} s)")
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", "-n", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    n = args.items
+
+    app = Quart(__name__)
+    QuartSchema(app)
+    app.register_blueprint(example_entities_bp)
+    client = app.test_client()
+
+    repository = LatencyRepository(args.latency_ms / 1000)
+    EntityServiceImpl._instance = None
+    service = EntityServiceImpl(repository)
+    base = "/api/example-entities"
+
+    async def single_create() -> None:
+        for _ in range(n):
+            await client.post(base, json=ENTITY)
+
+    async def bulk_create() -> None:
+        await client.post(f"{base}/bulk", json=[ENTITY] * n)
+
+    async def ndjson_create() -> None:
+        body = "".join(json.dumps(ENTITY) + "\n" for _ in range(n))
+        await client.post(
+            f"{base}/bulk",
+            data=body.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    async def single_update() -> None:
+        for i in range(n):
+            await client.put(f"{base}/id-{i}", json=ENTITY)
+
+    async def bulk_update() -> None:
+        items = [{"id": f"id-{i}", "entity": ENTITY} for i in range(n)]
+        await client.put(f"{base}/bulk", json=items)
+
+    print(
+        f"Bulk route benchmark ({n} items, {args.latency_ms:g} ms per repository call)\n"
+    )
+    with patch(
+        "example_application.routes.example_entities.get_entity_service",
+        return_value=service,
+    ):
+        single = await timed("single-item POST", n, single_create)
+        bulk = await timed("bulk POST (JSON array)", n, bulk_create)
+        await timed("bulk POST (NDJSON)", n, ndjson_create)
+        print(f"{'create speedup':<35} {single / bulk:10.1f}x\n")
+
+        single = await timed("single-item PUT", n, single_update)
+        bulk = await timed("bulk PUT", n, bulk_update)
+        print(f"{'update speedup':<35} {single / bulk:10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Entity Casting Micro-benchmark
+
+Compares the cost of resolving and casting entities before and after memoized
+class resolution.
+
+Usage:
+    python scripts/benchmarks/bench_entity_casting.py
+    python scripts/benchmarks/bench_entity_casting.py --iterations 50000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict
+
+# Add the project root to the path so we can import from the main app
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.entity.cyoda_entity import CyodaEntity  # noqa: E402
+from common.entity.entity_casting import (  # noqa: E402
+    _resolve_entity_class,
+    cast_entity,
+    dynamic_import_entity_class,
+)
+from example_application.entity.example_entity import ExampleEntity  # noqa: E402
+
+SEARCH_MODULES = [
+    "example_application.entity.example_entity",
+    "example_application.entity.other_entity",
+]
+
+ENTITY_DATA: Dict[str, Any] = {
+    "name": "Benchmark Entity",
+    "description": "Entity used for casting benchmarks",
+    "category": "ELECTRONICS",
+    "isActive": True,
+    "state": "validated",
+}
+
+# Same entity with a nested processing result, closer to real payload sizes
+LARGE_ENTITY_DATA: Dict[str, Any] = {
+    **ENTITY_DATA,
+    "processedData": {f"key_{i}": {"value": i, "tags": ["a", "b"]} for i in range(200)},
+}
+
+
+def report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<45} {seconds / iterations * 1e6:10.2f} us/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", "-n", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    uncached_resolve = _resolve_entity_class.__wrapped__
+    modules = tuple(SEARCH_MODULES)
+
+    print(f"Entity casting benchmark ({n} iterations)\n")
+    report(
+        "resolve class (uncached, hit)",
+        timeit.timeit(lambda: uncached_resolve("ExampleEntity", modules), number=n),
+        n,
+    )
+    report(
+        "resolve class (memoized, hit)",
+        timeit.timeit(
+            lambda: dynamic_import_entity_class("ExampleEntity", SEARCH_MODULES),
+            number=n,
+        ),
+        n,
+    )
+    report(
+        "resolve class (uncached, miss)",
+        timeit.timeit(lambda: uncached_resolve("MissingEntity", modules), number=n),
+        n,
+    )
+    report(
+        "resolve class (memoized, miss)",
+        timeit.timeit(
+            lambda: dynamic_import_entity_class("MissingEntity", SEARCH_MODULES),
+            number=n,
+        ),
+        n,
+    )
+    for label, data in (("small", ENTITY_DATA), ("large", LARGE_ENTITY_DATA)):
+        generic = CyodaEntity(**data)
+        report(
+            f"cast {label} (model_dump + re-validate)",
+            timeit.timeit(lambda: cast_entity(generic, ExampleEntity), number=n),
+            n,
+        )
+
+
+if __name__ == "__main__":
+    main()
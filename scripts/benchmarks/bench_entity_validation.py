@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Entity Validation Micro-benchmark
+
+Runs a typical processor mutation sequence on an ExampleEntity with the default
+per-assignment validation and with validation deferred to one final check.
+
+Usage:
+    python scripts/benchmarks/bench_entity_validation.py
+    python scripts/benchmarks/bench_entity_validation.py --iterations 50000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, ClassVar, Dict
+
+# Add the project root to the path so we can import from the main app
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.entity.cyoda_entity import deferred_validation  # noqa: E402
+from example_application.entity.example_entity import ExampleEntity  # noqa: E402
+
+ENTITY_DATA: Dict[str, Any] = {
+    "name": "Benchmark Entity",
+    "description": "Entity used for validation benchmarks",
+    "category": "ELECTRONICS",
+    "isActive": True,
+    "state": "validated",
+    "processedData": {f"key_{i}": {"value": i} for i in range(50)},
+}
+
+
+class DeferredExampleEntity(ExampleEntity):
+    """ExampleEntity opting in to deferred validation."""
+
+    DEFER_VALIDATION: ClassVar[bool] = True
+
+
+def processor_sequence(entity: ExampleEntity) -> None:
+    """Mutations a processor typically makes while handling one request."""
+    entity.set_state("processing")
+    entity.add_metadata("current_transition", "process")
+    entity.add_metadata("processor", "ExampleEntityProcessor")
+    entity.processed_data = {"enriched_category": "ELECTRONICS_PROCESSED"}
+    entity.add_metadata("related_entities", 3)
+    entity.validation_result = {"valid": True}
+    entity.set_state("processed")
+
+
+def run_default() -> None:
+    processor_sequence(ExampleEntity(**ENTITY_DATA))
+
+
+def run_deferred() -> None:
+    entity = DeferredExampleEntity(**ENTITY_DATA)
+    with deferred_validation():
+        processor_sequence(entity)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", "-n", type=int, default=10000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    baseline = timeit.timeit(lambda: ExampleEntity(**ENTITY_DATA), number=n) / n
+    default = timeit.timeit(run_default, number=n) / n - baseline
+    deferred = timeit.timeit(run_deferred, number=n) / n - baseline
+
+    print(f"Entity validation benchmark ({n} iterations, construction excluded)\n")
+    print(f"{'per-assignment validation':<35} {default * 1e6:10.2f} us/request")
+    print(f"{'deferred validation':<35} {deferred * 1e6:10.2f} us/request")
+    print(f"{'savings':<35} {(default - deferred) * 1e6:10.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Entity Service Result Shaping Micro-benchmark
+
+Times how EntityServiceImpl turns a page of raw repository items into
+EntityResponse objects for find_all and search, with and without a field
+projection. The repository answers from memory, so only service-side work
+(metadata lookup, registry lookup, model parsing, response construction) is
+measured.
+
+Usage:
+    python scripts/benchmarks/bench_result_shaping.py
+    python scripts/benchmarks/bench_result_shaping.py --entities 50000 -n 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+from unittest.mock import AsyncMock
+
+# Add the project root to the path so we can import from the main app
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+for name in ("CYODA_HOST", "CYODA_CLIENT_ID", "CYODA_CLIENT_SECRET"):
+    os.environ.setdefault(name, "benchmark")
+
+from common.service.entity_service import SearchConditionRequest  # noqa: E402
+from common.service.service import EntityServiceImpl  # noqa: E402
+from example_application.entity.example_entity import ExampleEntity  # noqa: E402
+
+
+def make_items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "technical_id": f"id-{i}",
+            "name": f"Entity {i}",
+            "description": "Entity used for result shaping benchmarks",
+            "value": float(i),
+            "category": "ELECTRONICS",
+            "isActive": True,
+            "state": "validated",
+        }
+        for i in range(count)
+    ]
+
+
+async def best_of(iterations: int, run: Callable[[], Awaitable[Any]]) -> float:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--iterations", "-n", type=int, default=5)
+    args = parser.parse_args()
+    count, n = args.entities, args.iterations
+
+    items = make_items(count)
+    repository = AsyncMock()
+    repository.get_meta.return_value = {"entity_model": ExampleEntity.ENTITY_NAME}
+    repository.find_all.return_value = items
+    repository.find_all_by_criteria.return_value = items
+    service = EntityServiceImpl(
+        repository, {ExampleEntity.ENTITY_NAME.lower(): ExampleEntity}
+    )
+    entity_class = ExampleEntity.ENTITY_NAME
+    condition = SearchConditionRequest.builder().equals("category", "ELECTRONICS")
+
+    async def per_item() -> None:
+        # Pre-page shaping: registry lookup and timestamp for every item
+        for item in items:
+            service._build_response(item, entity_class)
+
+    async def per_page() -> None:
+        service._build_responses(items, entity_class)
+
+    cases = [
+        ("per-item shaping", per_item),
+        ("per-page shaping", per_page),
+        ("find_all", lambda: service.find_all(entity_class)),
+        ("search", lambda: service.search(entity_class, condition.build())),
+        (
+            "find_all (projected: name, value)",
+            lambda: service.find_all(entity_class, projection=["name", "value"]),
+        ),
+    ]
+
+    print(f"Result shaping benchmark ({count} entities, best of {n})\n")
+    for label, run in cases:
+        elapsed = await best_of(n, run)
+        print(
+            f"{label:<35} {elapsed * 1000:10.1f} ms/page  "
+            f"{elapsed / count * 1e6:8.2f} us/entity"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+"""
+Unit tests for bulk entity writes.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from common.service.bulk import (
+    BulkItemResult,
+    BulkTransition,
+    BulkUpdate,
+    BulkWriter,
+    run_bulk,
+    summarize,
+)
+from common.service.entity_service import EntityMetadata, EntityResponse
+from common.service.service import BatchSaveMismatchError, EntityServiceError
+from common.service.unit_of_work import UnitOfWork
+
+
+def response(entity_id: str) -> EntityResponse:
+    return EntityResponse(data={}, metadata=EntityMetadata(id=entity_id))
+
+
+class BulkService:
+    """Entity service stand-in for bulk writes."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    async def save_all(
+        self, entities: List[Dict[str, Any]], entity_class: str, entity_version: str
+    ) -> List[EntityResponse]:
+        if any(entity.get("fail") for entity in entities):
+            raise EntityServiceError("Batch save failed: rejected", entity_class)
+        if any(entity.get("short") for entity in entities):
+            raise BatchSaveMismatchError(["id-x"], len(entities), entity_class)
+        self.batches.append(entities)
+        offset = sum(len(batch) for batch in self.batches[:-1])
+        return [response(f"id-{offset + i}") for i in range(len(entities))]
+
+    async def update(
+        self, entity_id: str, entity: Dict[str, Any], entity_class: str, **kwargs: Any
+    ) -> EntityResponse:
+        if entity_id == "missing":
+            raise EntityServiceError(f"Entity not found: {entity_id}", entity_class)
+        return response(entity_id)
+
+    async def execute_transition(
+        self, entity_id: str, transition: str, entity_class: str, entity_version: str
+    ) -> EntityResponse:
+        return await self.update(entity_id, {}, entity_class)
+
+    def unit_of_work(self, max_concurrency: int = 8) -> UnitOfWork:
+        return UnitOfWork(self, max_concurrency)  # type: ignore[arg-type]
+
+
+async def indexed(*items):
+    for index, item in enumerate(items):
+        yield index, item
+
+
+def parse(item: Any) -> Dict[str, Any]:
+    if not isinstance(item, dict):
+        raise ValueError("not an object")
+    return item
+
+
+class TestBulk:
+    """Test suite for run_bulk and BulkWriter."""
+
+    @pytest.fixture
+    def service(self):
+        return BulkService()
+
+    @pytest.mark.asyncio
+    async def test_saves_valid_items_in_chunks(self, service):
+        """Test chunked batch saves with invalid items reported in place."""
+        writer = BulkWriter(service, "Entity")  # type: ignore[arg-type]
+        items = indexed({"n": 0}, "bad", {"n": 2}, ValueError("Invalid JSON"), {"n": 4})
+
+        results = await run_bulk(items, parse, writer.save, chunk_size=2)
+
+        assert [len(batch) for batch in service.batches] == [2, 1]
+        assert [(r.index, r.success, r.id) for r in results] == [
+            (0, True, "id-0"),
+            (1, False, None),
+            (2, True, "id-1"),
+            (3, False, None),
+            (4, True, "id-2"),
+        ]
+        assert results[3].error == "Invalid JSON"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_its_items_only(self, service):
+        """Test that a rejected batch marks its own items failed."""
+        writer = BulkWriter(service, "Entity")  # type: ignore[arg-type]
+        items = indexed({"n": 0}, {"fail": True}, {"n": 2})
+
+        results = await run_bulk(items, parse, writer.save, chunk_size=2)
+
+        assert [r.success for r in results] == [False, False, True]
+        assert "rejected" in results[0].error
+
+    @pytest.mark.asyncio
+    async def test_id_mismatch_reports_unknown_outcome(self, service):
+        """Test that a batch Cyoda may have applied is not reported as failed."""
+        writer = BulkWriter(service, "Entity")  # type: ignore[arg-type]
+        items = indexed({"short": True}, {"n": 1})
+
+        results = await run_bulk(items, parse, writer.save, chunk_size=2)
+
+        assert [(r.success, r.unknown) for r in results] == [
+            (False, True),
+            (False, True),
+        ]
+        body = summarize(results)
+        assert (body["failed"], body["unknown"]) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_updates_and_transitions_report_per_item(self, service):
+        """Test that one failing update does not fail the others."""
+        writer = BulkWriter(service, "Entity")  # type: ignore[arg-type]
+
+        updates = await writer.update(
+            [(0, BulkUpdate("id-1", {})), (1, BulkUpdate("missing", {}, "approve"))]
+        )
+        transitions = await writer.transition([(5, BulkTransition("id-2", "approve"))])
+
+        assert [(r.index, r.success, r.id) for r in updates] == [
+            (0, True, "id-1"),
+            (1, False, None),
+        ]
+        assert "not found" in updates[1].error
+        assert transitions == [BulkItemResult(5, True, id="id-2")]
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_are_summarized(self):
+        """Test that pydantic errors are reported field by field."""
+        from example_application.models import BulkTransitionItem
+
+        results = await run_bulk(
+            indexed({"id": "x"}),
+            BulkTransitionItem.model_validate,
+            lambda chunk: None,  # type: ignore[arg-type,return-value]
+        )
+
+        assert results[0].error == "transitionName: Field required"
+
+    def test_summarize(self):
+        """Test the bulk response body."""
+        body = summarize([BulkItemResult(0, True, id="a"), BulkItemResult(1, False)])
+
+        assert body == {
+            "total": 2,
+            "succeeded": 1,
+            "failed": 1,
+            "unknown": 0,
+            "results": [
+                {"index": 0, "success": True, "id": "a"},
+                {"index": 1, "success": False},
+            ],
+        }
@@ -0,0 +1,153 @@
+"""
+Unit tests for single-flight read coalescing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.service.coalescing import SingleFlight, read_key
+from common.service.service import EntityServiceImpl
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        """Test that identical concurrent calls run the fetch once."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"items": [{"name": "a"}]}
+
+        flight = SingleFlight()
+        tasks = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results[0] == results[1] == results[2]
+        results[1]["items"][0]["name"] = "changed"
+        assert results[0]["items"][0]["name"] == "a"
+        assert flight.get_stats() == {
+            "calls": 3,
+            "executed": 1,
+            "coalesced": 2,
+            "in_flight": 0,
+            "evicted": 0,
+            "coalesced_ratio": 2 / 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_remembered(self):
+        """Test that waiters get the failure and the next call fetches again."""
+        fetch = AsyncMock(side_effect=[RuntimeError("down"), "ok"])
+        flight = SingleFlight()
+
+        results = await asyncio.gather(
+            flight.do("key", fetch), flight.do("key", fetch), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        assert await flight.do("key", fetch) == "ok"
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self):
+        """Test that cancelling the first caller leaves the shared fetch running."""
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "value"
+
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    def test_read_key_normalizes_criteria(self):
+        """Test that equal criteria and points in time give equal keys."""
+        assert read_key("search", "Order", "1", {"a": 1, "b": 2}) == read_key(
+            "search", "Order", "1", {"b": 2, "a": 1}
+        )
+        assert read_key("find_by_id", "Order", "1", "id-1") != read_key(
+            "find_by_id", "Order", "1", "id-1", "2024-01-01T00:00:00"
+        )
+
+
+class TestEntityServiceCoalescing:
+    """Test suite for coalesced reads in EntityServiceImpl."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_by_id_reads_once(self):
+        """Test that concurrent identical reads share one repository call."""
+        release = asyncio.Event()
+        repository = AsyncMock()
+        repository.get_meta.return_value = {"entity_model": "Order"}
+
+        async def find_by_id(meta, entity_id):
+            await release.wait()
+            return {"technical_id": entity_id, "name": "Order"}
+
+        repository.find_by_id.side_effect = find_by_id
+        service = EntityServiceImpl(repository)
+
+        tasks = [
+            asyncio.create_task(service.get_by_id("id-1", "Order", "1"))
+            for _ in range(4)
+        ]
+        tasks.append(asyncio.create_task(service.get_by_id("id-2", "Order", "1")))
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert repository.find_by_id.await_count == 2
+        assert [r.get_id() for r in results] == ["id-1"] * 4 + ["id-2"]
+        assert service.get_read_stats()["coalescing"]["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_starts_new_flight(self):
+        """Test that a read issued after a write does not join an older read."""
+        release = asyncio.Event()
+        repository = AsyncMock()
+        repository.get_meta.return_value = {"entity_model": "Order"}
+        stored = {"name": "old"}
+
+        async def find_by_id(meta, entity_id):
+            seen = dict(stored)
+            await release.wait()
+            return {"technical_id": entity_id, **seen}
+
+        async def update(meta, entity_id, entity):
+            stored.update(entity)
+            return entity_id
+
+        repository.find_by_id.side_effect = find_by_id
+        repository.update.side_effect = update
+        service = EntityServiceImpl(repository)
+
+        before = asyncio.create_task(service.get_by_id("id-1", "Order", "1"))
+        await asyncio.sleep(0.01)
+        await service.update("id-1", {"name": "new"}, "Order", "1")
+        after = asyncio.create_task(service.get_by_id("id-1", "Order", "1"))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert (await before).data["name"] == "old"
+        assert (await after).data["name"] == "new"
+        assert repository.find_by_id.await_count == 2
+        assert service.get_read_stats()["coalescing"]["evicted"] == 1
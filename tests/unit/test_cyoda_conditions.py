@@ -0,0 +1,139 @@
+"""
+Unit tests for Cyoda-native condition validation and passthrough search.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.service.cyoda_conditions import (
+    _validator,
+    is_cyoda_condition,
+    validate_cyoda_condition,
+)
+from common.service.service import EntityServiceImpl
+
+NESTED = {
+    "type": "group",
+    "operator": "OR",
+    "conditions": [
+        {
+            "type": "lifecycle",
+            "field": "state",
+            "operatorType": "EQUALS",
+            "value": "VALIDATED",
+        },
+        {
+            "type": "group",
+            "operator": "AND",
+            "conditions": [
+                {
+                    "type": "simple",
+                    "jsonPath": "$.category",
+                    "operatorType": "EQUALS",
+                    "value": "BOOKS",
+                },
+                {
+                    "type": "simple",
+                    "jsonPath": "$.price",
+                    "operatorType": "LESS_THAN",
+                    "value": 10,
+                },
+            ],
+        },
+    ],
+}
+
+
+class TestValidateCyodaCondition:
+    """Test suite for validate_cyoda_condition."""
+
+    def test_nested_group_is_returned_unchanged(self):
+        """Test that a valid group is passed through as the same object."""
+        assert validate_cyoda_condition(NESTED) is NESTED
+
+    def test_single_condition_is_wrapped_in_group(self):
+        """Test that a lone simple condition becomes an AND group."""
+        condition = NESTED["conditions"][1]["conditions"][0]
+
+        assert validate_cyoda_condition(condition) == {
+            "type": "group",
+            "operator": "AND",
+            "conditions": [condition],
+        }
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            {"type": "simple", "jsonPath": "$.a", "operatorType": "GREATER_THAN_OR"},
+            {"type": "simple", "operatorType": "EQUALS", "value": 1},
+            {"type": "group", "operator": "XOR", "conditions": []},
+            {
+                "type": "group",
+                "operator": "AND",
+                "conditions": [{"type": "unknown"}],
+            },
+        ],
+    )
+    def test_invalid_conditions_are_rejected(self, condition):
+        """Test that malformed conditions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid Cyoda condition"):
+            validate_cyoda_condition(condition)
+
+    def test_validator_is_built_once(self):
+        """Test that the compiled schema validator is reused."""
+        assert _validator() is _validator()
+
+    def test_is_cyoda_condition(self):
+        """Test detection of Cyoda-native conditions."""
+        assert is_cyoda_condition(NESTED)
+        assert not is_cyoda_condition({"category": "BOOKS"})
+
+
+class TestSearchByCriteria:
+    """Test suite for EntityServiceImpl.search_by_criteria."""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock()
+        repository.get_meta.return_value = {"entity_model": "Order"}
+        repository.find_all_by_criteria.return_value = [
+            {"technical_id": f"id-{n}", "name": f"Order {n}"} for n in (2, 1, 3)
+        ]
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_condition_is_forwarded_untouched(self, repository):
+        """Test that nested groups reach the repository as given."""
+        service = EntityServiceImpl(repository)
+
+        page = await service.search_by_criteria("Order", NESTED)
+
+        repository.find_all_by_criteria.assert_awaited_once()
+        assert repository.find_all_by_criteria.await_args.args[1:] == (NESTED, None)
+        assert len(page.entities) == 3
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_pages_by_cursor(self, repository):
+        """Test that a limit returns a page and a cursor to the next one."""
+        service = EntityServiceImpl(repository)
+
+        first = await service.search_by_criteria("Order", NESTED, limit=2)
+        second = await service.search_by_criteria(
+            "Order", NESTED, limit=2, cursor=first.next_cursor
+        )
+
+        assert [r.get_id() for r in first.entities] == ["id-1", "id-2"]
+        assert [r.get_id() for r in second.entities] == ["id-3"]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_condition_never_reaches_repository(self, repository):
+        """Test that validation fails before any repository call."""
+        service = EntityServiceImpl(repository)
+
+        with pytest.raises(ValueError):
+            await service.search_by_criteria("Order", {"type": "group"})
+
+        repository.find_all_by_criteria.assert_not_awaited()
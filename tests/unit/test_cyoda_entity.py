@@ -0,0 +1,112 @@
+"""
+Unit tests for CyodaEntity deferred validation.
+"""
+
+from typing import ClassVar
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from common.entity.cyoda_entity import (
+    CyodaEntity,
+    deferred_validation,
+    is_validation_deferred,
+)
+
+
+class CountedEntity(CyodaEntity):
+    """Entity with a typed field."""
+
+    count: int = 0
+
+
+class DeferredEntity(CyodaEntity):
+    """Entity class opting in to deferred validation."""
+
+    DEFER_VALIDATION: ClassVar[bool] = True
+
+    count: int = 0
+
+
+class TestDeferredValidation:
+    """Test suite for the deferred validation profile."""
+
+    def test_assignment_is_validated_by_default(self):
+        """Test that assignments are validated outside a deferred block."""
+        entity = CountedEntity()
+
+        with pytest.raises(ValidationError):
+            entity.count = "not a number"
+
+    def test_assignment_is_deferred_in_context(self):
+        """Test that opted-in assignments are stored as-is inside a block."""
+        entity = DeferredEntity()
+
+        with deferred_validation():
+            assert is_validation_deferred()
+            entity.count = "7"
+            assert entity.count == "7"
+
+        assert not is_validation_deferred()
+        assert entity.count == 7
+
+    def test_block_exit_rejects_invalid_values(self):
+        """Test that entities left unvalidated are checked when the block exits."""
+        entity = DeferredEntity()
+
+        with pytest.raises(ValidationError):
+            with deferred_validation():
+                entity.count = "not a number"
+
+    def test_validate_deferred_inside_block(self):
+        """Test that explicitly validated entities are not checked again on exit."""
+        entity = DeferredEntity()
+
+        with deferred_validation():
+            entity.count = "3"
+            entity.validate_deferred()
+            assert entity.count == 3
+            entity.__dict__["count"] = "bypassed"
+
+        assert entity.count == "bypassed"
+
+    def test_classes_without_opt_in_validate_in_block(self):
+        """Test that only opted-in classes defer and pay for the hook."""
+        entity = CountedEntity()
+
+        assert type(entity).__setattr__ is BaseModel.__setattr__
+        with deferred_validation():
+            with pytest.raises(ValidationError):
+                entity.count = "not a number"
+
+    def test_validate_deferred_keeps_fields_set_and_extras(self):
+        """Test that the final check does not mark every field as set."""
+        entity = DeferredEntity(extra_field="x")
+
+        with deferred_validation():
+            entity.count = 3
+
+        entity.validate_deferred()
+
+        assert entity.model_fields_set == {"extra_field", "count"}
+        assert entity.extra_field == "x"
+
+    def test_timestamp_is_reused_within_context(self):
+        """Test that one timestamp is generated per deferred block."""
+        first = CountedEntity()
+        second = CountedEntity()
+
+        with deferred_validation():
+            first.set_state("a")
+            first.add_metadata("key", "value")
+            second.update_timestamp()
+
+        assert first.updated_at is not None
+        assert first.updated_at == second.updated_at
+
+    def test_opt_in_validates_outside_block(self):
+        """Test that DEFER_VALIDATION alone does not skip validation."""
+        entity = DeferredEntity()
+
+        with pytest.raises(ValidationError):
+            entity.count = "not a number"
@@ -212,6 +212,19 @@ class TestCyodaRepository:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_find_by_id_failure_is_not_reported_as_missing(
+        self, repository, sample_meta
+    ):
+        """Test that a failed read raises instead of looking like a missing entity."""
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.return_value = {"json": None, "status": 500}
+
+            with pytest.raises(Exception, match="status 500"):
+                await repository.find_by_id(sample_meta, "test-id")
+
     @pytest.mark.asyncio
     async def test_find_by_id_with_non_dict_json(self, repository, sample_meta):
         """Test finding entity by ID when JSON is not a dict."""
@@ -280,6 +293,62 @@ class TestCyodaRepository:
             assert len(result) == 1
             assert result[0]["technical_id"] == "id-1"
 
+    @pytest.mark.asyncio
+    async def test_iter_all_pages_until_short_page(self, repository, sample_meta):
+        """Test that iter_all requests pages until a short one arrives."""
+        pages = [
+            [{"id": "id-1"}, {"id": "id-2"}],
+            [{"id": "id-3"}],
+        ]
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.side_effect = [{"json": p, "status": 200} for p in pages]
+
+            result = [page async for page in repository.iter_all(sample_meta, 2)]
+
+            assert [[e["technical_id"] for e in page] for page in result] == [
+                ["id-1", "id-2"],
+                ["id-3"],
+            ]
+            paths = [call.kwargs["path"] for call in mock_request.call_args_list]
+            assert paths[1].endswith("pageSize=2&pageNumber=1")
+            # Every page is read at the same point in time
+            assert len({path.split("&")[0] for path in paths}) == 1
+            assert "pointInTime=" in paths[0]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_raises_on_failed_page(self, repository, sample_meta):
+        """Test that a failed page raises instead of ending the export early."""
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.side_effect = [
+                {"json": [{"id": "id-1"}, {"id": "id-2"}], "status": 200},
+                {"json": None, "status": 500},
+            ]
+
+            pages = repository.iter_all(sample_meta, 2)
+            assert len(await pages.__anext__()) == 2
+            with pytest.raises(Exception, match="status 500"):
+                await pages.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_iter_all_stops_when_paging_is_ignored(self, repository, sample_meta):
+        """Test that a repeated full page ends the iteration instead of looping."""
+        page = [{"id": "id-1"}, {"id": "id-2"}]
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.return_value = {"json": page, "status": 200}
+
+            result = [page async for page in repository.iter_all(sample_meta, 2)]
+
+            assert [[e["technical_id"] for e in page] for page in result] == [
+                ["id-1", "id-2"]
+            ]
+            assert mock_request.call_count == 2
+
     @pytest.mark.asyncio
     async def test_save_success(self, repository, sample_meta, sample_entity_data):
         """Test saving entity successfully."""
@@ -658,6 +727,24 @@ class TestCyodaRepository:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_save_all_ids_returns_every_id(self, repository, sample_meta):
+        """Test that save_all_ids reports the ID of every saved entity."""
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request"
+        ) as mock_request:
+            mock_request.return_value = {
+                "json": [{"entityIds": ["id-1", "id-2"]}, {"entityIds": ["id-3"]}],
+                "status": 200,
+            }
+
+            result = await repository.save_all_ids(sample_meta, [{}, {}, {}])
+
+            assert result == ["id-1", "id-2", "id-3"]
+            mock_request.return_value = {"json": {"error": "bad"}, "status": 400}
+            with pytest.raises(Exception, match="batch save failed"):
+                await repository.save_all_ids(sample_meta, [{}])
+
     @pytest.mark.asyncio
     async def test_find_all_404_response(self, repository, sample_meta):
         """Test find_all with 404 response returns empty list."""
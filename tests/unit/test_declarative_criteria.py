@@ -0,0 +1,264 @@
+"""
+Unit tests for declarative criteria.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic import Field
+
+from common.config import config
+from common.entity.cyoda_entity import CyodaEntity
+from common.processor.base import CyodaCriteriaChecker
+from common.processor.declarative import (
+    DeclarativeCriteria,
+    DeclarativeCriteriaStore,
+    compile_condition,
+)
+from common.processor.errors import CriteriaNotFoundError
+from common.processor.manager import ProcessorManager
+
+EXAMPLE_RULES = (
+    Path(__file__).parents[2]
+    / "example_application"
+    / "criterion"
+    / "rules"
+    / "example_entity_rules.json"
+)
+
+
+class RuleEntity(CyodaEntity):
+    """Entity with aliased and nested fields."""
+
+    name: Optional[str] = None
+    category: Optional[str] = None
+    is_active: Optional[bool] = Field(default=None, alias="isActive")
+    price: Optional[float] = None
+    processed_data: Optional[Dict[str, Any]] = Field(
+        default=None, alias="processedData"
+    )
+
+
+class CategoryCriterion(CyodaCriteriaChecker):
+    """Python criteria sharing a name with a declarative rule."""
+
+    def __init__(self) -> None:
+        super().__init__(name="CategoryCriterion")
+
+    async def check(self, entity: CyodaEntity, **kwargs: Any) -> bool:
+        return True
+
+
+def matches(condition: Dict[str, Any], entity: Any) -> bool:
+    return compile_condition(condition)(entity)
+
+
+class TestCompileCondition:
+    """Test suite for rule compilation and operator semantics."""
+
+    @pytest.fixture
+    def entity(self):
+        return RuleEntity(
+            name="Widget",
+            category="BOOKS",
+            isActive=True,
+            price=12.5,
+            processedData={"status": "DONE"},
+        )
+
+    @pytest.mark.parametrize(
+        "field,operator,value,expected",
+        [
+            ("name", "eq", "Widget", True),
+            ("name", "ieq", "widget", True),
+            ("name", "ine", "WIDGET", False),
+            ("category", "ne", "HOME", True),
+            ("price", "gt", 10, True),
+            ("price", "lte", 12, False),
+            ("price", "between", [12.5, 20], False),
+            ("price", "between_inclusive", [12.5, 20], True),
+            ("name", "icontains", "DG", True),
+            ("name", "not_startswith", "Wid", False),
+            ("name", "iendswith", "GET", True),
+            ("name", "like", "W%g_t", True),
+            ("name", "matches_pattern", "[A-Z][a-z]+", True),
+            ("category", "in", ["BOOKS", "HOME"], True),
+            ("category", "not_in", ["BOOKS"], False),
+            ("missing", "is_null", None, True),
+            ("name", "not_null", None, True),
+            ("missing", "gt", 1, False),
+        ],
+    )
+    def test_operators(self, entity, field, operator, value, expected):
+        """Test each operator against an entity field."""
+        condition = {"field": field, "operator": operator, "value": value}
+
+        assert matches(condition, entity) is expected
+
+    def test_aliases_nested_paths_and_cyoda_operators(self, entity):
+        """Test aliases, $. paths and Cyoda operator names."""
+        assert matches({"field": "isActive", "operator": "eq", "value": True}, entity)
+        assert matches(
+            {
+                "jsonPath": "$.processedData.status",
+                "operatorType": "EQUALS",
+                "value": "DONE",
+            },
+            entity,
+        )
+        assert matches(
+            {"field": "processed_data.status", "operator": "IEQUALS", "value": "done"},
+            {"processed_data": {"status": "DONE"}},
+        )
+
+    def test_groups(self, entity):
+        """Test nested and/or groups."""
+        rule = {
+            "operator": "and",
+            "conditions": [
+                {"field": "name", "operator": "not_null"},
+                {
+                    "operator": "or",
+                    "conditions": [
+                        {"field": "category", "operator": "eq", "value": "HOME"},
+                        {"field": "price", "operator": "lt", "value": 20},
+                    ],
+                },
+            ],
+        }
+
+        assert matches(rule, entity) is True
+        assert matches(rule, RuleEntity(category="HOME")) is False
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            {"field": "name", "operator": "unknown"},
+            {"field": "name", "operator": "is_changed"},
+            {"field": "name", "operator": "between", "value": [1]},
+            {"field": "name", "operator": "in", "value": "abc"},
+            {"field": "name", "operator": "matches_pattern", "value": "("},
+            {"operator": "xor", "conditions": []},
+            {"operator": "eq", "value": 1},
+        ],
+    )
+    def test_invalid_rules_fail_at_compile_time(self, condition):
+        """Test that malformed rules are rejected when compiled."""
+        with pytest.raises(ValueError):
+            compile_condition(condition)
+
+
+class TestDeclarativeCriteria:
+    """Test suite for DeclarativeCriteria and hot reloading."""
+
+    def _write(self, path, name, category):
+        path.write_text(
+            json.dumps(
+                {
+                    "name": name,
+                    "rule": {"field": "category", "operator": "eq", "value": category},
+                }
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_example_rules(self):
+        """Test the shipped example rule file."""
+        (criteria,) = DeclarativeCriteriaStore([str(EXAMPLE_RULES)]).refresh()[0]
+        valid = RuleEntity(name="Laptop", category="ELECTRONICS", isActive=True)
+        valid.description = "A laptop"
+
+        assert await criteria.check(valid) is True
+        valid.is_active = False
+        assert await criteria.check(valid) is False
+
+    @pytest.mark.asyncio
+    async def test_manager_reloads_changed_files(self, tmp_path):
+        """Test that edited rule files are recompiled without a restart."""
+        rule_file = tmp_path / "rules.json"
+        self._write(rule_file, "CategoryCriterion", "BOOKS")
+        manager = ProcessorManager(
+            criteria_paths=[str(tmp_path)], criteria_reload_interval=0
+        )
+        entity = RuleEntity(category="HOME")
+
+        assert await manager.check_criteria("CategoryCriterion", entity) is False
+
+        self._write(rule_file, "CategoryCriterion", "HOME")
+        stat = os.stat(rule_file)
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert await manager.check_criteria("CategoryCriterion", entity) is True
+        assert manager.get_criteria_info("CategoryCriterion")["declarative"] is True
+
+    @pytest.mark.asyncio
+    async def test_removed_and_broken_files(self, tmp_path):
+        """Test that broken edits keep the old rule and deleted files unregister."""
+        rule_file = tmp_path / "rules.json"
+        self._write(rule_file, "CategoryCriterion", "BOOKS")
+        manager = ProcessorManager(
+            criteria_paths=[str(tmp_path)], criteria_reload_interval=0
+        )
+
+        rule_file.write_text("{not json")
+        stat = os.stat(rule_file)
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert isinstance(manager.criteria["CategoryCriterion"], DeclarativeCriteria)
+        assert manager.reload_declarative_criteria() == []
+        assert "CategoryCriterion" in manager.list_criteria()
+
+        rule_file.unlink()
+        with pytest.raises(CriteriaNotFoundError):
+            await manager.check_criteria("CategoryCriterion", RuleEntity())
+
+    def test_reload_interval_throttles_file_checks(self, tmp_path):
+        """Test that files are not re-checked before the interval passes."""
+        now = [0.0]
+        store = DeclarativeCriteriaStore(
+            [str(tmp_path)], reload_interval=5, clock=lambda: now[0]
+        )
+        store.refresh()
+        self._write(tmp_path / "rules.json", "CategoryCriterion", "BOOKS")
+
+        assert store.refresh() == ([], [])
+        now[0] = 5
+        assert [c.name for c in store.refresh()[0]] == ["CategoryCriterion"]
+
+    def test_broken_file_is_retried_only_after_it_changes(self, tmp_path, caplog):
+        """Test that a file failing to parse is not re-read on every refresh."""
+        rule_file = tmp_path / "rules.json"
+        rule_file.write_text("{not json")
+        store = DeclarativeCriteriaStore([str(tmp_path)], reload_interval=0)
+
+        assert store.refresh() == ([], [])
+        assert store.refresh() == ([], [])
+        assert caplog.text.count("Cannot load declarative criteria") == 1
+
+        self._write(rule_file, "CategoryCriterion", "BOOKS")
+        stat = os.stat(rule_file)
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert [c.name for c in store.refresh()[0]] == ["CategoryCriterion"]
+
+    def test_removed_rule_keeps_python_criteria(self, tmp_path):
+        """Test that deleting a rule file does not unregister Python criteria."""
+        rule_file = tmp_path / "rules.json"
+        self._write(rule_file, "CategoryCriterion", "BOOKS")
+        manager = ProcessorManager(
+            criteria_paths=[str(tmp_path)], criteria_reload_interval=0
+        )
+        python_criteria = CategoryCriterion()
+        manager.register_criteria(python_criteria)
+
+        rule_file.unlink()
+        manager.reload_declarative_criteria()
+
+        assert manager.criteria["CategoryCriterion"] is python_criteria
+
+    def test_default_paths_do_not_depend_on_working_directory(self):
+        """Test that the default rule directories are absolute."""
+        assert all(
+            os.path.isabs(path) for path in config.PROCESSOR_CRITERIA_PATHS.split(",")
+        )
@@ -3,12 +3,20 @@ Unit tests for entity casting utilities.
 """
 
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 from pydantic import Field
 
 from common.entity.cyoda_entity import CyodaEntity
-from common.entity.entity_casting import cast_entity, try_cast_entity
+from common.entity.entity_casting import (
+    cast_entity,
+    clear_entity_class_cache,
+    dynamic_import_entity_class,
+    get_entity_class_index,
+    smart_cast_entity,
+    try_cast_entity,
+)
 
 
 class SimpleEntity(CyodaEntity):
@@ -234,3 +242,60 @@ class TestEntityCastingEdgeCases:
 
         # Fallback means original entity is returned
         assert result is entity
+
+
+class TestEntityClassResolution:
+    """Test memoized entity class resolution."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and finish each test with empty caches."""
+        clear_entity_class_cache()
+        yield
+        clear_entity_class_cache()
+
+    def test_resolution_is_memoized(self):
+        """Test that repeated lookups do not import again."""
+        modules = [__name__]
+
+        with patch(
+            "common.entity.entity_casting.importlib.import_module",
+            wraps=__import__("importlib").import_module,
+        ) as import_module:
+            first = dynamic_import_entity_class("SimpleEntity", modules)
+            second = dynamic_import_entity_class("SimpleEntity", modules)
+
+        assert first is SimpleEntity
+        assert second is SimpleEntity
+        assert import_module.call_count == 1
+
+    def test_misses_are_memoized(self):
+        """Test negative caching of unresolvable names."""
+        modules = ["nonexistent.module.path"]
+
+        with patch(
+            "common.entity.entity_casting.importlib.import_module",
+            side_effect=ImportError,
+        ) as import_module:
+            assert dynamic_import_entity_class("Missing", modules) is None
+            assert dynamic_import_entity_class("Missing", modules) is None
+
+        assert import_module.call_count == 1
+
+    def test_index_includes_entity_names(self):
+        """Test that the default index covers the example entity packages."""
+        from example_application.entity.example_entity import ExampleEntity
+
+        index = get_entity_class_index()
+
+        assert index["exampleentity"] is ExampleEntity
+
+    def test_smart_cast_uses_index(self):
+        """Test that smart casting resolves lowercase hints through the index."""
+        from example_application.entity.example_entity import ExampleEntity
+
+        entity = CyodaEntity(name="Widget", description="A widget", category="BOOKS")
+
+        result = smart_cast_entity(entity, "example")
+
+        assert isinstance(result, ExampleEntity)
@@ -0,0 +1,104 @@
+"""
+Unit tests for the entity model registry and typed entity construction.
+"""
+
+from typing import ClassVar
+
+import pytest
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.entity.entity_factory import create_typed_entity
+from common.entity.model_registry import EntityModelRegistry
+from example_application.entity.example_entity import ExampleEntity
+from example_application.entity.other_entity import OtherEntity
+
+
+class SampleEntityV1(CyodaEntity):
+    """Sample entity, version 1."""
+
+    ENTITY_NAME: ClassVar[str] = "SampleEntity"
+    ENTITY_VERSION: ClassVar[int] = 1
+
+    name: str
+
+
+class SampleEntityV2(CyodaEntity):
+    """Sample entity, version 2."""
+
+    ENTITY_NAME: ClassVar[str] = "SampleEntity"
+    ENTITY_VERSION: ClassVar[int] = 2
+
+    name: str
+    value: int = 0
+
+
+class TestEntityModelRegistry:
+    """Test suite for EntityModelRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a registry with both sample versions."""
+        registry = EntityModelRegistry()
+        registry.register(SampleEntityV1)
+        registry.register(SampleEntityV2)
+        return registry
+
+    def test_lookup_by_name_and_version(self, registry):
+        """Test exact (name, version) lookup is case-insensitive."""
+        assert registry.get("SampleEntity", 1) is SampleEntityV1
+        assert registry.get("sampleentity", 2) is SampleEntityV2
+
+    def test_lookup_defaults_to_latest_version(self, registry):
+        """Test that missing or unknown versions resolve to the latest class."""
+        assert registry.get("sampleentity") is SampleEntityV2
+        assert registry.get("sampleentity", 99) is SampleEntityV2
+
+    def test_unknown_model(self, registry):
+        """Test that unknown models return None."""
+        assert registry.get("missing") is None
+
+    def test_discovers_example_entities(self):
+        """Test discovery from the example application entity package."""
+        registry = EntityModelRegistry(["example_application.entity"])
+
+        assert registry.get("ExampleEntity", 1) is ExampleEntity
+        assert registry.get("OtherEntity", 1) is OtherEntity
+        assert ("exampleentity", 1) in registry.list_models()
+
+
+class TestCreateTypedEntity:
+    """Test suite for create_typed_entity."""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a registry with the example entity."""
+        registry = EntityModelRegistry()
+        registry.register(ExampleEntity)
+        return registry
+
+    def test_validates_into_registered_class(self, registry):
+        """Test that the payload is validated directly into the typed class."""
+        entity = create_typed_entity(
+            "exampleentity",
+            {"name": "Widget", "description": "A widget", "category": "BOOKS"},
+            version=1,
+            registry=registry,
+        )
+
+        assert type(entity) is ExampleEntity
+        assert entity.name == "Widget"
+
+    def test_invalid_payload_falls_back_to_generic(self, registry):
+        """Test that payloads rejected by the typed class stay generic."""
+        entity = create_typed_entity(
+            "exampleentity", {"name": "Widget"}, registry=registry
+        )
+
+        assert type(entity) is CyodaEntity
+        assert entity.name == "Widget"
+
+    def test_unknown_model_is_generic(self, registry):
+        """Test that unknown models build a generic CyodaEntity."""
+        entity = create_typed_entity("unknown", {"name": "x"}, registry=registry)
+
+        assert type(entity) is CyodaEntity
@@ -182,6 +182,53 @@ class TestEntityServiceImpl:
         assert len(result) == 2
         assert all(isinstance(r, EntityResponse) for r in result)
 
+    @pytest.mark.asyncio
+    async def test_iter_all_yields_pages(self, service, repository):
+        """Test that iter_all yields the repository's pages."""
+        repository.storage = {
+            f"id-{i}": {"name": f"Entity {i}", "value": i, "technical_id": f"id-{i}"}
+            for i in range(5)
+        }
+
+        pages = [page async for page in service.iter_all("TestEntity", "1", 2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_reads_with_projection(self, service, repository):
+        """Test that projected reads keep only the requested fields and metadata."""
+        repository.storage = {
+            "id-1": {
+                "name": "Entity 1",
+                "value": 10,
+                "details": {"city": "Oslo", "zip": "0150"},
+                "technical_id": "id-1",
+                "state": "created",
+            },
+        }
+        condition = SearchConditionRequest.builder().equals("value", 10).build()
+
+        single = await service.get_by_id(
+            "id-1", "TestEntity", "1", projection=["name", "$.details.city"]
+        )
+        listed = await service.find_all("TestEntity", "1", projection=["value"])
+        found = await service.search(
+            "TestEntity", condition, "1", projection=["details"]
+        )
+
+        assert single.data == {"name": "Entity 1", "details": {"city": "Oslo"}}
+        assert single.metadata.id == "id-1"
+        assert single.metadata.state == "created"
+        assert listed[0].data == {"value": 10}
+        assert listed[0].metadata.id == "id-1"
+        assert found[0].data == {"details": {"city": "Oslo", "zip": "0150"}}
+
+    @pytest.mark.asyncio
+    async def test_invalid_projection_raises_value_error(self, service):
+        """Test that malformed projection paths are rejected before the read."""
+        with pytest.raises(ValueError):
+            await service.find_all("TestEntity", "1", projection=["a..b"])
+
     @pytest.mark.asyncio
     async def test_search_with_single_condition(self, service, repository):
         """Test searching entities with a single condition."""
@@ -310,6 +357,20 @@ class TestEntityServiceImpl:
 
         assert result is not None
         assert isinstance(result, EntityResponse)
+        assert result.get_id() == "test-id-1"
+
+    @pytest.mark.asyncio
+    async def test_execute_transition_is_one_repository_call(self, service, repository):
+        """Test that a transition is launched without reading the entity."""
+        repository.find_by_id = AsyncMock()
+        repository.update = AsyncMock(return_value=None)
+
+        await service.execute_transition("test-id-1", "approve", "TestEntity", "1")
+
+        repository.find_by_id.assert_not_called()
+        meta, entity_id, entity = repository.update.await_args.args
+        assert meta["update_transition"] == "approve"
+        assert (entity_id, entity) == ("test-id-1", None)
 
     @pytest.mark.asyncio
     async def test_get_entity_count(self, service, repository):
@@ -377,6 +438,31 @@ class TestEntityServiceImpl:
         assert result is not None
         assert result.data.get("name") == "Updated"
 
+    @pytest.mark.asyncio
+    async def test_business_id_writes_search_once(self, service, repository):
+        """Test that business ID updates and deletes need one search each."""
+        repository.storage["id-1"] = {
+            "business_id": "BIZ-123",
+            "technical_id": "id-1",
+        }
+        search = AsyncMock(wraps=repository.find_all_by_criteria)
+        repository.find_all_by_criteria = search
+
+        await service.update_by_business_id(
+            {"business_id": "BIZ-123", "name": "Updated"},
+            "business_id",
+            "TestEntity",
+            None,
+            "1",
+        )
+        assert await service.delete_by_business_id(
+            "TestEntity", "BIZ-123", "business_id", "1"
+        )
+
+        assert search.await_count == 2
+        assert search.await_args.args[1] == {"business_id": "BIZ-123"}
+        assert repository.storage == {}
+
     @pytest.mark.asyncio
     async def test_update_by_business_id_not_found(self, service):
         """Test updating entity by business ID when it doesn't exist."""
@@ -719,8 +805,10 @@ class TestEntityServiceImpl:
         assert result == 0
 
     @pytest.mark.asyncio
-    async def test_execute_transition_entity_not_found(self, service):
+    async def test_execute_transition_entity_not_found(self, service, repository):
         """Test executing transition when entity doesn't exist."""
+        repository.update = AsyncMock(side_effect=Exception("404 Entity not found"))
+
         with pytest.raises(EntityServiceError):
             await service.execute_transition(
                 "non-existent", "update", "TestEntity", "1"
@@ -914,8 +1002,7 @@ class TestEntityServiceImpl:
         with pytest.raises(EntityServiceError) as exc_info:
             await service.execute_transition("test-id-1", "update", "TestEntity", "1")
 
-        # The error comes from update method, not execute_transition
-        assert "Update failed" in str(exc_info.value)
+        assert "Execute transition failed" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_get_by_id_at_time_exception_handling(self, service, repository):
@@ -1405,6 +1492,58 @@ class TestEntityServiceImpl:
         assert len(results) == 3
         assert all(isinstance(r, EntityResponse) for r in results)
 
+    @pytest.mark.asyncio
+    async def test_save_all_uses_batch_ids(self, service, repository):
+        """Test that save_all maps each entity to its ID when the batch reports them."""
+        repository.save_all_ids = AsyncMock(return_value=["id-a", "id-b"])
+
+        results = await service.save_all(
+            [{"name": "Entity1", "value": 1}, {"name": "Entity2", "value": 2}],
+            "TestEntity",
+            "1",
+        )
+
+        assert [r.metadata.id for r in results] == ["id-a", "id-b"]
+        repository.save_all_ids.return_value = ["id-a"]
+        with pytest.raises(EntityServiceError):
+            await service.save_all([{"name": "a"}, {"name": "b"}], "TestEntity", "1")
+
+    @pytest.mark.asyncio
+    async def test_repository_meta_is_cached(self, service, repository):
+        """Test that repository meta is fetched once per class and version."""
+        repository.get_meta = AsyncMock(wraps=repository.get_meta)
+
+        await service.find_all("TestEntity", "1")
+        await service.search(
+            "TestEntity", SearchConditionRequest.builder().equals("name", "x").build()
+        )
+        await service.find_all("TestEntity", "1")
+        meta = await service._get_repository_meta(
+            "", "TestEntity", "1", {"update_transition": "approve"}
+        )
+
+        assert repository.get_meta.await_count == 2
+        assert meta["update_transition"] == "approve"
+        assert "update_transition" not in await service._get_repository_meta(
+            "", "TestEntity", "1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_all_parses_page_with_one_registry_lookup(self, repository):
+        """Test that a page is parsed with the model class looked up once."""
+        registry = MagicMock(wraps={"testentity": SampleEntity})
+        service = EntityServiceImpl(repository, registry)
+        repository.storage = {
+            f"id-{i}": {"name": f"Entity {i}", "value": i} for i in range(3)
+        }
+
+        results = await service.find_all("TestEntity", "1")
+
+        assert [r.data.name for r in results] == ["Entity 0", "Entity 1", "Entity 2"]
+        assert all(isinstance(r.data, SampleEntity) for r in results)
+        assert len({r.metadata.created_at for r in results}) == 1
+        registry.get.assert_called_once_with("testentity")
+
     @pytest.mark.asyncio
     async def test_save_all_without_repository_batch_support(self, repository):
         """Test save_all when repository doesn't support batch operations."""
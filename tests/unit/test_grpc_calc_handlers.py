@@ -3,9 +3,11 @@ Unit tests for gRPC calc and criteria_calc handlers.
 """
 
 import json
-from unittest.mock import AsyncMock, Mock
+from typing import Optional
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pydantic import Field
 
 from common.entity.cyoda_entity import CyodaEntity
 from common.exception.grpc_exceptions import (
@@ -16,10 +18,25 @@ from common.exception.grpc_exceptions import (
 from common.grpc_client.constants import CALC_REQ_EVENT_TYPE, CALC_RESP_EVENT_TYPE
 from common.grpc_client.handlers.calc import CalcRequestHandler
 from common.grpc_client.handlers.criteria_calc import CriteriaCalcRequestHandler
+from common.grpc_client.responses.payload import CalcPayloadMode
 from common.grpc_client.responses.spec import ResponseSpec
+from common.processor.errors import (
+    CriteriaTimeoutError,
+    CriteriaUnavailableError,
+    ProcessorTimeoutError,
+    ProcessorUnavailableError,
+)
 from common.proto.cloudevents_pb2 import CloudEvent
 
 
+class AliasedEntity(CyodaEntity):
+    """Typed entity with an aliased field."""
+
+    name: Optional[str] = None
+    is_active: Optional[bool] = Field(default=None, alias="isActive")
+    value: int = 0
+
+
 class TestCalcRequestHandler:
     """Test suite for CalcRequestHandler."""
 
@@ -178,6 +195,127 @@ class TestCalcRequestHandler:
         assert error.entity_id == "entity-456"
         assert "Processing failed" in str(error)
 
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_timeout_returns_failure(
+        self, handler, services, processor_manager, calc_event
+    ):
+        """Test that a processor timeout is answered with an explicit failure."""
+        processor_manager.process_entity.side_effect = ProcessorTimeoutError(
+            processor_name="test_processor", timeout=5.0, entity_id="entity-456"
+        )
+
+        result = await handler.handle(calc_event, services)
+
+        assert isinstance(result, ResponseSpec)
+        assert result.success is False
+        assert result.error["code"] == "PROCESSING_TIMEOUT"
+        assert result.error["retryable"] is True
+        assert result.data["payload"]["data"] == {"name": "Test", "value": 42}
+
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_open_circuit_returns_failure(
+        self, handler, services, processor_manager, calc_event
+    ):
+        """Test that a rejected call is answered with the circuit's retry hint."""
+        processor_manager.process_entity.side_effect = ProcessorUnavailableError(
+            processor_name="test_processor", reason="circuit_open", retry_after=12.5
+        )
+
+        result = await handler.handle(calc_event, services)
+
+        assert result.success is False
+        assert result.error["code"] == "PROCESSOR_UNAVAILABLE"
+        assert result.error["retryDelayMs"] == 12500
+        assert result.data["payload"]["data"] == {"name": "Test", "value": 42}
+
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_propagates_deadline(
+        self, handler, services, processor_manager, calc_event
+    ):
+        """Test that responseTimeoutMs from the request becomes the deadline."""
+        data = json.loads(calc_event.text_data)
+        data["parameters"] = {"responseTimeoutMs": 2500}
+        calc_event.text_data = json.dumps(data)
+        processor_manager.process_entity.return_value = CyodaEntity()
+
+        await handler.handle(calc_event, services)
+
+        assert processor_manager.process_entity.call_args.kwargs["timeout"] == 2.5
+
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_sends_only_changes(
+        self, services, processor_manager, calc_event
+    ):
+        """Test that the changes payload mode omits untouched fields."""
+
+        async def process_entity(processor_name, entity):
+            entity.value = 100
+            return entity
+
+        processor_manager.process_entity = process_entity
+        handler = CalcRequestHandler(payload_mode=CalcPayloadMode.CHANGES)
+
+        result = await handler.handle(calc_event, services)
+
+        data = result.data["payload"]["data"]
+        assert data["value"] == 100
+        assert "name" not in data
+        assert data["technical_id"] == "entity-456"
+
+    @pytest.mark.asyncio
+    async def test_trimmed_payloads_use_aliases_of_typed_entities(
+        self, services, processor_manager, calc_event
+    ):
+        """Test that aliased fields are diffed by alias and ids are not invented."""
+        payload = json.loads(calc_event.text_data)
+        payload["payload"]["data"] = {"name": "Test", "isActive": True, "value": 42}
+        calc_event.text_data = json.dumps(payload)
+
+        async def process_entity(processor_name, entity):
+            entity.value = 100
+            return entity
+
+        processor_manager.process_entity = process_entity
+
+        with patch(
+            "common.grpc_client.handlers.calc.create_typed_entity",
+            side_effect=lambda entity_type, data, version: AliasedEntity(**data),
+        ):
+            changes = await CalcRequestHandler(
+                payload_mode=CalcPayloadMode.CHANGES
+            ).handle(calc_event, services)
+            trimmed = await CalcRequestHandler(
+                payload_mode=CalcPayloadMode.EXCLUDE_DEFAULTS
+            ).handle(calc_event, services)
+
+        assert changes.data["payload"]["data"] == {
+            "value": 100,
+            "technical_id": "entity-456",
+        }
+        assert trimmed.data["payload"]["data"] == {
+            "name": "Test",
+            "isActive": True,
+            "value": 100,
+            "technical_id": "entity-456",
+        }
+
+    @pytest.mark.asyncio
+    async def test_handle_calc_request_excludes_defaults(
+        self, services, processor_manager, calc_event
+    ):
+        """Test that the exclude_defaults payload mode omits default fields."""
+        processor_manager.process_entity = AsyncMock(
+            side_effect=lambda processor_name, entity: entity
+        )
+        handler = CalcRequestHandler(payload_mode=CalcPayloadMode.EXCLUDE_DEFAULTS)
+
+        result = await handler.handle(calc_event, services)
+
+        data = result.data["payload"]["data"]
+        assert data["name"] == "Test"
+        assert "state" not in data
+        assert "updated_at" not in data
+
 
 class TestCriteriaCalcRequestHandler:
     """Test suite for CriteriaCalcRequestHandler."""
@@ -316,3 +454,34 @@ class TestCriteriaCalcRequestHandler:
         assert isinstance(result, ResponseSpec)
         assert result.success is True
         assert result.data["matches"] is False
+
+    @pytest.mark.asyncio
+    async def test_handle_criteria_calc_timeout_returns_failure(
+        self, handler, services, processor_manager, criteria_event
+    ):
+        """Test that a criteria timeout is answered with an explicit failure."""
+        processor_manager.check_criteria.side_effect = CriteriaTimeoutError(
+            criteria_name="test_criteria", timeout=1.0
+        )
+
+        result = await handler.handle(criteria_event, services)
+
+        assert result.success is False
+        assert result.data["matches"] is False
+        assert result.error["code"] == "PROCESSING_TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_handle_criteria_calc_bulkhead_full_returns_failure(
+        self, handler, services, processor_manager, criteria_event
+    ):
+        """Test that a criteria call rejected by its bulkhead fails fast."""
+        processor_manager.check_criteria.side_effect = CriteriaUnavailableError(
+            criteria_name="test_criteria", reason="bulkhead_full"
+        )
+
+        result = await handler.handle(criteria_event, services)
+
+        assert result.success is False
+        assert result.data["matches"] is False
+        assert result.error["code"] == "PROCESSOR_UNAVAILABLE"
+        assert result.error["retryDelayMs"] == 1000
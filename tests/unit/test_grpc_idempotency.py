@@ -0,0 +1,227 @@
+"""
+Unit tests for the calc request idempotency cache.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.grpc_client.constants import (
+    CALC_REQ_EVENT_TYPE,
+    CALC_RESP_EVENT_TYPE,
+    KEEP_ALIVE_EVENT_TYPE,
+)
+from common.grpc_client.idempotency import IdempotencyCache
+from common.grpc_client.middleware.dispatch import DispatchMiddleware
+from common.grpc_client.outbox import Outbox
+from common.grpc_client.responses.builders import (
+    CalcResponseBuilder,
+    ResponseBuilderRegistry,
+)
+from common.grpc_client.responses.spec import ResponseSpec
+from common.grpc_client.router import EventRouter
+from common.proto.cloudevents_pb2 import CloudEvent
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(event_id: str) -> CloudEvent:
+    event = CloudEvent()
+    event.id = event_id
+    event.type = CALC_RESP_EVENT_TYPE
+    return event
+
+
+class TestIdempotencyCache:
+    """Test suite for IdempotencyCache."""
+
+    @pytest.mark.asyncio
+    async def test_replays_completed_response(self):
+        """Test that a second call with the same key does not recompute."""
+        cache = IdempotencyCache()
+        compute = AsyncMock(return_value=_response("resp-1"))
+
+        first = await cache.get_or_compute("req-1", compute)
+        second = await cache.get_or_compute("req-1", compute)
+
+        assert first is second
+        compute.assert_called_once()
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        """Test that expired entries are recomputed."""
+        clock = FakeClock()
+        cache = IdempotencyCache(ttl_seconds=10, clock=clock)
+        compute = AsyncMock(return_value=_response("resp-1"))
+
+        await cache.get_or_compute("req-1", compute)
+        clock.now = 11
+        await cache.get_or_compute("req-1", compute)
+
+        assert compute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test that the cache is bounded by max_entries."""
+        cache = IdempotencyCache(max_entries=2)
+        compute = AsyncMock(return_value=_response("resp"))
+
+        await cache.get_or_compute("a", compute)
+        await cache.get_or_compute("b", compute)
+        await cache.get_or_compute("a", compute)  # touch "a"
+        await cache.get_or_compute("c", compute)  # evicts "b"
+
+        assert len(cache) == 2
+        await cache.get_or_compute("b", compute)
+        assert compute.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_coalesces_in_flight_duplicates(self):
+        """Test that concurrent duplicates share one computation."""
+        cache = IdempotencyCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _response("resp-1")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_compute("req-1", compute))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert cache.get_stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """Test that a failed computation is retried on redelivery."""
+        cache = IdempotencyCache()
+        compute = AsyncMock(side_effect=[RuntimeError("boom"), _response("resp-1")])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("req-1", compute)
+        result = await cache.get_or_compute("req-1", compute)
+
+        assert result.id == "resp-1"
+        assert compute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_are_not_replayed(self):
+        """Test that the cacheable predicate can veto storing a response."""
+        cache = IdempotencyCache()
+        compute = AsyncMock(return_value=_response("resp-1"))
+
+        await cache.get_or_compute("req-1", compute, cacheable=lambda _: False)
+        await cache.get_or_compute("req-1", compute, cacheable=lambda _: False)
+
+        assert compute.call_count == 2
+        assert len(cache) == 0
+
+    def test_rejects_non_positive_max_entries(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            IdempotencyCache(max_entries=0)
+
+
+class TestDispatchMiddlewareIdempotency:
+    """Test suite for idempotent dispatch of calc requests."""
+
+    @pytest.fixture
+    def builders(self):
+        registry = ResponseBuilderRegistry()
+        registry.register(CALC_RESP_EVENT_TYPE, CalcResponseBuilder())
+        return registry
+
+    def _calc_event(self, request_id: str) -> CloudEvent:
+        event = CloudEvent()
+        event.id = f"event-{request_id}"
+        event.type = CALC_REQ_EVENT_TYPE
+        event.text_data = json.dumps({"requestId": request_id, "entityId": "e-1"})
+        return event
+
+    @pytest.mark.asyncio
+    async def test_duplicate_request_replays_response(self, builders):
+        """Test that a redelivered request is answered without re-running the handler."""
+        router = EventRouter()
+        outbox = Outbox()
+        handler = AsyncMock(
+            return_value=ResponseSpec(
+                response_type=CALC_RESP_EVENT_TYPE,
+                data={"requestId": "req-1", "entityId": "e-1", "payload": {}},
+            )
+        )
+        router.register(CALC_REQ_EVENT_TYPE, handler)
+        middleware = DispatchMiddleware(
+            router, builders, outbox, idempotency_cache=IdempotencyCache()
+        )
+
+        await middleware.handle(self._calc_event("req-1"))
+        await middleware.handle(self._calc_event("req-1"))
+
+        handler.assert_called_once()
+        first = await outbox._queue.get()
+        second = await outbox._queue.get()
+        assert first.id == second.id
+
+    @pytest.mark.asyncio
+    async def test_non_calc_events_bypass_cache(self, builders):
+        """Test that only calc requests are deduplicated."""
+        router = EventRouter()
+        handler = AsyncMock(return_value=None)
+        router.register(KEEP_ALIVE_EVENT_TYPE, handler)
+        middleware = DispatchMiddleware(
+            router, builders, Outbox(), idempotency_cache=IdempotencyCache()
+        )
+
+        event = CloudEvent()
+        event.id = "keepalive-1"
+        event.type = KEEP_ALIVE_EVENT_TYPE
+        event.text_data = json.dumps({"requestId": "req-1"})
+
+        await middleware.handle(event)
+        await middleware.handle(event)
+
+        assert handler.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_response_is_not_replayed(self, builders):
+        """Test that a redelivered request is re-run after a failure response."""
+        router = EventRouter()
+        handler = AsyncMock(
+            return_value=ResponseSpec(
+                response_type=CALC_RESP_EVENT_TYPE,
+                data={"requestId": "req-1", "entityId": "e-1", "payload": {}},
+                success=False,
+                error={"code": "PROCESSING_TIMEOUT", "message": "late"},
+            )
+        )
+        router.register(CALC_REQ_EVENT_TYPE, handler)
+        middleware = DispatchMiddleware(
+            router, builders, Outbox(), idempotency_cache=IdempotencyCache()
+        )
+
+        await middleware.handle(self._calc_event("req-1"))
+        await middleware.handle(self._calc_event("req-1"))
+
+        assert handler.call_count == 2
+        assert middleware._failed_response_ids == set()
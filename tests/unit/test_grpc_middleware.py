@@ -2,14 +2,21 @@
 Unit tests for gRPC middleware components.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from common.exception.grpc_exceptions import (
+    ProcessingError,
+    ValidationError,
+)
 from common.grpc_client.constants import (
     CALC_REQ_EVENT_TYPE,
+    CALC_RESP_EVENT_TYPE,
     CRITERIA_CALC_REQ_EVENT_TYPE,
+    CRITERIA_CALC_RESP_EVENT_TYPE,
     ERROR_EVENT_TYPE,
     EVENT_ACK_TYPE,
     GREET_EVENT_TYPE,
@@ -23,6 +30,8 @@ from common.grpc_client.middleware.metrics import MetricsMiddleware
 from common.grpc_client.outbox import Outbox
 from common.grpc_client.responses.builders import (
     AckResponseBuilder,
+    CalcResponseBuilder,
+    CriteriaCalcResponseBuilder,
     ResponseBuilderRegistry,
 )
 from common.grpc_client.responses.spec import ResponseSpec
@@ -370,6 +379,55 @@ class TestDispatchMiddleware:
         # Should still send response despite logging error
         assert not outbox._queue.empty()
 
+    @pytest.mark.asyncio
+    async def test_handle_large_request_builds_off_loop(self, router, builders, outbox):
+        """Test that large requests build their response in a worker thread."""
+        middleware = DispatchMiddleware(
+            router, builders, outbox, offload_threshold_bytes=10
+        )
+        handler = AsyncMock(
+            return_value=ResponseSpec(
+                response_type=EVENT_ACK_TYPE, data={}, source_event_id="source-123"
+            )
+        )
+        router.register("TestEvent", handler)
+
+        event = CloudEvent()
+        event.id = "test-123"
+        event.type = "TestEvent"
+        event.text_data = json.dumps({"payload": "x" * 100})
+
+        with patch(
+            "common.grpc_client.middleware.dispatch.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            await middleware.handle(event)
+
+        to_thread.assert_called_once()
+        assert not outbox._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_handle_records_payload_sizes(self, middleware, router):
+        """Test that request and response sizes are recorded per response type."""
+        handler = AsyncMock(
+            return_value=ResponseSpec(
+                response_type=EVENT_ACK_TYPE, data={}, source_event_id="source-123"
+            )
+        )
+        router.register("TestEvent", handler)
+
+        event = CloudEvent()
+        event.id = "test-123"
+        event.type = "TestEvent"
+        event.text_data = json.dumps({"payload": "x" * 1000})
+
+        await middleware.handle(event)
+
+        stats = middleware.get_payload_stats()[EVENT_ACK_TYPE]
+        assert stats["responses"] == 1
+        assert 0 < stats["max_response_bytes"] == stats["response_bytes"]
+        assert stats["response_to_request_ratio"] < 1
+
 
 class TestErrorMiddleware:
     """Test suite for ErrorMiddleware."""
@@ -421,6 +479,96 @@ class TestErrorMiddleware:
         assert result is None
 
 
+class TestErrorMiddlewareFailureResponses:
+    """Test suite for failure responses emitted by ErrorMiddleware."""
+
+    @pytest.fixture
+    def outbox(self):
+        """Create Outbox instance."""
+        return Outbox()
+
+    @pytest.fixture
+    def middleware(self, outbox):
+        """Create ErrorMiddleware wired to builders and an outbox."""
+        builders = ResponseBuilderRegistry()
+        builders.register(CALC_RESP_EVENT_TYPE, CalcResponseBuilder())
+        builders.register(CRITERIA_CALC_RESP_EVENT_TYPE, CriteriaCalcResponseBuilder())
+        return ErrorMiddleware(builders=builders, outbox=outbox)
+
+    def _failing_successor(self, middleware, error):
+        successor = MiddlewareLink()
+        successor.handle = AsyncMock(side_effect=error)
+        middleware.set_successor(successor)
+
+    def _event(self, event_type, data):
+        event = CloudEvent()
+        event.id = "event-1"
+        event.type = event_type
+        event.text_data = json.dumps(data)
+        return event
+
+    @pytest.mark.asyncio
+    async def test_processing_error_sends_retryable_failure(self, middleware, outbox):
+        """Test that a failed calc request is answered with a retry hint."""
+        self._failing_successor(
+            middleware,
+            ProcessingError(processor_name="proc", entity_id="e-1", message="boom"),
+        )
+        payload = {"data": {"name": "x"}}
+        event = self._event(
+            CALC_REQ_EVENT_TYPE,
+            {"requestId": "req-1", "entityId": "e-1", "payload": payload},
+        )
+
+        await middleware.handle(event)
+
+        response = outbox._queue.get_nowait()
+        data = json.loads(response.text_data)
+        assert response.type == CALC_RESP_EVENT_TYPE
+        assert data["requestId"] == "req-1"
+        assert data["success"] is False
+        assert data["payload"] == payload
+        assert data["error"]["code"] == "PROCESSING_FAILED"
+        assert data["error"]["retryable"] is True
+        assert data["error"]["retryDelayMs"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_validation_error_is_not_retryable(self, middleware, outbox):
+        """Test that non-recoverable errors carry no retry delay."""
+        self._failing_successor(middleware, ValidationError(message="bad data"))
+        event = self._event(
+            CRITERIA_CALC_REQ_EVENT_TYPE, {"requestId": "req-2", "entityId": "e-2"}
+        )
+
+        await middleware.handle(event)
+
+        data = json.loads(outbox._queue.get_nowait().text_data)
+        assert data["matches"] is False
+        assert data["error"]["retryable"] is False
+        assert "retryDelayMs" not in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_non_calc_event_gets_no_response(self, middleware, outbox):
+        """Test that only calc requests are answered."""
+        self._failing_successor(middleware, Exception("boom"))
+
+        await middleware.handle(self._event(KEEP_ALIVE_EVENT_TYPE, {}))
+
+        assert outbox._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_request_without_id_gets_no_response(self, middleware, outbox):
+        """Test that unparseable calc requests cannot be answered."""
+        self._failing_successor(middleware, Exception("boom"))
+        event = CloudEvent()
+        event.type = CALC_REQ_EVENT_TYPE
+        event.text_data = "not json"
+
+        await middleware.handle(event)
+
+        assert outbox._queue.empty()
+
+
 class TestMetricsMiddleware:
     """Test suite for MetricsMiddleware."""
 
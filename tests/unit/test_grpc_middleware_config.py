@@ -175,6 +175,19 @@ class TestMiddlewareRegistry:
 
         assert isinstance(middleware, ErrorMiddleware)
 
+    def test_create_error_middleware_with_outbox(self, registry):
+        """Test that error middleware receives builders and outbox."""
+        config = MiddlewareConfig(type=MiddlewareType.ERROR)
+        builders = ResponseBuilderRegistry()
+        outbox = Outbox()
+
+        middleware = registry.create_middleware(
+            config, builders=builders, outbox=outbox
+        )
+
+        assert middleware._builders is builders
+        assert middleware._outbox is outbox
+
     def test_create_dispatch_middleware(self, registry):
         """Test creating dispatch middleware."""
         config = MiddlewareConfig(type=MiddlewareType.DISPATCH)
@@ -187,6 +200,22 @@ class TestMiddlewareRegistry:
         )
 
         assert isinstance(middleware, DispatchMiddleware)
+        assert middleware._idempotency_cache is not None
+
+    def test_create_dispatch_middleware_idempotency_disabled(self, registry):
+        """Test disabling the calc request idempotency cache via config."""
+        config = MiddlewareConfig(
+            type=MiddlewareType.DISPATCH, config={"idempotency_enabled": False}
+        )
+
+        middleware = registry.create_middleware(
+            config,
+            router=EventRouter(),
+            builders=ResponseBuilderRegistry(),
+            outbox=Outbox(),
+        )
+
+        assert middleware._idempotency_cache is None
 
     def test_create_dispatch_middleware_missing_dependencies(self, registry):
         """Test creating dispatch middleware without required dependencies."""
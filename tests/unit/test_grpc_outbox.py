@@ -273,3 +273,85 @@ class TestOutbox:
         assert len(events) == 2
         assert events[0].type == JOIN_EVENT_TYPE
         assert events[1].id == "event-1"
+
+
+class TestOutboxBurstMode:
+    """Test suite for Outbox burst (batched) delivery."""
+
+    def _event(self, index: int) -> CloudEvent:
+        event = CloudEvent()
+        event.id = f"event-{index}"
+        event.type = CALC_RESP_EVENT_TYPE
+        event.text_data = json.dumps({"requestId": f"req-{index}"})
+        return event
+
+    @pytest.mark.asyncio
+    async def test_default_outbox_is_not_batching(self):
+        """Test that batching is opt-in."""
+        assert Outbox().batching_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_burst_preserves_order_and_count(self):
+        """Test that bursts yield every event in order."""
+        outbox = Outbox(batch_size=3)
+        for i in range(7):
+            await outbox.send(self._event(i))
+        await outbox.close()
+
+        events = [event async for event in outbox.event_generator()]
+
+        assert [e.id for e in events[1:]] == [f"event-{i}" for i in range(7)]
+        stats = outbox.get_stats()
+        assert stats["sent"] == 7
+        assert stats["bursts"] == 3
+        assert outbox._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_collects_late_events(self):
+        """Test that a partial burst waits up to flush_interval for more events."""
+        outbox = Outbox(batch_size=10, flush_interval=0.05)
+
+        async def send_events():
+            await outbox.send(self._event(0))
+            await asyncio.sleep(0.01)
+            await outbox.send(self._event(1))
+            await outbox.close()
+
+        events = []
+
+        async def collect_events():
+            async for event in outbox.event_generator():
+                events.append(event)
+
+        await asyncio.gather(collect_events(), send_events())
+
+        assert [e.id for e in events[1:]] == ["event-0", "event-1"]
+        assert outbox.get_stats()["bursts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_stops_at_sentinel(self):
+        """Test that events queued after close are not yielded in burst mode."""
+        outbox = Outbox(batch_size=10)
+        await outbox.send(self._event(0))
+        await outbox.close()
+        await outbox.send(self._event(1))
+
+        events = [event async for event in outbox.event_generator()]
+
+        assert [e.id for e in events[1:]] == ["event-0"]
+
+    @pytest.mark.asyncio
+    async def test_send_latency_is_recorded(self):
+        """Test that enqueue-to-send latency statistics are collected."""
+        outbox = Outbox()
+        await outbox.send(self._event(0))
+        await asyncio.sleep(0.01)
+        await outbox.close()
+
+        async for _ in outbox.event_generator():
+            pass
+
+        stats = outbox.get_stats()
+        assert stats["sent"] == 1
+        assert stats["max_latency_ms"] >= 10
+        assert stats["avg_latency_ms"] == stats["max_latency_ms"]
@@ -230,6 +230,21 @@ class TestCalcResponseBuilder:
         assert data["entityId"] is None
         assert data["payload"] is None
 
+    def test_build_calc_failure_response(self, builder):
+        """Test that failed specs carry success=False and error details."""
+        error = {"code": "PROCESSING_TIMEOUT", "message": "late", "retryable": True}
+        spec = ResponseSpec(
+            response_type=CALC_RESP_EVENT_TYPE,
+            data={"requestId": "req-123", "entityId": "entity-456", "payload": {}},
+            success=False,
+            error=error,
+        )
+
+        data = json.loads(builder.build(spec).text_data)
+
+        assert data["success"] is False
+        assert data["error"] == error
+
 
 class TestCriteriaCalcResponseBuilder:
     """Test suite for CriteriaCalcResponseBuilder."""
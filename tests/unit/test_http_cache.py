@@ -0,0 +1,133 @@
+"""
+Unit tests for ETags and conditional GETs.
+"""
+
+import pytest
+from quart import Quart, Response
+
+from common.utils.http_cache import compute_etag, etag_headers, http_cache
+
+
+@pytest.fixture
+def app():
+    app = Quart(__name__)
+    body = {"name": "Widget", "value": 1}
+
+    @app.route("/entity", methods=["GET", "PUT"])
+    @http_cache()
+    async def entity():
+        return body, 200
+
+    @app.route("/short", methods=["GET"])
+    @http_cache("private, max-age=30")
+    async def short():
+        return {"ok": True}
+
+    @app.route("/versioned", methods=["GET"])
+    @http_cache(None)
+    async def versioned():
+        response = Response(b"{}", content_type="application/json")
+        response.set_etag("v7")
+        return response
+
+    @app.route("/page", methods=["GET"])
+    @http_cache()
+    async def page():
+        entities = {"entities": [1, 2]}
+        return (
+            {**entities, "nextCursor": app.config["cursor"]},
+            200,
+            etag_headers(entities),
+        )
+
+    @app.route("/missing", methods=["GET"])
+    @http_cache()
+    async def missing():
+        return {"error": "not found"}, 404
+
+    @app.route("/stream", methods=["GET"])
+    @http_cache()
+    async def stream():
+        async def chunks():
+            yield b"a"
+
+        return Response(chunks())
+
+    app.config["body"] = body
+    app.config["cursor"] = "c1"
+    return app
+
+
+class TestHttpCache:
+    """Test suite for the http_cache route decorator."""
+
+    @pytest.mark.asyncio
+    async def test_etag_and_not_modified(self, app):
+        """Test that a matching If-None-Match gets an empty 304."""
+        client = app.test_client()
+        first = await client.get("/entity")
+        etag = first.headers["ETag"]
+
+        assert etag == f'"{compute_etag(await first.get_data())}"'
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        cached = await client.get("/entity", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert await cached.get_data() == b""
+        assert cached.headers["ETag"] == etag
+
+        weak = await client.get("/entity", headers={"If-None-Match": f"W/{etag}"})
+        assert weak.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_changed_body_gets_new_etag(self, app):
+        """Test that a stale ETag gets the full, re-tagged response."""
+        client = app.test_client()
+        etag = (await client.get("/entity")).headers["ETag"]
+        app.config["body"]["value"] = 2
+
+        response = await client.get("/entity", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_route_policy_and_existing_etag(self, app):
+        """Test per-route Cache-Control and that a route-set ETag is kept."""
+        client = app.test_client()
+
+        short = await client.get("/short")
+        versioned = await client.get("/versioned", headers={"If-None-Match": '"v7"'})
+
+        assert short.headers["Cache-Control"] == "private, max-age=30"
+        assert versioned.status_code == 304
+        assert "Cache-Control" not in versioned.headers
+
+    @pytest.mark.asyncio
+    async def test_content_etag_is_weak(self, app):
+        """Test that bodies tagged by content only share a weak validator."""
+        client = app.test_client()
+        first = await client.get("/page")
+        etag = first.headers["ETag"]
+        app.config["cursor"] = "c2"
+
+        cached = await client.get("/page", headers={"If-None-Match": etag})
+
+        assert etag.startswith('W/"')
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_pass_through(self, app):
+        """Test that errors, other methods and streamed bodies are left alone."""
+        client = app.test_client()
+
+        missing = await client.get("/missing", headers={"If-None-Match": "*"})
+        put = await client.put("/entity")
+        stream = await client.get("/stream", headers={"If-None-Match": "*"})
+
+        assert missing.status_code == 404
+        assert "ETag" not in missing.headers
+        assert "ETag" not in put.headers
+        assert stream.status_code == 200
+        assert "ETag" not in stream.headers
@@ -0,0 +1,198 @@
+"""
+Unit tests for keyset pagination of searches.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from common.service.entity_service import SearchConditionRequest
+from common.service.pagination import (
+    InvalidCursorError,
+    PageCursor,
+    SearchSnapshot,
+    SearchSnapshotCache,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+from common.service.service import EntityServiceImpl
+
+
+class TestCursor:
+    """Test suite for cursor tokens and page selection."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it was encoded from."""
+        cursor = PageCursor("id-7", datetime(2025, 1, 2, tzinfo=timezone.utc), "abc")
+
+        token = encode_cursor(cursor)
+
+        assert "=" not in token
+        assert decode_cursor(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30"])
+    def test_malformed_cursor_is_rejected(self, token):
+        """Test that garbage tokens raise ValueError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+
+    def test_snapshot_pages_by_binary_search(self):
+        """Test that a snapshot slices the same pages as keyset_page."""
+        snapshot = SearchSnapshot(["d", "a", "c", "e", "b"], str)
+
+        assert snapshot.page(None, 2) == (["a", "b"], True)
+        assert snapshot.page("b", 2) == (["c", "d"], True)
+        assert snapshot.page("c", 2) == (["d", "e"], False)
+        assert snapshot.page("bb", None) == (["c", "d", "e"], False)
+
+    def test_snapshot_cache_expires_and_evicts(self):
+        """Test that snapshots expire after the TTL and are bounded by size."""
+        now = [0.0]
+        cache = SearchSnapshotCache(5, 10, clock=lambda: now[0])
+        cache.put("a", SearchSnapshot(["1", "2", "3"], str))
+        cache.put("b", SearchSnapshot(["4", "5"], str))
+
+        assert cache.get("a") is not None
+        cache.put("c", SearchSnapshot(["6"], str))
+        assert cache.get("b") is None  # least recently used
+        now[0] = 11
+        assert cache.get("a") is None
+        assert cache.get_stats()["entities"] == 1
+
+    def test_keyset_page_selects_after_key_in_order(self):
+        """Test that a page starts after the key and reports following items."""
+        items = ["d", "a", "c", "e", "b"]
+
+        assert keyset_page(items, str, None, 2) == (["a", "b"], True)
+        assert keyset_page(items, str, "b", 2) == (["c", "d"], True)
+        assert keyset_page(items, str, "c", 2) == (["d", "e"], False)
+        assert keyset_page(items, str, "b", None) == (["c", "d", "e"], False)
+
+
+class TestEntityServiceSearchPage:
+    """Test suite for EntityServiceImpl.search_page."""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock()
+        repository.get_meta.return_value = {"entity_model": "Order"}
+        repository.find_all_by_criteria.return_value = [
+            {"technical_id": f"id-{n}", "name": f"Order {n}"} for n in (3, 1, 4, 2, 5)
+        ]
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        service = EntityServiceImpl(repository)
+        service._history = None
+        return service
+
+    @staticmethod
+    def condition(value="A"):
+        return SearchConditionRequest.builder().equals("category", value).build()
+
+    async def walk(self, service, clear_snapshots=False):
+        ids = []
+        cursor = None
+        for _ in range(3):
+            if clear_snapshots:
+                service._snapshots.clear()
+            page = await service.search_page(
+                "Order", self.condition(), limit=2, cursor=cursor
+            )
+            ids.append([r.get_id() for r in page.entities])
+            assert page.total == 5
+            cursor = page.next_cursor
+        assert cursor is None
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_following_pages_are_sliced_from_the_snapshot(
+        self, service, repository
+    ):
+        """Test that cursors walk one unpinned read of the search in order."""
+        ids = await self.walk(service)
+
+        assert ids == [["id-1", "id-2"], ["id-3", "id-4"], ["id-5"]]
+        repository.find_all_by_criteria.assert_awaited_once()
+        assert repository.find_all_by_criteria.await_args.args[2] is None
+        assert service.get_read_stats()["search_snapshots"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_each_other_at_one_point_in_time(
+        self, service, repository
+    ):
+        """Test that without the snapshot, following pages share one pinned read."""
+        ids = await self.walk(service, clear_snapshots=True)
+
+        assert ids == [["id-1", "id-2"], ["id-3", "id-4"], ["id-5"]]
+        first, *rest = repository.find_all_by_criteria.await_args_list
+        assert first.args[2] is None
+        points_in_time = {call.args[2] for call in rest}
+        assert len(points_in_time) == 1
+        assert None not in points_in_time
+
+    @pytest.mark.asyncio
+    async def test_snapshot_pages_are_copies(self, service):
+        """Test that callers cannot change the kept snapshot through a page."""
+        page = await service.search_page("Order", self.condition(), limit=2)
+        second = await service.search_page(
+            "Order", self.condition(), limit=2, cursor=page.next_cursor
+        )
+        second.entities[0].data["name"] = "changed"
+
+        again = await service.search_page(
+            "Order", self.condition(), limit=2, cursor=page.next_cursor
+        )
+
+        assert again.entities[0].data["name"] == "Order 3"
+
+    @pytest.mark.asyncio
+    async def test_raw_page_passes_documents_through_unparsed(self, service):
+        """Test that a raw page holds the stored documents without parsing."""
+        with patch("common.service.service.parse_entity") as parse:
+            page = await service.search_page(
+                "Order", self.condition(), limit=2, raw=True
+            )
+            projected = await service.search_page(
+                "Order",
+                self.condition(),
+                limit=2,
+                cursor=page.next_cursor,
+                projection=["name"],
+                raw=True,
+            )
+
+        parse.assert_not_called()
+        assert page.entities == []
+        assert page.items == [
+            {"technical_id": "id-1", "name": "Order 1"},
+            {"technical_id": "id-2", "name": "Order 2"},
+        ]
+        assert projected.items == [
+            {"name": "Order 3", "technical_id": "id-3"},
+            {"name": "Order 4", "technical_id": "id-4"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cursor_of_another_search_is_rejected(self, service):
+        """Test that a cursor cannot be replayed against different conditions."""
+        page = await service.search_page("Order", self.condition("A"), limit=2)
+
+        with pytest.raises(ValueError, match="different search"):
+            await service.search_page(
+                "Order", self.condition("B"), limit=2, cursor=page.next_cursor
+            )
+
+    @pytest.mark.asyncio
+    async def test_search_applies_offset_before_parsing(self, service):
+        """Test that search() honours the condition's offset and limit."""
+        condition = self.condition()
+        condition.offset = 1
+        condition.limit = 2
+
+        results = await service.search("Order", condition)
+
+        assert [r.get_id() for r in results] == ["id-1", "id-4"]
@@ -0,0 +1,436 @@
+"""
+Unit tests for ProcessorManager execution.
+"""
+
+import asyncio
+import json
+from typing import ClassVar
+
+import pytest
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.processor.base import CyodaCriteriaChecker, CyodaProcessor
+from common.processor.errors import (
+    CriteriaTimeoutError,
+    ProcessorError,
+    ProcessorNotFoundError,
+    ProcessorTimeoutError,
+)
+from common.processor.manager import ProcessorManager
+from common.processor.manifest import (
+    MANIFEST_VERSION,
+    build_manifest,
+    load_manifest,
+    write_manifest,
+)
+
+
+class SleepyProcessor(CyodaProcessor):
+    """Processor that sleeps for a configurable time."""
+
+    def __init__(self, delay: float, timeout: float | None = None) -> None:
+        super().__init__(name="SleepyProcessor", timeout=timeout)
+        self.delay = delay
+        self.cancelled = False
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return entity
+
+
+class SleepyCriteria(CyodaCriteriaChecker):
+    """Criteria checker that sleeps for a configurable time."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(name="SleepyCriteria")
+        self.delay = delay
+
+    async def check(self, entity: CyodaEntity, **kwargs) -> bool:
+        await asyncio.sleep(self.delay)
+        return True
+
+
+class FailingProcessor(CyodaProcessor):
+    """Processor that always fails."""
+
+    def __init__(self) -> None:
+        super().__init__(name="FailingProcessor")
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        raise RuntimeError("boom")
+
+
+class CountedEntity(CyodaEntity):
+    """Entity with a typed field, opting in to deferred validation."""
+
+    DEFER_VALIDATION: ClassVar[bool] = True
+
+    count: int = 0
+
+
+class DeferredProcessor(CyodaProcessor):
+    """Processor opting in to deferred validation."""
+
+    defer_validation = True
+
+    def __init__(self, value: object) -> None:
+        super().__init__(name="DeferredProcessor")
+        self.value = value
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        entity.count = self.value
+        return entity
+
+
+class LazyProcessor(CyodaProcessor):
+    """Processor loaded from a manifest."""
+
+    def __init__(self) -> None:
+        super().__init__(name="LazyProcessor")
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        entity.add_metadata("lazy", True)
+        return entity
+
+
+class BatchingProcessor(CyodaProcessor):
+    """Processor recording the batches it receives."""
+
+    def __init__(self, fail: bool = False, delay: float = 0) -> None:
+        super().__init__(name="BatchingProcessor")
+        self.batches: list[int] = []
+        self.processed: list[str] = []
+        self.fail = fail
+        self.delay = delay
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        self.batches.append(1)
+        return entity
+
+    async def process_batch(self, entities, **kwargs):
+        self.batches.append(len(entities))
+        if self.fail:
+            raise RuntimeError("batch failed")
+        await asyncio.sleep(self.delay)
+        for index, entity in enumerate(entities):
+            entity.add_metadata("index", index)
+            self.processed.append(entity.entity_id)
+        return entities
+
+
+class BatchingCriteria(CyodaCriteriaChecker):
+    """Criteria checker matching entities with an even batch position."""
+
+    def __init__(self) -> None:
+        super().__init__(name="BatchingCriteria")
+
+    async def check(self, entity: CyodaEntity, **kwargs) -> bool:
+        return True
+
+    async def check_batch(self, entities, **kwargs):
+        return [index % 2 == 0 for index in range(len(entities))]
+
+
+class TestProcessorManagerExecution:
+    """Test suite for processor and criteria execution."""
+
+    @pytest.fixture
+    def entity(self):
+        """Create a sample entity."""
+        return CyodaEntity()
+
+    @pytest.mark.asyncio
+    async def test_process_entity_within_deadline(self, entity):
+        """Test that a fast processor completes normally."""
+        manager = ProcessorManager(default_timeout=1.0)
+        manager.register_processor(SleepyProcessor(delay=0))
+
+        result = await manager.process_entity("SleepyProcessor", entity)
+
+        assert result is entity
+        assert manager.get_timeout_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_process_entity_deadline_cancels_processor(self, entity):
+        """Test that a hung processor is cancelled and counted."""
+        manager = ProcessorManager()
+        processor = SleepyProcessor(delay=10)
+        manager.register_processor(processor)
+
+        with pytest.raises(ProcessorTimeoutError) as exc_info:
+            await manager.process_entity("SleepyProcessor", entity, timeout=0.01)
+
+        assert processor.cancelled is True
+        assert exc_info.value.timeout == 0.01
+        assert manager.get_timeout_stats() == {"SleepyProcessor": 1}
+
+    @pytest.mark.asyncio
+    async def test_processor_timeout_overrides_default(self, entity):
+        """Test that the processor's own timeout beats the manager default."""
+        manager = ProcessorManager(default_timeout=10)
+        manager.register_processor(SleepyProcessor(delay=10, timeout=0.01))
+
+        with pytest.raises(ProcessorTimeoutError):
+            await manager.process_entity("SleepyProcessor", entity)
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_overrides_processor(self, entity):
+        """Test that the request deadline beats the processor timeout."""
+        manager = ProcessorManager()
+        manager.register_processor(SleepyProcessor(delay=0.01, timeout=0.001))
+
+        result = await manager.process_entity("SleepyProcessor", entity, timeout=1)
+
+        assert result is entity
+
+    @pytest.mark.asyncio
+    async def test_check_criteria_deadline(self, entity):
+        """Test that criteria checks honour the manager default deadline."""
+        manager = ProcessorManager(default_timeout=0.01)
+        manager.register_criteria(SleepyCriteria(delay=10))
+
+        with pytest.raises(CriteriaTimeoutError):
+            await manager.check_criteria("SleepyCriteria", entity)
+
+        assert manager.get_timeout_stats() == {"SleepyCriteria": 1}
+
+    @pytest.mark.asyncio
+    async def test_processor_errors_are_wrapped(self, entity):
+        """Test that processor exceptions become ProcessorError."""
+        manager = ProcessorManager()
+        manager.register_processor(FailingProcessor())
+
+        with pytest.raises(ProcessorError) as exc_info:
+            await manager.process_entity("FailingProcessor", entity)
+
+        assert not isinstance(exc_info.value, ProcessorTimeoutError)
+        assert manager.get_timeout_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_processor(self, entity):
+        """Test that unknown processors raise ProcessorNotFoundError."""
+        manager = ProcessorManager()
+
+        with pytest.raises(ProcessorNotFoundError):
+            await manager.process_entity("Missing", entity)
+
+    @pytest.mark.asyncio
+    async def test_deferred_validation_runs_once_at_end(self):
+        """Test that deferred processors get their result validated."""
+        manager = ProcessorManager()
+        manager.register_processor(DeferredProcessor("3"))
+
+        result = await manager.process_entity("DeferredProcessor", CountedEntity())
+
+        assert result.count == 3
+
+    @pytest.mark.asyncio
+    async def test_deferred_validation_failure_is_processor_error(self):
+        """Test that an invalid deferred result fails the processing."""
+        manager = ProcessorManager()
+        manager.register_processor(DeferredProcessor("not a number"))
+
+        with pytest.raises(ProcessorError):
+            await manager.process_entity("DeferredProcessor", CountedEntity())
+
+
+class TestProcessorManagerBatching:
+    """Test suite for micro-batching of concurrent calls."""
+
+    def test_supports_batch(self):
+        """Test that only overriding processors are batch-capable."""
+        assert BatchingProcessor().supports_batch is True
+        assert SleepyProcessor(delay=0).supports_batch is False
+        assert BatchingCriteria().supports_batch is True
+        assert BatchingProcessor().get_info()["batch"] is True
+
+    @pytest.mark.asyncio
+    async def test_default_process_batch_processes_each_entity(self):
+        """Test the default process_batch falls back to process()."""
+        processor = LazyProcessor()
+        entities = [CyodaEntity(), CyodaEntity()]
+
+        results = await processor.process_batch(entities)
+
+        assert results == entities
+        assert all(entity.get_metadata("lazy") for entity in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_batched(self):
+        """Test that concurrent calls within the window share one batch."""
+        manager = ProcessorManager(batch_window=0.05)
+        processor = BatchingProcessor()
+        manager.register_processor(processor)
+        entities = [CyodaEntity() for _ in range(3)]
+
+        results = await asyncio.gather(
+            *(manager.process_entity("BatchingProcessor", e) for e in entities)
+        )
+
+        assert processor.batches == [3]
+        assert [r.get_metadata("index") for r in results] == [0, 1, 2]
+        assert manager.get_batch_stats()["largest_batch"] == 3
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self):
+        """Test that a full batch runs without waiting for the window."""
+        manager = ProcessorManager(batch_window=10, max_batch_size=2)
+        processor = BatchingProcessor()
+        manager.register_processor(processor)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                manager.process_entity("BatchingProcessor", CyodaEntity()),
+                manager.process_entity("BatchingProcessor", CyodaEntity()),
+            ),
+            1,
+        )
+
+        assert processor.batches == [2]
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_by_default(self):
+        """Test that calls run one by one without a batch window."""
+        manager = ProcessorManager()
+        processor = BatchingProcessor()
+        manager.register_processor(processor)
+
+        await asyncio.gather(
+            manager.process_entity("BatchingProcessor", CyodaEntity()),
+            manager.process_entity("BatchingProcessor", CyodaEntity()),
+        )
+
+        assert processor.batches == [1, 1]
+        assert manager.get_batch_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_call(self):
+        """Test that a failing batch raises ProcessorError for each entity."""
+        manager = ProcessorManager(batch_window=0.01)
+        manager.register_processor(BatchingProcessor(fail=True))
+
+        results = await asyncio.gather(
+            manager.process_entity("BatchingProcessor", CyodaEntity()),
+            manager.process_entity("BatchingProcessor", CyodaEntity()),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ProcessorError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_call_is_left_out_of_batch(self):
+        """Test that a call whose deadline passes in the window is not processed."""
+        manager = ProcessorManager(batch_window=0.05)
+        processor = BatchingProcessor()
+        manager.register_processor(processor)
+        late, live = CyodaEntity(), CyodaEntity()
+
+        results = await asyncio.gather(
+            manager.process_entity("BatchingProcessor", late, timeout=0.01),
+            manager.process_entity("BatchingProcessor", live),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], ProcessorTimeoutError)
+        assert results[1] is live
+        assert processor.batches == [1]
+        assert processor.processed == [live.entity_id]
+        assert manager.get_batch_stats()["dropped_items"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_stops_at_earliest_deadline(self):
+        """Test that a batch runs no side effects after a caller timed out."""
+        manager = ProcessorManager(batch_window=0.01)
+        processor = BatchingProcessor(delay=0.2)
+        manager.register_processor(processor)
+
+        results = await asyncio.gather(
+            manager.process_entity("BatchingProcessor", CyodaEntity(), timeout=0.05),
+            manager.process_entity("BatchingProcessor", CyodaEntity(), timeout=5),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0.3)
+
+        assert all(isinstance(r, ProcessorTimeoutError) for r in results)
+        assert processor.batches == [2]
+        assert processor.processed == []
+
+    @pytest.mark.asyncio
+    async def test_criteria_calls_are_batched(self):
+        """Test that concurrent criteria checks get their own batch result."""
+        manager = ProcessorManager(batch_window=0.01)
+        manager.register_criteria(BatchingCriteria())
+
+        results = await asyncio.gather(
+            *(manager.check_criteria("BatchingCriteria", CyodaEntity()) for _ in "ab")
+        )
+
+        assert results == [True, False]
+
+
+class TestProcessorManifest:
+    """Test suite for manifest-based lazy loading."""
+
+    def _manifest(self, processors):
+        return {"version": MANIFEST_VERSION, "processors": processors, "criteria": {}}
+
+    @pytest.mark.asyncio
+    async def test_processors_load_on_first_use(self):
+        """Test that manifest entries are imported only when used."""
+        manager = ProcessorManager(
+            manifest=self._manifest({"LazyProcessor": f"{__name__}:LazyProcessor"})
+        )
+
+        assert manager.processors == {}
+        assert manager.list_processors() == ["LazyProcessor"]
+
+        result = await manager.process_entity("LazyProcessor", CyodaEntity())
+
+        assert result.get_metadata("lazy") is True
+        assert isinstance(manager.processors["LazyProcessor"], LazyProcessor)
+        assert manager.get_import_report()["pending"]["processors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unloadable_entry_is_not_found(self):
+        """Test that stale manifest entries raise ProcessorNotFoundError."""
+        manager = ProcessorManager(
+            manifest=self._manifest({"Gone": "nonexistent.module:Gone"})
+        )
+
+        with pytest.raises(ProcessorNotFoundError):
+            await manager.process_entity("Gone", CyodaEntity())
+        assert manager.get_processor_info("Gone") is None
+
+    def test_manifest_round_trip(self, tmp_path):
+        """Test building, writing and loading a manifest."""
+        path = str(tmp_path / "manifest.json")
+
+        write_manifest(path, build_manifest(["example_application.processor"]))
+        manifest = load_manifest(path)
+
+        assert manifest["processors"]["ExampleEntityProcessor"] == (
+            "example_application.processor.example_entity_processor"
+            ":ExampleEntityProcessor"
+        )
+
+    def test_load_manifest_rejects_unknown_version(self, tmp_path):
+        """Test that manifests of another format are rejected."""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"version": 99}))
+
+        with pytest.raises(ValueError):
+            load_manifest(str(path))
+
+    def test_discovery_import_report(self):
+        """Test that discovery records per-module import times."""
+        manager = ProcessorManager(["example_application.criterion"])
+
+        report = manager.get_import_report()
+
+        assert report["mode"] == "discovery"
+        assert "example_application.criterion" in report["modules"]
+        assert report["loaded"]["criteria"] == 1
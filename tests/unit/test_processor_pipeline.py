@@ -0,0 +1,135 @@
+"""
+Unit tests for processor pipelines.
+"""
+
+from typing import ClassVar, Optional
+
+import pytest
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.processor.base import CyodaCriteriaChecker, CyodaProcessor
+from common.processor.errors import ProcessorError
+from common.processor.manager import ProcessorManager
+from common.processor.pipeline import ProcessorPipeline
+
+
+class OrderEntity(CyodaEntity):
+    """Entity touched by the pipeline stages."""
+
+    DEFER_VALIDATION: ClassVar[bool] = True
+
+    amount: Optional[int] = None
+    paid: Optional[bool] = None
+    shipped: Optional[bool] = None
+
+
+class AddTax(CyodaProcessor):
+    """Processor increasing the amount."""
+
+    defer_validation = True
+
+    def __init__(self) -> None:
+        super().__init__(name="AddTax")
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        # Invalid values are only caught once the stage is done
+        entity.amount = entity.amount + 10 if entity.amount is not None else "n/a"
+        return entity
+
+
+class IsPaid(CyodaCriteriaChecker):
+    """Criteria passing paid orders."""
+
+    def __init__(self) -> None:
+        super().__init__(name="IsPaid")
+
+    async def check(self, entity: CyodaEntity, **kwargs) -> bool:
+        return bool(entity.paid)
+
+
+class Ship(CyodaProcessor):
+    """Processor marking the order shipped."""
+
+    def __init__(self) -> None:
+        super().__init__(name="Ship")
+        self.calls = 0
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        self.calls += 1
+        if kwargs.get("fail"):
+            raise RuntimeError("carrier down")
+        entity.shipped = True
+        return entity
+
+
+class TestProcessorPipeline:
+    """Test suite for ProcessorPipeline."""
+
+    @pytest.fixture
+    def ship(self):
+        return Ship()
+
+    @pytest.fixture
+    def pipeline(self, ship):
+        return ProcessorPipeline("OrderPipeline", [AddTax(), IsPaid(), ship])
+
+    @pytest.mark.asyncio
+    async def test_runs_stages_in_order_on_one_entity(self, pipeline):
+        """Test that every stage sees the same typed entity."""
+        entity = OrderEntity(amount=100, paid=True)
+
+        result = await pipeline.process(entity)
+
+        assert result is entity
+        assert result.amount == 110
+        assert result.shipped is True
+        assert all(s["calls"] == 1 for s in pipeline.get_stage_stats().values())
+
+    @pytest.mark.asyncio
+    async def test_failed_criteria_stops_pipeline(self, pipeline, ship):
+        """Test that a criteria returning False skips the remaining stages."""
+        result = await pipeline.process(OrderEntity(amount=100, paid=False))
+
+        assert result.amount == 110
+        assert result.shipped is None
+        assert ship.calls == 0
+        assert pipeline.get_stage_stats()["IsPaid"]["stops"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deferred_stage_is_validated_before_next_stage(self, pipeline):
+        """Test that invalid values from a deferred stage fail at that stage."""
+        with pytest.raises(ProcessorError) as exc_info:
+            await pipeline.process(OrderEntity(paid=True))
+
+        assert exc_info.value.context == {"stage": "AddTax"}
+        assert pipeline.get_stage_stats()["AddTax"]["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_manager_runs_pipeline_as_one_processor(self, pipeline):
+        """Test pipeline registration, stage errors and stage info."""
+        manager = ProcessorManager()
+        manager.register_processor(pipeline)
+
+        with pytest.raises(ProcessorError) as exc_info:
+            await manager.process_entity(
+                "OrderPipeline", OrderEntity(amount=1, paid=True), fail=True
+            )
+
+        assert exc_info.value.processor_name == "OrderPipeline"
+        assert exc_info.value.context["stage"] == "Ship"
+        info = manager.get_processor_info("OrderPipeline")
+        assert [stage["name"] for stage in info["stages"]] == [
+            "AddTax",
+            "IsPaid",
+            "Ship",
+        ]
+        assert info["stages"][1]["kind"] == "criteria"
+
+    def test_invalid_stages(self):
+        """Test that empty, foreign and duplicate stages are rejected."""
+        with pytest.raises(ValueError):
+            ProcessorPipeline("Empty", [])
+        with pytest.raises(ValueError):
+            ProcessorPipeline("Foreign", [object()])
+        with pytest.raises(ValueError):
+            ProcessorPipeline("Duplicate", [IsPaid(), IsPaid()])
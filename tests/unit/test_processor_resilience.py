@@ -0,0 +1,237 @@
+"""
+Unit tests for processor circuit breakers and bulkheads.
+"""
+
+import asyncio
+
+import pytest
+
+from common.entity.cyoda_entity import CyodaEntity
+from common.processor.base import CyodaProcessor
+from common.processor.errors import ProcessorError, ProcessorUnavailableError
+from common.processor.manager import ProcessorManager
+from common.processor.resilience import (
+    Bulkhead,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyProcessor(CyodaProcessor):
+    """Processor failing while its dependency is down."""
+
+    def __init__(self) -> None:
+        super().__init__(name="FlakyProcessor")
+        self.down = True
+        self.calls = 0
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("dependency down")
+        return entity
+
+
+class GatedProcessor(CyodaProcessor):
+    """Processor blocking until released."""
+
+    max_concurrency = 1
+
+    def __init__(self) -> None:
+        super().__init__(name="GatedProcessor")
+        self.gate = asyncio.Event()
+
+    async def process(self, entity: CyodaEntity, **kwargs) -> CyodaEntity:
+        await self.gate.wait()
+        return entity
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def _breaker(self, clock, **overrides):
+        config = CircuitBreakerConfig(
+            **{"window_size": 4, "minimum_calls": 4, "open_seconds": 10, **overrides}
+        )
+        return CircuitBreaker("test", config, clock=clock)
+
+    def test_opens_on_failure_rate(self, clock):
+        """Test that the circuit opens once the failure share reaches the threshold."""
+        breaker = self._breaker(clock)
+        for failed in (False, True, False):
+            assert breaker.allow()
+            breaker.record(0.01, failed=failed)
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.allow()
+        breaker.record(0.01, failed=True)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow() is False
+        assert breaker.retry_after() == 10
+
+    def test_opens_on_slow_calls(self, clock):
+        """Test latency-based tripping."""
+        breaker = self._breaker(clock, failure_rate_threshold=0, slow_call_seconds=1.0)
+        for _ in range(4):
+            breaker.allow()
+            breaker.record(2.0, failed=False)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_probe_closes_circuit(self, clock):
+        """Test that a successful probe after the cool-down closes the circuit."""
+        breaker = self._breaker(clock)
+        for _ in range(4):
+            breaker.allow()
+            breaker.record(0.01, failed=True)
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # only one probe at a time
+
+        breaker.record(0.01, failed=False)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.get_stats()["times_opened"] == 1
+
+    def test_failed_probe_reopens_circuit(self, clock):
+        """Test that a failing probe opens the circuit for another cool-down."""
+        breaker = self._breaker(clock)
+        for _ in range(4):
+            breaker.allow()
+            breaker.record(0.01, failed=True)
+        clock.now = 10
+        breaker.allow()
+
+        breaker.record(0.01, failed=True)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 10
+
+    def test_abandoned_probe_frees_slot(self, clock):
+        """Test that a cancelled probe lets the next call probe."""
+        breaker = self._breaker(clock)
+        for _ in range(4):
+            breaker.allow()
+            breaker.record(0.01, failed=True)
+        clock.now = 10
+        breaker.allow()
+
+        breaker.abandon()
+
+        assert breaker.allow() is True
+
+
+class TestBulkhead:
+    """Test suite for Bulkhead."""
+
+    def test_rejects_over_capacity(self):
+        """Test that calls over the cap are rejected and counted."""
+        bulkhead = Bulkhead("test", 2)
+
+        assert bulkhead.try_acquire()
+        assert bulkhead.try_acquire()
+        assert bulkhead.try_acquire() is False
+        bulkhead.release()
+        assert bulkhead.try_acquire()
+
+        stats = bulkhead.get_stats()
+        assert stats["peak"] == 2
+        assert stats["rejected"] == 1
+
+
+class TestProcessorManagerResilience:
+    """Test suite for circuit breakers and bulkheads in ProcessorManager."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test that calls are rejected without running once the circuit opens."""
+        manager = ProcessorManager(
+            circuit_breaker=CircuitBreakerConfig(window_size=2, minimum_calls=2)
+        )
+        processor = FlakyProcessor()
+        manager.register_processor(processor)
+
+        for _ in range(2):
+            with pytest.raises(ProcessorError):
+                await manager.process_entity("FlakyProcessor", CyodaEntity())
+
+        with pytest.raises(ProcessorUnavailableError) as exc_info:
+            await manager.process_entity("FlakyProcessor", CyodaEntity())
+
+        assert exc_info.value.reason == "circuit_open"
+        assert exc_info.value.retry_after is not None
+        assert processor.calls == 2
+        stats = manager.get_resilience_stats()["FlakyProcessor"]
+        assert stats["circuit"]["state"] == "open"
+        assert stats["circuit"]["rejected"] == 1
+        assert stats["bulkhead"] is None
+
+    @pytest.mark.asyncio
+    async def test_reset_circuit(self):
+        """Test that a reset circuit lets calls through again."""
+        manager = ProcessorManager(
+            circuit_breaker=CircuitBreakerConfig(window_size=1, minimum_calls=1)
+        )
+        processor = FlakyProcessor()
+        manager.register_processor(processor)
+        with pytest.raises(ProcessorError):
+            await manager.process_entity("FlakyProcessor", CyodaEntity())
+        processor.down = False
+
+        assert manager.reset_circuit("FlakyProcessor") is True
+        await manager.process_entity("FlakyProcessor", CyodaEntity())
+
+        assert manager.reset_circuit("Unknown") is False
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_rejects_concurrent_calls(self):
+        """Test that the processor's max_concurrency caps in-flight calls."""
+        manager = ProcessorManager()
+        processor = GatedProcessor()
+        manager.register_processor(processor)
+
+        first = asyncio.create_task(
+            manager.process_entity("GatedProcessor", CyodaEntity())
+        )
+        await asyncio.sleep(0)
+
+        with pytest.raises(ProcessorUnavailableError) as exc_info:
+            await manager.process_entity("GatedProcessor", CyodaEntity())
+
+        processor.gate.set()
+        await first
+        assert exc_info.value.reason == "bulkhead_full"
+        stats = manager.get_resilience_stats()["GatedProcessor"]["bulkhead"]
+        assert stats == {"max_concurrent": 1, "active": 0, "peak": 1, "rejected": 1}
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Test that a plain manager has no breakers or bulkheads."""
+        manager = ProcessorManager()
+        processor = FlakyProcessor()
+        manager.register_processor(processor)
+
+        for _ in range(20):
+            with pytest.raises(ProcessorError):
+                await manager.process_entity("FlakyProcessor", CyodaEntity())
+
+        assert processor.calls == 20
+        assert manager.get_resilience_stats() == {}
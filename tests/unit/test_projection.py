@@ -0,0 +1,56 @@
+"""
+Unit tests for field projection.
+"""
+
+import pytest
+
+from common.service.projection import compile_projection, parse_fields
+
+
+class TestProjection:
+    """Test suite for projection parsing and application."""
+
+    @pytest.fixture
+    def document(self):
+        return {
+            "name": "Widget",
+            "price": 12.5,
+            "address": {"city": "Oslo", "zip": "0150"},
+            "items": [{"sku": "a", "qty": 1}, {"sku": "b", "qty": 2}],
+        }
+
+    def test_parse_fields(self):
+        """Test parsing of the comma-separated query parameter."""
+        assert parse_fields(None) is None
+        assert parse_fields(" , ") is None
+        assert parse_fields("name, $.address.city") == ["name", "$.address.city"]
+
+    def test_top_level_and_nested_paths(self, document):
+        """Test that nested paths keep their nesting and missing keys are skipped."""
+        project = compile_projection(["name", "$.address.city", "missing.key"])
+
+        assert project(document) == {"name": "Widget", "address": {"city": "Oslo"}}
+
+    def test_paths_through_lists(self, document):
+        """Test that paths through a list apply to every element."""
+        project = compile_projection(["items.sku"])
+
+        assert project(document) == {"items": [{"sku": "a"}, {"sku": "b"}]}
+
+    def test_full_selection_wins_over_nested(self, document):
+        """Test that selecting a parent keeps it whole regardless of order."""
+        for paths in (["address", "address.city"], ["address.city", "address"]):
+            assert compile_projection(paths)(document) == {
+                "address": {"city": "Oslo", "zip": "0150"}
+            }
+
+    def test_no_paths_means_no_projection(self):
+        """Test that an empty projection compiles to None."""
+        assert compile_projection(None) is None
+        assert compile_projection([]) is None
+
+    @pytest.mark.parametrize("path", ["", "$.", "a..b", ".a", "a."])
+    def test_invalid_paths(self, path):
+        """Test that malformed paths are rejected."""
+        with pytest.raises(ValueError):
+            compile_projection([path])
@@ -0,0 +1,88 @@
+"""
+Unit tests for streaming export encoders.
+"""
+
+import json
+
+import pytest
+
+from common.utils.streaming import export_chunks, ndjson_lines, prefetch
+
+
+async def pages_of(*pages):
+    for page in pages:
+        yield page
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+class TestExportChunks:
+    """Test suite for the NDJSON and JSON array encoders."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_writes_one_chunk_per_page(self):
+        """Test NDJSON output, one line per entity."""
+        chunks, content_type = export_chunks(
+            pages_of([{"id": 1}, {"id": 2}], [], [{"id": 3}]), "ndjson"
+        )
+
+        result = await collect(chunks)
+
+        assert content_type == "application/x-ndjson"
+        assert len(result) == 2
+        lines = b"".join(result).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_json_array_is_valid_json(self):
+        """Test that the chunked array concatenates to one JSON document."""
+        for pages in ([], [[{"id": 1}], [], [{"id": 2}, {"id": 3}]]):
+            chunks, content_type = export_chunks(pages_of(*pages), "json")
+
+            body = b"".join(await collect(chunks))
+
+            assert content_type == "application/json"
+            assert json.loads(body) == [e for page in pages for e in page]
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            export_chunks(pages_of(), "xml")
+
+
+class TestPrefetch:
+    """Test suite for prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_error_raises_before_streaming(self):
+        """Test that a failing first read raises from prefetch itself."""
+
+        async def failing():
+            raise ConnectionError("backend down")
+            yield  # pragma: no cover
+
+        with pytest.raises(ConnectionError):
+            await prefetch(failing())
+
+    @pytest.mark.asyncio
+    async def test_keeps_all_pages(self):
+        """Test that the prefetched page is replayed before the rest."""
+        pages = await prefetch(pages_of([1], [2], [3]))
+
+        assert await collect(pages) == [[1], [2], [3]]
+        assert await collect(await prefetch(pages_of())) == []
+
+
+class TestNdjsonLines:
+    """Test suite for the NDJSON line reader."""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        """Test that lines are reassembled across chunk boundaries."""
+        lines = await collect(
+            ndjson_lines(pages_of(b'{"a":', b"1}\n\n", b'{"b":2}\r\n{"c"', b":3}"))
+        )
+
+        assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": 2}, {"c": 3}]
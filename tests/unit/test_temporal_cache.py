@@ -0,0 +1,119 @@
+"""
+Unit tests for the point-in-time read cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.service.coalescing import read_key
+from common.service.service import EntityServiceImpl
+from common.service.temporal_cache import TemporalReadCache
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_cache(max_entities: int = 10) -> TemporalReadCache:
+    return TemporalReadCache(max_entities, 300, clock=lambda: NOW)
+
+
+class TestTemporalReadCache:
+    """Test suite for TemporalReadCache."""
+
+    def test_only_points_older_than_margin_are_historical(self):
+        """Test the safety margin, with naive values taken as UTC."""
+        cache = make_cache()
+
+        assert cache.is_historical(NOW - timedelta(minutes=10))
+        assert cache.is_historical(datetime(2025, 6, 1, 11, 0))
+        assert not cache.is_historical(NOW - timedelta(minutes=1))
+        assert not cache.is_historical(None)
+
+    def test_hits_return_copies(self):
+        """Test that callers cannot modify a cached result."""
+        cache = make_cache()
+        cache.put("key", [{"name": "a"}])
+
+        found, value = cache.get("key")
+        value[0]["name"] = "changed"
+
+        assert found
+        assert cache.get("key") == (True, [{"name": "a"}])
+        assert cache.get("other") == (False, None)
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 1
+
+    def test_empty_and_error_results_are_not_cached(self):
+        """Test that failures reported as empty results are not remembered."""
+        cache = make_cache()
+        for value in (None, [], 0, {"errorMessage": "boom"}):
+            cache.put("key", value)
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_by_entity_count(self):
+        """Test that the bound counts the entities of list results."""
+        cache = make_cache(max_entities=5)
+        cache.put("a", [{"id": 1}, {"id": 2}])
+        cache.put("b", {"id": 3})
+        cache.get("a")
+        cache.put("c", [{"id": 4}, {"id": 5}, {"id": 6}])
+        cache.put("too-big", [{"id": n} for n in range(6)])
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a")[0] and cache.get("c")[0]
+        assert cache.get_stats()["entities"] == 5
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_read_key_normalizes_time_zones(self):
+        """Test that one instant gives one key whatever its time zone."""
+        local = NOW.astimezone(timezone(timedelta(hours=2)))
+
+        assert read_key("count", "Order", "1", None, NOW) == read_key(
+            "count", "Order", "1", None, local
+        )
+
+
+class TestEntityServiceTemporalCache:
+    """Test suite for cached point-in-time reads in EntityServiceImpl."""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock()
+        repository.get_meta.return_value = {"entity_model": "Order"}
+        repository.find_by_id.return_value = {"technical_id": "id-1", "name": "A"}
+        repository.get_entity_count.return_value = 3
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        service = EntityServiceImpl(repository)
+        service._history = TemporalReadCache(100, 300)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_historical_reads_hit_repository_once(self, service, repository):
+        """Test that repeated reads of an old point in time are cached."""
+        past = datetime.now(timezone.utc) - timedelta(days=1)
+
+        first = await service.get_by_id_at_time("id-1", "Order", past)
+        second = await service.get_by_id_at_time("id-1", "Order", past)
+        counts = [await service.get_entity_count("Order", "1", past) for _ in range(2)]
+
+        assert first.get_id() == second.get_id() == "id-1"
+        assert counts == [3, 3]
+        assert repository.find_by_id.await_count == 1
+        assert repository.get_entity_count.await_count == 1
+        assert service.get_read_stats()["temporal_cache"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_reads_are_not_cached(self, service, repository):
+        """Test that points in time within the safety margin always read."""
+        recent = datetime.now(timezone.utc) - timedelta(seconds=10)
+
+        await service.get_by_id_at_time("id-1", "Order", recent)
+        await service.get_by_id_at_time("id-1", "Order", recent)
+
+        assert repository.find_by_id.await_count == 2
+        assert service.get_read_stats()["temporal_cache"]["results"] == 0
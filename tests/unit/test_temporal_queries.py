@@ -5,7 +5,7 @@ Tests the new point-in-time query, entity statistics, and change metadata
 functionality added to CrudRepository, CyodaRepository, and EntityService.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -95,6 +95,29 @@ class TestCyodaRepositoryTemporalQueries:
             call_args = mock_request.call_args
             assert "pointInTime" in str(call_args)
 
+    @pytest.mark.asyncio
+    async def test_point_in_time_is_sent_in_utc_and_url_encoded(
+        self, cyoda_repository, sample_entity_data
+    ):
+        """Test that an aware point in time is sent as an encoded UTC timestamp."""
+        with patch(
+            "common.repository.cyoda.cyoda_repository.send_cyoda_request",
+            new_callable=AsyncMock,
+        ) as mock_request:
+            mock_request.return_value = {
+                "status": 200,
+                "json": {"data": sample_entity_data, "meta": {}},
+            }
+            point_in_time = datetime(
+                2024, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2))
+            )
+
+            meta = {"entity_model": "TestEntity", "entity_version": "1"}
+            await cyoda_repository.find_by_id(meta, "test-entity-123", point_in_time)
+
+            path = mock_request.call_args.kwargs["path"]
+            assert path.endswith("?pointInTime=2024-01-01T12:00:00Z")
+
     @pytest.mark.asyncio
     async def test_find_by_id_without_point_in_time(
         self, cyoda_repository, sample_entity_data
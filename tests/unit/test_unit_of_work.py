@@ -0,0 +1,164 @@
+"""
+Unit tests for the entity service unit of work.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from common.service.entity_service import EntityService
+from common.service.service import EntityServiceError
+from common.service.unit_of_work import UnitOfWork, UnitOfWorkError
+
+
+class RecordingService:
+    """Entity service stand-in recording calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.01, fail_on: Optional[str] = None) -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: List[tuple] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _call(self, name: str, *args: Any) -> Any:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        self.calls.append((name, *args))
+        if self.fail_on is not None and self.fail_on in map(str, args):
+            raise RuntimeError(f"cannot {name}")
+        return f"{name}:{args[0]}"
+
+    async def save(
+        self, entity: Dict[str, Any], entity_class: str, entity_version: str = "1"
+    ) -> Any:
+        return await self._call("save", entity["title"], entity_class)
+
+    async def update(
+        self,
+        entity_id: str,
+        entity: Dict[str, Any],
+        entity_class: str,
+        transition: Optional[str] = None,
+        entity_version: str = "1",
+    ) -> Any:
+        return await self._call("update", entity_id, transition)
+
+    async def delete_by_id(
+        self, entity_id: str, entity_class: str, entity_version: str = "1"
+    ) -> Any:
+        return await self._call("delete_by_id", entity_id)
+
+    async def execute_transition(
+        self,
+        entity_id: str,
+        transition: str,
+        entity_class: str,
+        entity_version: str = "1",
+    ) -> Any:
+        return await self._call("execute_transition", entity_id, transition)
+
+
+class TestUnitOfWork:
+    """Test suite for UnitOfWork."""
+
+    @pytest.mark.asyncio
+    async def test_flush_runs_writes_concurrently(self):
+        """Test that queued writes overlap and results keep queue order."""
+        service = RecordingService()
+        uow = UnitOfWork(service)  # type: ignore[arg-type]
+        for title in ("a", "b", "c"):
+            uow.save({"title": title}, "Other")
+        uow.update("id-1", {}, "Other", transition="approve")
+        uow.delete("id-2", "Other")
+
+        results = await uow.flush()
+
+        assert results == [
+            "save:a",
+            "save:b",
+            "save:c",
+            "update:id-1",
+            "delete_by_id:id-2",
+        ]
+        assert service.peak == 5
+        assert len(uow) == 0
+
+    @pytest.mark.asyncio
+    async def test_transitions_are_queued(self):
+        """Test that queued transitions call execute_transition."""
+        service = RecordingService(delay=0)
+        uow = UnitOfWork(service)  # type: ignore[arg-type]
+        uow.transition("id-1", "approve", "Other")
+
+        assert await uow.flush() == ["execute_transition:id-1"]
+        assert service.calls == [("execute_transition", "id-1", "approve")]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_limits_in_flight_writes(self):
+        """Test that the concurrency limit is respected."""
+        service = RecordingService()
+        uow = UnitOfWork(service, max_concurrency=2)  # type: ignore[arg-type]
+        for title in "abcde":
+            uow.save({"title": title}, "Other")
+
+        await uow.flush()
+
+        assert service.peak == 2
+        assert len(service.calls) == 5
+
+    @pytest.mark.asyncio
+    async def test_failures_are_aggregated(self):
+        """Test that one failure does not stop the other writes."""
+        service = RecordingService(fail_on="b")
+        uow = UnitOfWork(service)  # type: ignore[arg-type]
+        for title in "abc":
+            uow.save({"title": title}, "Other")
+
+        with pytest.raises(UnitOfWorkError) as exc_info:
+            await uow.flush()
+
+        error = exc_info.value
+        assert isinstance(error, EntityServiceError)
+        assert [(index, op) for index, op, _ in error.errors] == [(1, "save(Other)")]
+        assert error.results == ["save:a", None, "save:c"]
+        assert uow.results == error.results
+
+    @pytest.mark.asyncio
+    async def test_context_manager_flushes_on_success(self):
+        """Test that leaving the block flushes the queued writes."""
+        service = RecordingService(delay=0)
+
+        async with UnitOfWork(service) as uow:  # type: ignore[arg-type]
+            uow.save({"title": "a"}, "Other")
+
+        assert uow.results == ["save:a"]
+
+    @pytest.mark.asyncio
+    async def test_context_manager_discards_on_error(self):
+        """Test that writes queued by a failing block are not flushed."""
+        service = RecordingService(delay=0)
+
+        with pytest.raises(ValueError):
+            async with UnitOfWork(service) as uow:  # type: ignore[arg-type]
+                uow.save({"title": "a"}, "Other")
+                raise ValueError("abort")
+
+        assert service.calls == []
+        assert len(uow) == 0
+
+    @pytest.mark.asyncio
+    async def test_entity_service_creates_unit_of_work(self):
+        """Test the EntityService.unit_of_work factory."""
+        service = RecordingService(delay=0)
+
+        uow = EntityService.unit_of_work(service, max_concurrency=1)  # type: ignore[arg-type]
+        uow.save({"title": "a"}, "Other")
+
+        assert isinstance(uow, UnitOfWork)
+        assert await uow.flush() == ["save:a"]